@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from vprism.core.monitoring.latency import EWMA, P2Quantile, ProviderLatencyStats
+
+
+def test_ewma_tracks_recent_samples() -> None:
+    ewma = EWMA(alpha=0.5)
+
+    assert ewma.value is None
+    assert ewma.update(100.0) == 100.0
+    assert ewma.update(200.0) == 150.0
+    assert ewma.update(200.0) == 175.0
+
+
+def test_ewma_rejects_invalid_alpha() -> None:
+    with pytest.raises(ValueError):
+        EWMA(alpha=0.0)
+
+
+def test_p2_quantile_small_sample_is_exact() -> None:
+    estimator = P2Quantile(0.5)
+    assert estimator.value is None
+
+    for sample in (5.0, 1.0, 3.0):
+        estimator.update(sample)
+
+    assert estimator.value == 3.0
+
+
+@pytest.mark.parametrize("p", [0.5, 0.95])
+def test_p2_quantile_matches_exact_quantile(p: float) -> None:
+    rng = random.Random(7)
+    samples = [rng.lognormvariate(4.0, 0.8) for _ in range(20_000)]
+    estimator = P2Quantile(p)
+    for sample in samples:
+        estimator.update(sample)
+
+    exact = sorted(samples)[int(p * (len(samples) - 1))]
+    assert estimator.value == pytest.approx(exact, rel=0.05)
+
+
+def test_provider_latency_stats_ignores_failure_latency() -> None:
+    stats = ProviderLatencyStats(alpha=0.5)
+
+    stats.record(True, 100.0, now=1.0)
+    stats.record(False, 5.0, now=2.0)
+
+    snapshot = stats.snapshot()
+    assert snapshot["ewma_latency_ms"] == 100.0
+    assert snapshot["success_rate"] == 0.5
+    assert stats.total_requests == 2
+    assert stats.successful_requests == 1
+    assert stats.last_update == 2.0
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import threading
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from vprism.core.data.storage.duckdb_factory import VPrismDuckDBFactory
+from vprism.core.models.base import DataPoint
+from vprism.core.models.corporate_actions import DividendEvent, SplitEvent, compute_corporate_action_factors
+from vprism.core.models.market import MarketType
+from vprism.core.models.query import Adjustment
+from vprism.core.services.adjustment import adjust_prices
+from vprism.core.services.corporate_actions import CorporateActionService
+
+START = date(2024, 1, 1)
+
+
+def _dividend(symbol: str, offset: int, cash: str) -> DividendEvent:
+    return DividendEvent(symbol=symbol, market=MarketType.CN, ex_date=START + timedelta(days=offset), cash_amount=Decimal(cash), currency="CNY")
+
+
+def _split(symbol: str, offset: int, numerator: int, denominator: int) -> SplitEvent:
+    return SplitEvent(symbol=symbol, market=MarketType.CN, ex_date=START + timedelta(days=offset), numerator=numerator, denominator=denominator)
+
+
+def _bars(symbol: str, count: int) -> list[DataPoint]:
+    return [
+        DataPoint(
+            symbol=symbol,
+            market=MarketType.CN,
+            timestamp=datetime.combine(START + timedelta(days=i), datetime.min.time()),
+            open_price=Decimal(20 + i),
+            close_price=Decimal(20 + i),
+            volume=Decimal(1000),
+            provider="test",
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture()
+def service():
+    factory = VPrismDuckDBFactory()
+    with factory.connection() as conn:
+        yield CorporateActionService(conn)
+
+
+def test_ingest_writes_batch_rows(service) -> None:
+    batch = service.ingest(
+        [_dividend("000001", 5, "0.3"), _dividend("000001", 5, "0.2"), _dividend("600000", 8, "1")],
+        [_split("000001", 10, 2, 1)],
+        batch_id="b1",
+    )
+
+    assert (batch.batch_id, batch.dividends, batch.splits, batch.symbols) == ("b1", 2, 1, ("000001", "600000"))
+    rows = service.conn.execute(
+        """
+        SELECT supplier_symbol, event_type, effective_date, dividend_cash, split_ratio, batch_id
+        FROM corporate_actions ORDER BY supplier_symbol, effective_date
+        """
+    ).fetchall()
+    assert rows == [
+        ("000001", "dividend:CNY", START + timedelta(days=5), 0.5, None, "b1"),
+        ("000001", "split", START + timedelta(days=10), None, 2.0, "b1"),
+        ("600000", "dividend:CNY", START + timedelta(days=8), 1.0, None, "b1"),
+    ]
+
+    service.ingest([_dividend("000001", 5, "0.4")], batch_id="b1")
+    assert service.conn.execute("SELECT count(*) FROM corporate_actions").fetchone()[0] == 1
+
+
+def test_same_day_dividends_in_several_currencies_are_kept(service) -> None:
+    usd = _dividend("000001", 5, "0.1").model_copy(update={"currency": "USD"})
+    bare = _dividend("000001", 5, "0.2").model_copy(update={"currency": None})
+    service.ingest([_dividend("000001", 5, "0.5"), usd, bare], batch_id="b1")
+
+    dividends = service.lookup(MarketType.CN, ["000001"])["000001"].dividends
+
+    assert sorted((e.currency or "", e.cash_amount) for e in dividends) == [("", Decimal("0.2")), ("CNY", Decimal("0.5")), ("USD", Decimal("0.1"))]
+
+
+def test_lookup_range_and_latest_batch_wins(service) -> None:
+    service.ingest([_dividend("000001", 5, "0.5"), _dividend("000001", 40, "0.5")], [_split("000001", 20, 3, 2)], batch_id="b1")
+    service.ingest([_dividend("000001", 5, "0.7")], batch_id="b2")
+
+    found = service.lookup(MarketType.CN, ["000001", "000002"], start=START, end=START + timedelta(days=30))
+
+    assert [(e.ex_date, e.cash_amount, e.currency) for e in found["000001"].dividends] == [(START + timedelta(days=5), Decimal("0.7"), "CNY")]
+    assert [(e.numerator, e.denominator) for e in found["000001"].splits] == [(3, 2)]
+    assert found["000002"].dividends == () and found["000002"].splits == ()
+
+
+def test_foreign_payload_falls_back_to_columns(service) -> None:
+    service.conn.execute(
+        "INSERT INTO corporate_actions VALUES ('cn', '000001', 'split', DATE '2024-02-01', NULL, 1.5, '{\"raw\": 1}', 'x', 'ext', now()::TIMESTAMP)"
+    )
+
+    service.conn.execute(
+        "INSERT INTO corporate_actions VALUES ('cn', '000001', 'dividend:HKD', DATE '2024-02-02', 0.25, NULL, NULL, 'x', 'ext', now()::TIMESTAMP)"
+    )
+
+    action_set = service.events("000001", MarketType.CN)
+
+    (split,) = action_set.splits
+    (dividend,) = action_set.dividends
+    assert (split.ex_date, split.numerator, split.denominator) == (date(2024, 2, 1), 3, 2)
+    assert (dividend.cash_amount, dividend.currency) == (Decimal("0.25"), "HKD")
+
+
+def test_events_cached_and_invalidated_by_ingest(service) -> None:
+    service.ingest([_dividend("000001", 5, "0.5")], batch_id="b1")
+
+    service.events("000001", MarketType.CN)
+    narrowed = service.events("000001", MarketType.CN, start=START + timedelta(days=6))
+    assert narrowed.dividends == ()
+    assert service.get_stats() == {"cached_symbols": 1, "cache_hits": 1, "cache_misses": 1}
+
+    service.ingest([_dividend("000001", 9, "0.5")], batch_id="b2")
+    assert len(service.events("000001", MarketType.CN).dividends) == 2
+    assert service.get_stats()["cache_misses"] == 2
+
+
+def test_load_racing_an_ingest_is_not_cached(service) -> None:
+    service.ingest([_dividend("000001", 5, "0.5")], batch_id="b1")
+    real_lookup = service.lookup
+
+    def racing_lookup(*args, **kwargs):
+        stale = real_lookup(*args, **kwargs)
+        service.lookup = real_lookup
+        service.ingest([_dividend("000001", 9, "0.5")], batch_id="b2")
+        return stale
+
+    service.lookup = racing_lookup
+    assert len(service.events("000001", MarketType.CN).dividends) == 1
+
+    assert len(service.events("000001", MarketType.CN).dividends) == 2
+
+
+def test_cache_is_bounded(service) -> None:
+    service.cache_size = 2
+    for symbol in ("a", "b", "c"):
+        service.events(symbol, MarketType.CN)
+
+    assert service.get_stats()["cached_symbols"] == 2
+
+
+def test_adjust_uses_full_history_factors(service) -> None:
+    dividends, splits = [_dividend("000001", 3, "1")], [_split("000001", 6, 2, 1)]
+    service.ingest(dividends, splits)
+    history = _bars("000001", 10)
+    assert service.needs_factors("000001", MarketType.CN, START + timedelta(days=9))
+    service.build_factors("000001", MarketType.CN, history)
+    window = history[4:8] + _bars("600000", 3)
+
+    adjusted = service.adjust(window, Adjustment.BACKWARD)
+
+    factors = compute_corporate_action_factors("000001", MarketType.CN, history, dividends, splits).factors
+    expected = adjust_prices(history, Adjustment.BACKWARD, factors)[4:8]
+    assert [float(p.close_price) for p in adjusted[:4]] == pytest.approx([float(p.close_price) for p in expected])
+    assert adjusted[0].close_price != window[0].close_price
+    assert adjusted[4:] == window[4:]
+    assert service.adjust(window, Adjustment.NONE) == window
+
+
+def test_ingest_makes_factors_stale(service) -> None:
+    service.ingest([_dividend("000001", 3, "1")])
+    service.build_factors("000001", MarketType.CN, _bars("000001", 10))
+    through = START + timedelta(days=9)
+
+    assert not service.needs_factors("000001", MarketType.CN, through)
+    assert service.needs_factors("000001", MarketType.CN, through + timedelta(days=1))
+    service.ingest(splits=[_split("000001", 6, 2, 1)])
+    assert service.needs_factors("000001", MarketType.CN, through)
+
+
+def test_factor_staleness_survives_restart(service) -> None:
+    service.ingest([_dividend("000001", 3, "1")])
+    service.build_factors("000001", MarketType.CN, _bars("000001", 10))
+    through = START + timedelta(days=9)
+
+    restarted = CorporateActionService(service.conn)
+    assert not restarted.needs_factors("000001", MarketType.CN, through)
+    restarted.ingest([_dividend("000001", 3, "1")])
+    assert not restarted.needs_factors("000001", MarketType.CN, through)
+    restarted.ingest([_dividend("000001", 3, "1.5")])
+    assert restarted.needs_factors("000001", MarketType.CN, through)
+
+
+def test_concurrent_ingest_and_builds_share_the_connection(service) -> None:
+    history = _bars("000001", 10)
+    errors: list[BaseException] = []
+
+    def work(thread: int) -> None:
+        try:
+            for i in range(30):
+                service.ingest([_dividend(f"{thread:03d}{i:03d}", i % 10, "0.1")])
+                service.events(f"{thread:03d}{i:03d}", MarketType.CN)
+                service.build_factors("000001", MarketType.CN, history)
+        except BaseException as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=work, args=(thread,), daemon=True) for thread in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=60)
+
+    assert not any(thread.is_alive() for thread in threads), "concurrent ingest deadlocked"
+    assert errors == []
+    assert service.conn.execute("SELECT count(*) FROM corporate_actions").fetchone()[0] == 120
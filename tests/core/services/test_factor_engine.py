@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import random
+import time
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd  # type: ignore[import-untyped]
+import pytest
+
+from vprism.core.models.base import DataPoint
+from vprism.core.models.corporate_actions import DividendEvent, SplitEvent, compute_corporate_action_factors
+from vprism.core.models.market import MarketType
+from vprism.core.services.factors import FACTOR_RTOL, compute_factor_frame, event_frames
+
+START = date(2020, 1, 1)
+
+
+def _random_history(seed: int, symbol: str) -> tuple[list[DataPoint], list[DividendEvent], list[SplitEvent]]:
+    rng = random.Random(seed)
+    days = sorted(rng.sample(range(600), 300))
+    prices = [
+        DataPoint(
+            symbol=symbol,
+            market=MarketType.CN,
+            timestamp=datetime.combine(START + timedelta(days=day), datetime.min.time()),
+            close_price=None if rng.random() < 0.05 else Decimal(str(round(rng.uniform(1, 50), 2))),
+            provider="test",
+        )
+        for day in days
+    ]
+    # Ex-dates fall on and off trading days; some dividends exceed the previous close.
+    dividends = [
+        DividendEvent(
+            symbol=symbol,
+            market=MarketType.CN,
+            ex_date=START + timedelta(days=rng.randrange(600)),
+            cash_amount=Decimal(str(round(rng.uniform(0.01, 60 if rng.random() < 0.1 else 2), 2))),
+        )
+        for _ in range(rng.randrange(1, 12))
+    ]
+    splits = [
+        SplitEvent(
+            symbol=symbol,
+            market=MarketType.CN,
+            ex_date=START + timedelta(days=rng.randrange(600)),
+            numerator=rng.randint(1, 10),
+            denominator=rng.randint(1, 10),
+        )
+        for _ in range(rng.randrange(0, 4))
+    ]
+    return prices, dividends, splits
+
+
+def _bars(prices: list[DataPoint]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "symbol": [p.symbol for p in prices],
+            "date": [p.timestamp for p in prices],
+            "close": [float(p.close_price) if p.close_price is not None else np.nan for p in prices],
+        }
+    )
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_matches_decimal_reference(seed: int) -> None:
+    prices, dividends, splits = _random_history(seed, "000001")
+    reference = compute_corporate_action_factors("000001", MarketType.CN, prices, dividends, splits)
+
+    shuffled = list(prices)
+    random.Random(seed).shuffle(shuffled)
+    result = compute_factor_frame(_bars(shuffled), *event_frames(dividends, splits))
+
+    assert [d.date() for d in result.factors["date"]] == [f.date for f in reference.factors]
+    np.testing.assert_allclose(result.factors["backward_factor"], [float(f.backward_factor) for f in reference.factors], rtol=FACTOR_RTOL)
+    np.testing.assert_allclose(result.factors["forward_factor"], [float(f.forward_factor) for f in reference.factors], rtol=FACTOR_RTOL)
+    assert tuple(d.date() for d in result.gaps["date"]) == reference.gap_dates
+
+
+def test_symbols_are_independent() -> None:
+    histories = {symbol: _random_history(seed, symbol) for seed, symbol in enumerate(("000001", "000002", "600000"))}
+    prices = [p for history in histories.values() for p in history[0]]
+    dividends = [e for history in histories.values() for e in history[1]]
+    splits = [e for history in histories.values() for e in history[2]]
+
+    result = compute_factor_frame(_bars(prices), *event_frames(dividends, splits))
+
+    for symbol, (own_prices, own_dividends, own_splits) in histories.items():
+        reference = compute_corporate_action_factors(symbol, MarketType.CN, own_prices, own_dividends, own_splits)
+        rows = result.factors[result.factors["symbol"] == symbol]
+        np.testing.assert_allclose(rows["forward_factor"], [float(f.forward_factor) for f in reference.factors], rtol=FACTOR_RTOL)
+        gaps = result.gaps[result.gaps["symbol"] == symbol]
+        assert tuple(d.date() for d in gaps["date"]) == reference.gap_dates
+
+
+def test_events_for_unknown_symbols_are_gaps() -> None:
+    bars = pd.DataFrame({"symbol": ["A", "A"], "date": pd.to_datetime(["2024-01-01", "2024-01-02"]), "close": [10.0, 10.0]})
+    dividends = pd.DataFrame({"symbol": ["B"], "ex_date": pd.to_datetime(["2024-01-02"]), "cash_amount": [1.0]})
+
+    result = compute_factor_frame(bars, dividends)
+
+    assert result.factors["backward_factor"].tolist() == [1.0, 1.0]
+    assert result.gaps.to_dict("records") == [{"symbol": "B", "date": pd.Timestamp("2024-01-02")}]
+
+
+@pytest.mark.perf
+def test_market_batch_throughput() -> None:
+    symbols, days = 500, 4_900
+    rng = np.random.default_rng(11)
+    dates = pd.bdate_range("2005-01-03", periods=days)
+    names = np.array([f"{i:06d}" for i in range(symbols)], dtype=object)
+    bars = pd.DataFrame(
+        {
+            "symbol": names[np.repeat(np.arange(symbols), days)],
+            "date": np.tile(dates.values, symbols),
+            "close": rng.uniform(5, 50, symbols * days),
+        }
+    )
+    events = symbols * 40
+    dividends = pd.DataFrame(
+        {
+            "symbol": names[rng.integers(0, symbols, events)],
+            "ex_date": dates.values[rng.integers(1, days, events)],
+            "cash_amount": rng.uniform(0.01, 1.0, events),
+        }
+    ).drop_duplicates(["symbol", "ex_date"])
+
+    start = time.perf_counter()
+    result = compute_factor_frame(bars, dividends)
+    elapsed = time.perf_counter() - start
+
+    print(f"{len(bars):,} bars, {len(dividends):,} dividends in {elapsed:.2f}s")
+    assert len(result.factors) == len(bars)
+    assert elapsed < 10
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from vprism.core.data.storage.duckdb_factory import VPrismDuckDBFactory
+from vprism.core.models.base import DataPoint
+from vprism.core.models.corporate_actions import DividendEvent, SplitEvent, compute_corporate_action_factors
+from vprism.core.models.market import MarketType
+from vprism.core.models.query import Adjustment
+from vprism.core.services.adjustment import adjust_frame, adjust_prices
+from vprism.core.services.factor_store import AdjustmentFactorStore
+
+START = date(2024, 1, 1)
+
+
+def _bars(count: int) -> list[DataPoint]:
+    return [
+        DataPoint(
+            symbol="000001",
+            market=MarketType.CN,
+            timestamp=datetime.combine(START + timedelta(days=i), datetime.min.time()),
+            close_price=Decimal(10 + i % 5),
+            volume=Decimal(1000),
+            provider="test",
+        )
+        for i in range(count)
+    ]
+
+
+def _dividend(offset: int, cash: str) -> DividendEvent:
+    return DividendEvent(symbol="000001", market=MarketType.CN, ex_date=START + timedelta(days=offset), cash_amount=Decimal(cash))
+
+
+def _split(offset: int, numerator: int, denominator: int) -> SplitEvent:
+    return SplitEvent(symbol="000001", market=MarketType.CN, ex_date=START + timedelta(days=offset), numerator=numerator, denominator=denominator)
+
+
+def _stored(store: AdjustmentFactorStore) -> list[tuple[date, float, float]]:
+    frame = store.load(MarketType.CN, ["000001"])
+    return [(d.date(), q, h) for d, q, h in zip(frame["date"], frame["forward_factor"], frame["backward_factor"], strict=True)]
+
+
+def _expected(prices, dividends, splits) -> list[tuple[date, float, float]]:
+    factors = compute_corporate_action_factors("000001", MarketType.CN, prices, dividends, splits).factors
+    return [(f.date, float(f.forward_factor), float(f.backward_factor)) for f in factors]
+
+
+def _assert_matches(actual, expected) -> None:
+    assert [row[0] for row in actual] == [row[0] for row in expected]
+    for (_, q, h), (_, eq, eh) in zip(actual, expected, strict=True):
+        assert q == pytest.approx(eq, rel=1e-12)
+        assert h == pytest.approx(eh, rel=1e-12)
+
+
+@pytest.fixture()
+def store():
+    factory = VPrismDuckDBFactory()
+    with factory.connection() as conn:
+        yield AdjustmentFactorStore(conn)
+
+
+def test_full_build_matches_reference(store) -> None:
+    prices, dividends, splits = _bars(30), [_dividend(5, "0.5"), _dividend(20, "0.3")], [_split(12, 2, 1)]
+
+    build = store.build("000001", MarketType.CN, prices, dividends, splits)
+
+    assert build.rebuilt_from == START
+    assert build.rows_written == 30
+    _assert_matches(_stored(store), _expected(prices, dividends, splits))
+
+
+def test_unchanged_events_skip_rebuild(store) -> None:
+    prices, dividends = _bars(30), [_dividend(5, "0.5")]
+    first = store.build("000001", MarketType.CN, prices, dividends, [])
+
+    again = store.build("000001", MarketType.CN, list(reversed(prices)), dividends, [])
+
+    assert again.skipped
+    assert again.rows_written == 0
+    assert again.source_events_hash == first.source_events_hash
+
+
+def test_new_event_rebuilds_from_its_date(store) -> None:
+    prices, dividends = _bars(40), [_dividend(5, "0.5")]
+    store.build("000001", MarketType.CN, prices, dividends, [])
+
+    dividends = [*dividends, _dividend(25, "0.4")]
+    build = store.build("000001", MarketType.CN, prices, dividends, [_split(30, 3, 2)])
+
+    assert build.rebuilt_from == START + timedelta(days=25)
+    assert build.rows_written == 15
+    _assert_matches(_stored(store), _expected(prices, dividends, [_split(30, 3, 2)]))
+
+
+def test_appended_bars_extend_series(store) -> None:
+    dividends = [_dividend(5, "0.5"), _dividend(35, "0.2")]
+    store.build("000001", MarketType.CN, _bars(30), dividends, [])
+
+    build = store.build("000001", MarketType.CN, _bars(40), dividends, [])
+
+    assert build.rebuilt_from == START + timedelta(days=30)
+    assert build.rows_written == 10
+    _assert_matches(_stored(store), _expected(_bars(40), dividends, []))
+
+
+def test_revised_previous_close_rebuilds_dividend(store) -> None:
+    prices, dividends = _bars(10), [_dividend(5, "1")]
+    prices[4] = prices[4].model_copy(update={"close_price": Decimal(10)})
+    store.build("000001", MarketType.CN, prices, dividends, [])
+
+    prices[4] = prices[4].model_copy(update={"close_price": Decimal(20)})
+    build = store.build("000001", MarketType.CN, prices, dividends, [])
+
+    assert build.rebuilt_from == START + timedelta(days=5)
+    assert _stored(store)[-1][2] == pytest.approx(1 / 0.95)
+    _assert_matches(_stored(store), _expected(prices, dividends, []))
+
+
+def test_missing_event_dates_reported(store) -> None:
+    build = store.build("000001", MarketType.CN, _bars(10), [_dividend(50, "0.5")], [])
+
+    assert build.gap_dates == (START + timedelta(days=50),)
+
+
+def test_versions_are_isolated(store) -> None:
+    store.build("000001", MarketType.CN, _bars(10), [_dividend(5, "0.5")], [])
+    other = AdjustmentFactorStore(store.conn, version="2")
+
+    assert other.load(MarketType.CN).empty
+    assert not other.build("000001", MarketType.CN, _bars(10), [_dividend(5, "0.5")], []).skipped
+
+
+def test_stored_factors_feed_adjustment(store) -> None:
+    prices, dividends = _bars(10), [_dividend(5, "1")]
+    store.build("000001", MarketType.CN, prices, dividends, [])
+
+    adjusted = adjust_prices(prices, Adjustment.BACKWARD, store.factors("000001", MarketType.CN))
+    frame = adjust_frame(
+        store.conn.execute("SELECT '000001' AS symbol, TIMESTAMP '2024-01-07' AS ts, 11.0 AS close").df(),
+        store.load(MarketType.CN),
+        Adjustment.BACKWARD,
+    )
+
+    hfq = Decimal(1) / (Decimal(1) - Decimal(1) / Decimal(14))
+    assert adjusted[4].close_price == prices[4].close_price
+    assert float(adjusted[6].close_price) == pytest.approx(float(prices[6].close_price * hfq))
+    assert frame["close"].iloc[0] == pytest.approx(float(11 * hfq))
@@ -66,3 +66,39 @@ def test_normalize_batch_updates_metrics_and_cache() -> None:
     assert metrics_after_second["cache_hits"] == 2
     assert metrics_after_second["cache_misses"] == 2
     assert metrics_after_second["unresolved_count"] == 1
+
+
+class _BulkCollector:
+    def __init__(self) -> None:
+        self.flushes: list[dict[str, int]] = []
+
+    def record_symbol_normalizations(self, counts: dict[str, int]) -> None:
+        self.flushes.append(counts)
+
+
+class _PerEventCollector:
+    def __init__(self) -> None:
+        self.events: list[str] = []
+
+    def record_symbol_normalization(self, status: str) -> None:
+        self.events.append(status)
+
+
+def test_normalize_batch_flushes_metrics_once() -> None:
+    collector = _BulkCollector()
+    service = SymbolService(metrics_collector=collector)
+
+    service.normalize_batch(["000001.SZ", "000001.SZ", "@@INVALID@@"], MarketType.CN, AssetType.STOCK)
+
+    assert collector.flushes == [{"total": 3, "cache_miss": 2, "cache_hit": 1, "resolved": 2, "unresolved": 1}]
+
+
+def test_per_event_collector_receives_aggregated_counts() -> None:
+    collector = _PerEventCollector()
+    service = SymbolService(metrics_collector=collector)
+
+    service.normalize_batch(["000001.SZ", "000001.SZ"], MarketType.CN, AssetType.STOCK)
+    with pytest.raises(UnresolvedSymbolError):
+        service.normalize("@@INVALID@@", MarketType.CN, AssetType.STOCK)
+
+    assert sorted(collector.events) == sorted(["total", "cache_miss", "resolved", "total", "cache_hit", "resolved", "total", "cache_miss", "unresolved"])
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import duckdb
+import pytest
+
+from vprism.core.models.market import AssetType, MarketType
+from vprism.core.services.symbols import SymbolService, _StripedLRU
+
+UNIVERSE = [f"{code:06d}.SZ" for code in range(2_000)]
+
+
+def _hammer(service: SymbolService, threads: int, calls: int) -> list[set[str]]:
+    barrier = threading.Barrier(threads)
+
+    def work(offset: int) -> set[str]:
+        barrier.wait()
+        seen = set()
+        for index in range(calls):
+            raw_symbol = UNIVERSE[(offset * 7919 + index) % len(UNIVERSE)]
+            seen.add(service.normalize(raw_symbol, MarketType.CN, AssetType.STOCK).canonical)
+        return seen
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        return list(pool.map(work, range(threads)))
+
+
+def test_concurrent_normalization_keeps_cache_and_metrics_consistent() -> None:
+    service = SymbolService(cache_size=1_024)
+
+    results = _hammer(service, threads=8, calls=3_000)
+
+    assert set().union(*results) == {f"CN:STOCK:SZ{code:06d}" for code in range(2_000)}
+    metrics = service.get_metrics()
+    assert metrics["total_requests"] == 24_000
+    assert metrics["cache_hits"] + metrics["cache_misses"] == 24_000
+    assert metrics["rule_usage"] == {"cn_stock_yfinance": metrics["cache_misses"]}
+    assert len(service._cache) <= 1_024
+
+
+def test_concurrent_normalization_with_persistence() -> None:
+    conn = duckdb.connect(":memory:")
+    service = SymbolService(cache_size=256, persistence_conn=conn, lookup_through=True)
+
+    results: list[set[str]] = []
+    # Run from a daemon thread so a deadlock fails the test instead of hanging it.
+    runner = threading.Thread(target=lambda: results.extend(_hammer(service, threads=8, calls=50)), daemon=True)
+    runner.start()
+    runner.join(timeout=60)
+
+    assert not runner.is_alive(), "persisting normalizations deadlocked"
+
+    assert set().union(*results) <= {f"CN:STOCK:SZ{code:06d}" for code in range(2_000)}
+    stored = conn.execute("SELECT count(*), count(DISTINCT raw_symbol) FROM symbol_map").fetchone()
+    assert stored[0] == stored[1] == len(set().union(*results))
+    conn.close()
+
+
+def test_striped_cache_evicts_within_capacity() -> None:
+    cache = _StripedLRU(4_096)
+    service = SymbolService(cache_size=0)
+    canonical = service.normalize("000001.SZ", MarketType.CN, AssetType.STOCK)
+
+    for code in range(10_000):
+        cache.set((f"{code:06d}", MarketType.CN, AssetType.STOCK), canonical)
+
+    assert len(cache) == 4_096
+    assert ("009999", MarketType.CN, AssetType.STOCK) in cache
+    assert cache.get(("000000", MarketType.CN, AssetType.STOCK)) is None
+
+
+def test_striped_cache_fills_to_capacity_despite_uneven_stripes() -> None:
+    cache = _StripedLRU(8_000)
+    service = SymbolService(cache_size=0)
+    canonical = service.normalize("000001.SZ", MarketType.CN, AssetType.STOCK)
+
+    for code in range(8_000):
+        cache.set((f"{code:06d}", MarketType.CN, AssetType.STOCK), canonical)
+    stripe_sizes = {len(entries) for _, entries in cache._stripes}
+
+    assert len(stripe_sizes) > 1
+    assert len(cache) == 8_000
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_small_cache_keeps_exact_lru_order() -> None:
+    service = SymbolService(cache_size=2)
+    for raw_symbol in ["000001.SZ", "000002.SZ", "000001.SZ", "000003.SZ"]:
+        service.normalize(raw_symbol, MarketType.CN, AssetType.STOCK)
+
+    assert ("000001.SZ", MarketType.CN, AssetType.STOCK) in service._cache
+    assert ("000002.SZ", MarketType.CN, AssetType.STOCK) not in service._cache
+
+
+@pytest.mark.perf
+def test_multithreaded_throughput() -> None:
+    calls = 20_000
+    single = SymbolService()
+    _hammer(single, threads=1, calls=len(UNIVERSE))
+    start = time.perf_counter()
+    _hammer(single, threads=1, calls=calls)
+    single_rate = calls / (time.perf_counter() - start)
+
+    shared = SymbolService()
+    _hammer(shared, threads=1, calls=len(UNIVERSE))
+    start = time.perf_counter()
+    _hammer(shared, threads=8, calls=calls)
+    threaded_rate = 8 * calls / (time.perf_counter() - start)
+
+    print(f"single-thread {single_rate:,.0f}/s, 8 threads {threaded_rate:,.0f}/s")
+    assert shared.get_metrics()["total_requests"] == len(UNIVERSE) + 8 * calls
+    assert threaded_rate > 0.5 * single_rate
@@ -66,3 +66,96 @@ def test_persistence_allows_null_provider_hint(duckdb_conn) -> None:
     (_, raw_symbol, _, _, provider_hint, _, _) = rows[0]
     assert raw_symbol == "000001.SZ"
     assert provider_hint is None
+
+
+class _CountingConnection:
+    def __init__(self, conn) -> None:
+        self._conn = conn
+        self.inserts = 0
+
+    def __getattr__(self, name: str):
+        return getattr(self._conn, name)
+
+    def execute(self, query: str, *args):
+        if "INSERT" in query:
+            self.inserts += 1
+        return self._conn.execute(query, *args)
+
+
+def test_batch_persists_new_mappings_with_one_insert(duckdb_conn) -> None:
+    conn = _CountingConnection(duckdb_conn)
+    service = SymbolService(persistence_conn=conn)
+    raw_symbols = [f"{code:06d}.SZ" for code in range(500)]
+
+    result = service.normalize_batch([*raw_symbols, "000001.SZ", "@@INVALID@@"], MarketType.CN, AssetType.STOCK, provider_hint="yfinance")
+
+    assert len(result.successes) == 501
+    assert conn.inserts == 1
+    rows = _fetch_symbol_map_rows(duckdb_conn)
+    assert len(rows) == 500
+    assert {row[4] for row in rows} == {"yfinance"}
+
+    service.normalize_batch(raw_symbols, MarketType.CN, AssetType.STOCK)
+    assert conn.inserts == 1
+
+
+def test_batch_keeps_first_hint_for_repeated_symbol(duckdb_conn) -> None:
+    service = SymbolService(cache_size=0, persistence_conn=duckdb_conn)
+
+    service.normalize_batch(["600000.SS", " 600000.SS"], MarketType.CN, AssetType.STOCK, provider_hint={"600000.SS": "yfinance", " 600000.SS": "akshare"})
+
+    rows = _fetch_symbol_map_rows(duckdb_conn)
+    assert [(row[1], row[4]) for row in rows] == [("600000.SS", "yfinance")]
+
+
+def test_warm_start_preloads_recent_mappings(duckdb_conn) -> None:
+    writer = SymbolService(persistence_conn=duckdb_conn)
+    for raw_symbol in ["000001.SZ", "600000.SS", "000002.SZ"]:
+        writer.normalize(raw_symbol, MarketType.CN, AssetType.STOCK)
+
+    service = SymbolService(cache_size=2, persistence_conn=duckdb_conn, warm_start=True)
+    result = service.normalize("600000.SS", MarketType.CN, AssetType.STOCK)
+
+    metrics = service.get_metrics()
+    assert metrics["preloaded"] == 2
+    assert metrics["cache_hits"] == 1
+    assert metrics["rule_usage"] == {}
+    assert result.canonical == "CN:STOCK:SH600000"
+    with pytest.raises(KeyError):
+        service._cache[("000001.SZ", MarketType.CN, AssetType.STOCK)]
+
+
+def test_warm_start_counts_resident_mappings(duckdb_conn) -> None:
+    SymbolService(persistence_conn=duckdb_conn).normalize_batch([f"{code:06d}.SZ" for code in range(3_000)], MarketType.CN, AssetType.STOCK)
+
+    service = SymbolService(cache_size=3_000, persistence_conn=duckdb_conn, warm_start=True)
+
+    assert service.get_metrics()["preloaded"] == len(service._cache) == 3_000
+
+
+def test_lookup_through_consults_store_before_rules(duckdb_conn) -> None:
+    SymbolService(persistence_conn=duckdb_conn).normalize_batch(["600000.SS", "000001.SZ"], MarketType.CN, AssetType.STOCK)
+    service = SymbolService(persistence_conn=duckdb_conn, lookup_through=True)
+
+    batch = service.normalize_batch(["600000.SS", " 000001.SZ", "000002.SZ"], MarketType.CN, AssetType.STOCK)
+    single = service.normalize("600000.SS", MarketType.CN, AssetType.STOCK)
+
+    assert [symbol.canonical for symbol in batch.successes] == ["CN:STOCK:SH600000", "CN:STOCK:SZ000001", "CN:STOCK:SZ000002"]
+    assert single is batch.successes[0]
+    metrics = service.get_metrics()
+    assert metrics["store_hits"] == 2
+    assert metrics["rule_usage"] == {"cn_stock_yfinance": 1}
+    assert len(_fetch_symbol_map_rows(duckdb_conn)) == 3
+
+
+def test_stored_mappings_for_unknown_rules_are_ignored(duckdb_conn) -> None:
+    SymbolService(persistence_conn=duckdb_conn).normalize("600000.SS", MarketType.CN, AssetType.STOCK)
+    duckdb_conn.execute("UPDATE symbol_map SET rule_id = 'retired_rule'")
+
+    service = SymbolService(persistence_conn=duckdb_conn, warm_start=True, lookup_through=True)
+    service.normalize("600000.SS", MarketType.CN, AssetType.STOCK)
+
+    metrics = service.get_metrics()
+    assert metrics["preloaded"] == 0
+    assert metrics["store_hits"] == 0
+    assert metrics["rule_usage"] == {"cn_stock_yfinance": 1}
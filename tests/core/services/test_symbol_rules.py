@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import re
+
 import pytest
 
 from vprism.core.exceptions.base import UnresolvedSymbolError
 from vprism.core.models.market import AssetType, MarketType
-from vprism.core.services.symbols import SymbolService
+from vprism.core.models.symbols import SymbolRule
+from vprism.core.services.symbols import SymbolService, default_rules
 
 
 @pytest.mark.parametrize(
@@ -41,3 +44,61 @@ def test_default_rules_raise_for_unknown_pattern() -> None:
 
     with pytest.raises(UnresolvedSymbolError):
         service.normalize("??symbol??", MarketType.CN, AssetType.STOCK)
+
+
+def _linear_resolve(raw_symbol: str, market: MarketType, asset_type: AssetType) -> str | None:
+    for rule in default_rules():
+        if rule.applies_to(market, asset_type) and rule.pattern.match(raw_symbol):
+            return rule.id
+    return None
+
+
+def _rule(rule_id: str, priority: int, pattern: re.Pattern[str], **scope: frozenset) -> SymbolRule:
+    return SymbolRule(id=rule_id, priority=priority, pattern=pattern, transform=lambda raw, match: rule_id.upper(), **scope)
+
+
+def test_dispatch_matches_linear_rule_scan() -> None:
+    service = SymbolService(cache_size=0)
+    universe = ["600000.SS", "600000.sh", "sz000002", "SH600000", "000001", "110022.OF", "of110022", "aapl", "BRK", "00700.HK", "12345", "", "TOOLONGSYMBOL"]
+
+    for market in MarketType:
+        for asset_type in AssetType:
+            for raw_symbol in universe:
+                expected = _linear_resolve(raw_symbol, market, asset_type)
+                try:
+                    rule_id = service.normalize(raw_symbol, market, asset_type).rule_id
+                except UnresolvedSymbolError:
+                    rule_id = None
+                assert rule_id == expected, (raw_symbol, market, asset_type)
+
+
+def test_dispatch_picks_highest_priority_with_mixed_flags() -> None:
+    service = SymbolService(
+        rules=[
+            _rule("broad", 50, re.compile(r"^(?P<token>\w+)$")),
+            _rule("upper_only", 10, re.compile(r"^(?P<token>[A-Z]+)$")),
+            _rule("any_case", 20, re.compile(r"^(?P<token>[a-z]+)\.x$", re.IGNORECASE)),
+        ]
+    )
+
+    assert service.normalize("ABC", MarketType.US, AssetType.STOCK).rule_id == "upper_only"
+    assert service.normalize("abc", MarketType.US, AssetType.STOCK).rule_id == "broad"
+    assert service.normalize("AbC.X", MarketType.US, AssetType.STOCK).rule_id == "any_case"
+
+
+def test_dispatch_respects_scope_and_unfusible_patterns() -> None:
+    service = SymbolService(
+        rules=[
+            _rule("cn_only", 1, re.compile(r"^\d+$"), market_scope=frozenset({MarketType.CN})),
+            _rule("doubled", 5, re.compile(r"^(?P<half>\d+)-(?P=half)$")),
+            _rule("digits", 10, re.compile(r"^\d+(-\d+)?$")),
+        ]
+    )
+
+    assert service.normalize("42", MarketType.CN, AssetType.STOCK).rule_id == "cn_only"
+    assert service.normalize("42", MarketType.US, AssetType.STOCK).rule_id == "digits"
+    assert service.normalize("42-42", MarketType.US, AssetType.STOCK).rule_id == "doubled"
+    assert service.normalize("42-43", MarketType.US, AssetType.STOCK).rule_id == "digits"
+    with pytest.raises(UnresolvedSymbolError) as exc_info:
+        service.normalize("x", MarketType.US, AssetType.STOCK)
+    assert list(exc_info.value.details["rules_evaluated"]) == ["cn_only", "doubled", "digits"]
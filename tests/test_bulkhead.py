@@ -0,0 +1,117 @@
+"""Test bulkhead concurrency limits."""
+
+import asyncio
+
+import pytest
+
+from vprism.core.exceptions import RateLimitError
+from vprism.core.patterns import Bulkhead, BulkheadConfig, BulkheadRegistry
+
+
+class TestBulkhead:
+    """Test Bulkhead functionality."""
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrency(self) -> None:
+        """Test that at most max_concurrent calls run at once."""
+        bulkhead = Bulkhead(BulkheadConfig(max_concurrent=2, max_queue=10, max_wait=1.0, name="test"))
+        running = 0
+        peak = 0
+
+        async def work() -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        await asyncio.gather(*(bulkhead.call(work) for _ in range(8)))
+
+        assert peak == 2
+        stats = bulkhead.get_stats()
+        assert stats["accepted"] == 8
+        assert stats["active"] == 0
+        assert stats["queue_depth"] == 0
+        assert stats["max_queue_depth"] == 6
+
+    @pytest.mark.asyncio
+    async def test_queue_full_rejects_fast(self) -> None:
+        """Test that callers beyond the queue bound are rejected immediately."""
+        bulkhead = Bulkhead(BulkheadConfig(max_concurrent=1, max_queue=1, max_wait=1.0, name="test"))
+        release = asyncio.Event()
+
+        async def hold() -> None:
+            await release.wait()
+
+        holder = asyncio.create_task(bulkhead.call(hold))
+        queued = asyncio.create_task(bulkhead.call(hold))
+        await asyncio.sleep(0)
+
+        with pytest.raises(RateLimitError) as exc_info:
+            await bulkhead.acquire()
+        assert exc_info.value.details["reason"] == "queue_full"
+
+        release.set()
+        await asyncio.gather(holder, queued)
+        assert bulkhead.get_stats()["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_queue_wait_timeout(self) -> None:
+        """Test that waiting longer than max_wait is rejected and the slot is not leaked."""
+        bulkhead = Bulkhead(BulkheadConfig(max_concurrent=1, max_queue=5, max_wait=0.02, name="test"))
+        await bulkhead.acquire()
+
+        with pytest.raises(RateLimitError) as exc_info:
+            await bulkhead.acquire()
+        assert exc_info.value.details["reason"] == "queue_timeout"
+        assert bulkhead.queue_depth == 0
+
+        bulkhead.release()
+        await bulkhead.acquire()
+        bulkhead.release()
+        stats = bulkhead.get_stats()
+        assert stats["timed_out"] == 1
+        assert stats["active"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self) -> None:
+        """Test that a waiter cancelled in the queue leaves the bulkhead consistent."""
+        bulkhead = Bulkhead(BulkheadConfig(max_concurrent=1, max_queue=5, max_wait=1.0, name="test"))
+        await bulkhead.acquire()
+        waiter = asyncio.create_task(bulkhead.acquire())
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        bulkhead.release()
+        assert bulkhead.active == 0
+        assert bulkhead.queue_depth == 0
+
+    @pytest.mark.asyncio
+    async def test_hand_back_frees_slot_for_nested_calls(self) -> None:
+        """Test that a block can hand its slot to nested calls and still exit cleanly."""
+        bulkhead = Bulkhead(BulkheadConfig(max_concurrent=1, max_queue=5, max_wait=0.05, name="test"))
+
+        async def nested() -> None:
+            await asyncio.sleep(0)
+
+        async with bulkhead:
+            assert bulkhead.hand_back()
+            assert not bulkhead.hand_back()
+            await asyncio.gather(bulkhead.call(nested), bulkhead.call(nested))
+            assert bulkhead.active == 0
+
+        assert bulkhead.active == 0
+        assert not bulkhead.hand_back()
+        assert bulkhead.get_stats()["accepted"] == 3
+
+    def test_registry(self) -> None:
+        """Test named bulkhead registry."""
+        registry = BulkheadRegistry()
+        first = registry.get_or_create("akshare", BulkheadConfig(max_concurrent=3, name="akshare"))
+
+        assert registry.get_or_create("akshare") is first
+        assert registry.get_bulkhead("missing") is None
+        assert registry.get_all_stats()["akshare"]["max_concurrent"] == 3
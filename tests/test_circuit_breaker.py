@@ -130,6 +130,106 @@ class TestCircuitBreaker:
         assert state["last_failure_time"] is None
 
 
+class TestSlidingWindowCircuitBreaker:
+    """Test failure-rate and slow-call-rate tripping."""
+
+    @staticmethod
+    async def _fail() -> None:
+        raise ProviderError("test failure", "test_provider")
+
+    @staticmethod
+    async def _ok() -> str:
+        return "ok"
+
+    @pytest.mark.asyncio
+    async def test_intermittent_failures_trip_on_rate(self) -> None:
+        breaker = CircuitBreaker(CircuitBreakerConfig(failure_threshold=5, minimum_calls=10, failure_rate_threshold=0.4, name="flaky"))
+
+        # 40% failures, never two in a row
+        for i in range(10):
+            if breaker.state == CircuitState.OPEN:
+                break
+            with contextlib.suppress(ProviderError):
+                await breaker.call(self._fail if i % 5 in (1, 3) else self._ok)
+
+        assert breaker.state == CircuitState.OPEN
+        assert "failure rate" in breaker.get_state()["last_trip_reason"]
+
+    @pytest.mark.asyncio
+    async def test_rate_thresholds_are_opt_in(self) -> None:
+        breaker = CircuitBreaker(CircuitBreakerConfig(failure_threshold=5, minimum_calls=10, name="default"))
+
+        for i in range(20):
+            with contextlib.suppress(ProviderError):
+                await breaker.call(self._fail if i % 2 else self._ok)
+
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.get_state()["failure_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_minimum_calls_guard(self) -> None:
+        breaker = CircuitBreaker(CircuitBreakerConfig(failure_threshold=5, minimum_calls=10, failure_rate_threshold=0.5, name="guarded"))
+
+        for func in (self._fail, self._ok, self._fail, self._ok):
+            with contextlib.suppress(ProviderError):
+                await breaker.call(func)
+
+        state = breaker.get_state()
+        assert breaker.state == CircuitState.CLOSED
+        assert state["window_calls"] == 4
+        assert state["failure_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_slow_calls_trip(self) -> None:
+        breaker = CircuitBreaker(
+            CircuitBreakerConfig(minimum_calls=3, slow_call_duration=0.01, slow_call_rate_threshold=0.6, failure_rate_threshold=None, name="slow")
+        )
+
+        async def slow() -> str:
+            await asyncio.sleep(0.02)
+            return "ok"
+
+        for _ in range(3):
+            assert await breaker.call(slow) == "ok"
+
+        assert breaker.state == CircuitState.OPEN
+        state = breaker.get_state()
+        assert "slow-call rate" in state["last_trip_reason"]
+        assert state["metrics"]["closed"]["slow"] == 3
+        assert state["transitions"] == {"closed->open": 1}
+
+    @pytest.mark.asyncio
+    async def test_window_expires_old_calls(self) -> None:
+        breaker = CircuitBreaker(CircuitBreakerConfig(failure_threshold=10, minimum_calls=4, failure_rate_threshold=0.5, window_duration=0.05, name="aging"))
+
+        for func in (self._fail, self._ok, self._fail):
+            with contextlib.suppress(ProviderError):
+                await breaker.call(func)
+        await asyncio.sleep(0.1)
+        # without expiry this would be 2 failures out of 4 calls
+        await breaker.call(self._ok)
+
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.get_state()["window_calls"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rejections_and_recovery_metrics(self) -> None:
+        breaker = CircuitBreaker(CircuitBreakerConfig(failure_threshold=1, recovery_timeout=0.05, half_open_max_calls=1, name="metrics"))
+
+        with contextlib.suppress(ProviderError):
+            await breaker.call(self._fail)
+        with pytest.raises(ProviderError):
+            await breaker.call(self._ok)
+        await asyncio.sleep(0.1)
+        await breaker.call(self._ok)
+
+        state = breaker.get_state()
+        assert state["state"] == "closed"
+        assert state["metrics"]["open"]["rejected"] == 1
+        assert state["metrics"]["half_open"]["successful"] == 1
+        assert state["transitions"] == {"closed->open": 1, "open->half_open": 1, "half_open->closed": 1}
+
+
 class TestCircuitBreakerRegistry:
     """Test circuit breaker registry."""
 
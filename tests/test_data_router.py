@@ -162,6 +162,7 @@ class TestDataRouter:
 
         assert router.provider_scores["tushare"] < 1.0
         assert router.provider_scores["tushare"] >= 0.1
+        mock_registry.record_call.assert_called_once_with("tushare", False)
 
     def test_update_provider_score_bounds(self, mock_registry: Mock) -> None:
         """Test score clamping to [0.1, 2.0]."""
@@ -177,6 +178,79 @@ class TestDataRouter:
         router.update_provider_score("tushare", success=False, latency_ms=0)
         assert router.provider_scores["tushare"] >= 0.1
 
+    def test_update_provider_score_tracks_latency(self, mock_registry: Mock) -> None:
+        """Test that scores and latency estimators follow recent latency."""
+        router = DataRouter(mock_registry)
+
+        for _ in range(20):
+            router.update_provider_score("tushare", success=True, latency_ms=50)
+            router.update_provider_score("yahoo", success=True, latency_ms=3000)
+
+        assert router.get_provider_score("tushare") > 1.5
+        assert router.get_provider_score("yahoo") < 1.0
+        stats = router.get_provider_stats("yahoo")
+        assert stats is not None
+        assert stats["p95_latency_ms"] == pytest.approx(3000)
+        assert stats["ewma_latency_ms"] == pytest.approx(3000)
+
+    @pytest.mark.asyncio
+    async def test_route_avoids_currently_slow_provider(self, mock_registry: Mock, sample_providers: list[MockProvider]) -> None:
+        """Test that a provider that became slow loses traffic."""
+        mock_registry.find_capable_providers.return_value = sample_providers[:2]
+        router = DataRouter(mock_registry)
+        query = DataQuery(asset=AssetType.STOCK, market=MarketType.CN, symbols=["000001"])
+
+        for _ in range(5):
+            router.update_provider_score("tushare", success=True, latency_ms=100)
+            router.update_provider_score("yahoo", success=True, latency_ms=100)
+        assert (await router.route_query(query)).name == "tushare"
+
+        for _ in range(10):
+            router.update_provider_score("tushare", success=True, latency_ms=8000)
+
+        assert (await router.route_query(query)).name == "yahoo"
+
+    def test_score_recovers_over_time(self, mock_registry: Mock) -> None:
+        """Test time-based recovery of a penalised provider towards neutral."""
+        clock = [0.0]
+        router = DataRouter(mock_registry, time_source=lambda: clock[0])
+
+        for _ in range(10):
+            router.update_provider_score("tushare", success=False, latency_ms=0)
+        penalised = router.get_provider_score("tushare")
+        assert penalised < 0.5
+
+        clock[0] = 300.0
+        recovering = router.get_provider_score("tushare")
+        assert penalised < recovering < 1.0
+
+        clock[0] = 3600.0
+        assert router.get_provider_score("tushare") == pytest.approx(1.0, abs=1e-3)
+
+    def test_static_score_cached_until_capability_changes(self, mock_registry: Mock, sample_providers: list[MockProvider]) -> None:
+        """Test that the capability part of the score is computed once per provider and query shape."""
+        from vprism.core.data.providers.base import ProviderCapability
+
+        router = DataRouter(mock_registry)
+        yahoo = sample_providers[1]
+        query = DataQuery(asset=AssetType.STOCK, market=MarketType.US, symbols=["AAPL"])
+
+        first = router._calculate_provider_score(yahoo, query)
+        assert len(router._static_scores) == 1
+        assert router._calculate_provider_score(yahoo, query.model_copy(update={"symbols": ["MSFT"]})) == first
+        assert len(router._static_scores) == 1
+
+        yahoo._capability = ProviderCapability(
+            supported_assets={"stock"},
+            supported_markets={"us"},
+            supported_timeframes={"1d"},
+            max_symbols_per_request=200,
+            supports_real_time=False,
+            supports_historical=False,
+            data_delay_seconds=15,
+        )
+        assert router._calculate_provider_score(yahoo, query) < first
+
     @pytest.mark.asyncio
     async def test_complex_query_routing(self, mock_registry: Mock, sample_providers: list[MockProvider]) -> None:
         """Test routing for a complex multi-symbol minute-level query."""
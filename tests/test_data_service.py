@@ -1,12 +1,17 @@
 """Test core data service and dual API design."""
 
+import asyncio
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from vprism.core.config import ProviderConfig
+from vprism.core.data.providers.base import AuthConfig, AuthType, DataProvider, ProviderCapability, RateLimitConfig
+from vprism.core.data.repositories.data import DataRepository
 from vprism.core.data.routing import DataRouter
+from vprism.core.exceptions import DeadlineExceededError, ProviderError
 from vprism.core.models import (
     AssetType,
     DataPoint,
@@ -17,16 +22,66 @@ from vprism.core.models import (
     ResponseMetadata,
     TimeFrame,
 )
+from vprism.core.patterns import Bulkhead, BulkheadConfig, CircuitBreakerConfig, CircuitBreakerRegistry, HedgedExecutor
 from vprism.core.services.data import DataService
 
 
+class _ChunkedProvider(DataProvider):
+    """Provider returning one bar per chunk, split into ten-day windows."""
+
+    def __init__(self):
+        super().__init__(
+            "chunked",
+            AuthConfig(auth_type=AuthType.NONE, credentials={}),
+            RateLimitConfig(requests_per_minute=60, requests_per_hour=1000, requests_per_day=10000, concurrent_requests=1),
+        )
+        self.calls = 0
+
+    def _discover_capability(self) -> ProviderCapability:
+        return ProviderCapability(
+            supported_assets={"stock"},
+            supported_markets={"cn"},
+            supported_timeframes={"1d"},
+            max_symbols_per_request=10,
+            supports_real_time=False,
+            supports_historical=True,
+            data_delay_seconds=0,
+        )
+
+    def chunk_span(self, query):
+        return timedelta(days=10)
+
+    async def authenticate(self) -> bool:
+        return True
+
+    async def get_data(self, query):
+        self.calls += 1
+        point = DataPoint(
+            symbol=query.symbols[0],
+            market=MarketType.CN,
+            timestamp=datetime.combine(query.start_date, datetime.min.time()),
+            close_price=Decimal("10.0"),
+            provider=self.name,
+        )
+        return DataResponse(
+            data=[point],
+            metadata=ResponseMetadata(total_records=1, query_time_ms=0.0, data_source=self.name),
+            source=ProviderInfo(name=self.name),
+        )
+
+
 class TestDataService:
     """Test data service."""
 
     @pytest.fixture
     def mock_router(self):
         """Create mock router."""
-        router = AsyncMock(spec=DataRouter)
+        router = MagicMock(spec=DataRouter)
+
+        async def _candidates(query):
+            return [await router.route_query(query)]
+
+        router.route_candidates.side_effect = _candidates
         return router
 
     @pytest.fixture
@@ -41,10 +96,10 @@ class TestDataService:
     @pytest.fixture
     def mock_repository(self):
         """Create mock repository."""
-        repo = AsyncMock()
+        repo = MagicMock(spec=DataRepository)
         repo.save_batch = AsyncMock()
         repo.find_by_query = AsyncMock(return_value=[])
-        repo.health_check = AsyncMock(return_value=True)
+        repo.health_check.return_value = True
         return repo
 
     @pytest.fixture
@@ -54,6 +109,7 @@ class TestDataService:
             router=mock_router,
             cache=mock_cache,
             repository=mock_repository,
+            breakers=CircuitBreakerRegistry(),
         )
 
     @pytest.fixture
@@ -91,6 +147,29 @@ class TestDataService:
         assert result.data[0].symbol == "000001"
         mock_router.route_query.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_provider_outcome_is_recorded(self, service, mock_router, sample_data):
+        """Test that provider latency and outcome feed the router scores."""
+        mock_provider = AsyncMock()
+        mock_provider.name = "test"
+        mock_provider.get_data.return_value = DataResponse(
+            data=sample_data,
+            metadata=ResponseMetadata(total_records=len(sample_data), query_time_ms=1.0, data_source="test"),
+            source=ProviderInfo(name="test", endpoint="test"),
+        )
+        mock_router.route_query.return_value = mock_provider
+
+        await service.get("000001", start="2024-01-01")
+
+        name, success, latency_ms = mock_router.update_provider_score.call_args[0]
+        assert (name, success) == ("test", True)
+        assert latency_ms >= 0
+
+        mock_provider.get_data.side_effect = Exception("boom")
+        with pytest.raises(Exception, match="boom"):
+            await service.get("000001", start="2024-02-01")
+        assert mock_router.update_provider_score.call_args[0][:2] == ("test", False)
+
     @pytest.mark.asyncio
     async def test_simple_api_get_multiple_symbols(self, service, mock_router, sample_data):
         """Test simple API: get multiple stock data."""
@@ -225,14 +304,14 @@ class TestDataService:
     @pytest.mark.asyncio
     async def test_cache_miss_and_store(self, service, mock_cache, mock_repository, sample_data):
         """Test cache miss and store."""
-        mock_router = AsyncMock()
+        mock_router = MagicMock(spec=DataRouter)
         mock_provider = AsyncMock()
         mock_provider.get_data.return_value = DataResponse(
             data=sample_data,
             metadata=ResponseMetadata(total_records=len(sample_data), query_time_ms=100.0, data_source="test"),
             source=ProviderInfo(name="test", endpoint="test"),
         )
-        mock_router.route_query.return_value = mock_provider
+        mock_router.route_candidates.return_value = [mock_provider]
         service.router = mock_router
 
         result = await service.get("000001", start="2024-01-01")
@@ -241,6 +320,59 @@ class TestDataService:
         mock_cache.set_data.assert_called_once()
         mock_repository.save_batch.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_stream_writes_each_chunk(self, service, mock_router, mock_cache, mock_repository):
+        """Test streaming: chunks are cached and persisted as they arrive."""
+        provider = _ChunkedProvider()
+        mock_router.route_query.return_value = provider
+
+        query = DataQuery(
+            asset=AssetType.STOCK,
+            market=MarketType.CN,
+            symbols=["000001", "000002"],
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 25),
+        )
+        chunks = [chunk async for chunk in service.stream(query)]
+
+        # 2 symbols x 3 ten-day windows
+        assert len(chunks) == 6
+        assert [c.query.symbols[0] for c in chunks] == ["000001"] * 3 + ["000002"] * 3
+        assert [c.query.start_date for c in chunks[:3]] == [date(2024, 1, 1), date(2024, 1, 11), date(2024, 1, 21)]
+        assert mock_cache.set_data.call_count == 6
+        assert mock_repository.save_batch.call_count == 6
+
+    @pytest.mark.asyncio
+    async def test_client_stream_persists_chunks(self, service, mock_router, mock_cache, mock_repository):
+        """Test that VPrismClient.stream goes through the data service's cache and storage."""
+        from vprism.core.client.client import VPrismClient
+
+        mock_router.route_query.return_value = _ChunkedProvider()
+        client = VPrismClient()
+        client._data_service = service
+
+        query = DataQuery(asset=AssetType.STOCK, market=MarketType.CN, symbols=["000001"], start_date=date(2024, 1, 1), end_date=date(2024, 1, 15))
+        chunks = [chunk async for chunk in client.stream(query)]
+
+        assert len(chunks) == 2
+        assert mock_cache.set_data.call_count == 2
+        assert mock_repository.save_batch.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_serves_cached_chunks(self, service, mock_router, mock_cache, sample_data):
+        """Test streaming: cached chunks skip the provider."""
+        provider = _ChunkedProvider()
+        mock_router.route_query.return_value = provider
+        mock_cache.get_data.return_value = sample_data
+
+        query = DataQuery(asset=AssetType.STOCK, market=MarketType.CN, symbols=["000001"], start_date=date(2024, 1, 1), end_date=date(2024, 1, 5))
+        chunks = [chunk async for chunk in service.stream(query)]
+
+        assert len(chunks) == 1
+        assert chunks[0].data == sample_data
+        assert provider.calls == 0
+        mock_cache.set_data.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_database_fallback_on_error(self, service, mock_router, mock_repository, sample_data):
         """Test database fallback on error."""
@@ -252,6 +384,138 @@ class TestDataService:
         assert len(result.data) == 1
         assert result.metadata.data_source == "repository"
 
+    def _provider(self, name, sample_data=None, error=None, delay=0.0):
+        provider = AsyncMock()
+        provider.name = name
+
+        async def _get_data(query):
+            await asyncio.sleep(delay)
+            if error is not None:
+                raise error
+            return DataResponse(
+                data=sample_data or [],
+                metadata=ResponseMetadata(total_records=len(sample_data or []), query_time_ms=0.0, data_source=name),
+                source=ProviderInfo(name=name, endpoint=name),
+            )
+
+        provider.get_data.side_effect = _get_data
+        return provider
+
+    @pytest.mark.asyncio
+    async def test_failover_to_next_candidate(self, service, mock_router, mock_repository, sample_data):
+        """Test that a failing provider hands over to the next ranked candidate."""
+        down = self._provider("down", error=ProviderError("outage", "down"))
+        backup = self._provider("backup", sample_data)
+        mock_router.route_candidates.side_effect = None
+        mock_router.route_candidates.return_value = [down, backup]
+
+        result = await service.get("000001", start="2024-01-01")
+
+        assert result.source.name == "backup"
+        mock_repository.find_by_query.assert_not_called()
+        outcomes = [c.args[:2] for c in mock_router.update_provider_score.call_args_list]
+        assert outcomes == [("down", False), ("backup", True)]
+
+    @pytest.mark.asyncio
+    async def test_failover_skips_open_breaker(self, service, mock_router, sample_data):
+        """Test that once a provider's breaker opens it is skipped without being called."""
+        down = self._provider("down", error=ProviderError("outage", "down"))
+        backup = self._provider("backup", sample_data)
+        mock_router.route_candidates.side_effect = None
+        mock_router.route_candidates.return_value = [down, backup]
+        service.breakers = CircuitBreakerRegistry()
+        await service.breakers.get_or_create("provider:down", CircuitBreakerConfig(name="provider:down", failure_threshold=2))
+
+        for day in range(1, 5):
+            await service.get("000001", start=f"2024-01-0{day}")
+
+        assert down.get_data.call_count == 2
+        assert backup.get_data.call_count == 4
+        assert service.breakers.get_breaker("provider:down").get_state()["state"] == "open"
+
+    @pytest.mark.asyncio
+    async def test_provider_breaker_opens_on_slow_call_rate(self, mock_router, mock_cache, mock_repository, sample_data):
+        """Test that provider breakers get the configured slow-call threshold."""
+        config = ProviderConfig(breaker_minimum_calls=3, breaker_slow_call_duration=0.01, breaker_slow_call_rate=0.6)
+        service = DataService(router=mock_router, cache=mock_cache, repository=mock_repository, breakers=CircuitBreakerRegistry(), provider_config=config)
+        sluggish = self._provider("sluggish", sample_data, delay=0.02)
+        mock_router.route_candidates.side_effect = None
+        mock_router.route_candidates.return_value = [sluggish]
+
+        for day in range(1, 4):
+            await service.get("000001", start=f"2024-01-0{day}")
+
+        state = service.breakers.get_breaker("provider:sluggish").get_state()
+        assert state["state"] == "open"
+        assert "slow-call rate" in state["last_trip_reason"]
+
+    @pytest.mark.asyncio
+    async def test_failover_reroutes_on_full_bulkhead(self, service, mock_router, sample_data):
+        """Test that a saturated provider bulkhead reroutes without tripping its breaker."""
+        busy = self._provider("busy", sample_data)
+        busy.bulkhead = Bulkhead(BulkheadConfig(max_concurrent=1, max_queue=0, name="busy"))
+        await busy.bulkhead.acquire()
+        backup = self._provider("backup", sample_data)
+        mock_router.route_candidates.side_effect = None
+        mock_router.route_candidates.return_value = [busy, backup]
+
+        result = await service.get("000001", start="2024-01-01")
+
+        assert result.source.name == "backup"
+        busy.get_data.assert_not_called()
+        assert busy.bulkhead.get_stats()["rejected"] == 1
+        assert service.breakers.get_breaker("provider:busy").failure_count == 0
+
+    @pytest.mark.asyncio
+    async def test_hedged_query_fails_over_past_fast_failure(self, service, mock_router, sample_data):
+        """Test that a hedged query still fails over and consults breakers when the primary fails fast."""
+        down = self._provider("down", error=ProviderError("outage", "down"))
+        backup = self._provider("backup", sample_data)
+        mock_router.route_candidates.side_effect = None
+        mock_router.route_candidates.return_value = [down, backup]
+        mock_router.hedge_delay.return_value = 1.0
+        service.hedger = HedgedExecutor()
+
+        result = await service.get("000001", start="2024-01-01")
+
+        assert result.source.name == "backup"
+        assert service.hedger.hedges_sent == 0
+        assert service.breakers.get_breaker("provider:down").failure_count == 1
+
+    @pytest.mark.asyncio
+    async def test_hedged_pair_failure_moves_to_next_candidate(self, service, mock_router, sample_data):
+        """Test that when a slow primary and its hedge both fail, failover continues past the pair."""
+        slow = self._provider("slow", error=ProviderError("outage", "slow"), delay=0.05)
+        flaky = self._provider("flaky", error=ProviderError("outage", "flaky"))
+        spare = self._provider("spare", sample_data)
+        mock_router.route_candidates.side_effect = None
+        mock_router.route_candidates.return_value = [slow, flaky, spare]
+        mock_router.hedge_delay.return_value = 0.01
+        service.hedger = HedgedExecutor()
+
+        result = await service.get("000001", start="2024-01-01")
+
+        assert result.source.name == "spare"
+        assert service.hedger.hedges_sent == 1
+        assert flaky.get_data.call_count == 1
+        outcomes = [c.args[:2] for c in mock_router.update_provider_score.call_args_list]
+        assert outcomes == [("flaky", False), ("slow", False), ("spare", True)]
+
+    @pytest.mark.asyncio
+    async def test_failover_respects_total_deadline(self, service, mock_router):
+        """Test that slow candidates share one total deadline."""
+        slow = self._provider("slow", delay=5.0)
+        never = self._provider("never")
+        mock_router.route_candidates.side_effect = None
+        mock_router.route_candidates.return_value = [slow, never]
+        service.failover_timeout = 0.05
+
+        with pytest.raises(DeadlineExceededError) as exc_info:
+            await service.get("000001", start="2024-01-01")
+
+        assert list(exc_info.value.details["errors"]) == ["slow"]
+        never.get_data.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_latest_data(self, service, mock_router):
         """Test getting latest data."""
@@ -336,8 +600,8 @@ class TestDataService:
     @pytest.mark.asyncio
     async def test_health_check(self, service, mock_cache, mock_repository):
         """Test health check."""
-        mock_router = AsyncMock()
-        mock_router.health_check.return_value = True
+        mock_router = MagicMock(spec=DataRouter)
+        mock_router.health_check = AsyncMock(return_value=True)
         service.router = mock_router
 
         health = await service.health_check()
@@ -353,9 +617,9 @@ class TestQueryBuilder:
     @pytest.fixture
     def service(self):
         """Create test service instance."""
-        router = AsyncMock()
+        router = MagicMock(spec=DataRouter)
         cache = AsyncMock()
-        repository = AsyncMock()
+        repository = MagicMock(spec=DataRepository)
 
         return DataService(router=router, cache=cache, repository=repository)
 
@@ -0,0 +1,176 @@
+"""Test request deadline propagation and cooperative cancellation."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from vprism.core.client.client import VPrismClient
+from vprism.core.exceptions import DeadlineExceededError, ProviderError, RateLimitError
+from vprism.core.patterns import Bulkhead, BulkheadConfig, ExponentialBackoffRetry, ResilientExecutor, RetryConfig
+from vprism.core.patterns.deadline import budget, current_deadline, deadline_scope, remaining_time, with_deadline
+from vprism.web.utils import cancel_on_disconnect
+
+
+class TestDeadlineScope:
+    """Test deadline scoping."""
+
+    def test_no_deadline_by_default(self) -> None:
+        assert current_deadline() is None
+        assert remaining_time() is None
+        assert budget(3.0) == 3.0
+
+    def test_inner_scope_only_tightens(self) -> None:
+        with deadline_scope(1.0) as outer:
+            with deadline_scope(10.0) as inner:
+                assert inner is outer
+            with deadline_scope(0.1) as tighter:
+                assert tighter is not outer
+                assert current_deadline() is tighter
+                assert budget(5.0) <= 0.1
+            assert current_deadline() is outer
+        assert current_deadline() is None
+
+    @pytest.mark.asyncio
+    async def test_deadline_propagates_to_tasks(self) -> None:
+        async def child() -> float | None:
+            return remaining_time()
+
+        with deadline_scope(1.0):
+            left = await asyncio.create_task(child())
+
+        assert left is not None
+        assert 0 < left <= 1.0
+
+    @pytest.mark.asyncio
+    async def test_with_deadline_raises_and_cancels(self) -> None:
+        cancelled = asyncio.Event()
+
+        async def slow() -> None:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with deadline_scope(0.02), pytest.raises(DeadlineExceededError):
+            await with_deadline(slow())
+
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_with_deadline_own_timeout_is_plain_timeout(self) -> None:
+        with deadline_scope(5.0), pytest.raises(TimeoutError) as exc_info:
+            await with_deadline(asyncio.sleep(1), timeout=0.01)
+
+        assert not isinstance(exc_info.value, DeadlineExceededError)
+
+
+class TestDeadlineBudgeting:
+    """Test that retries and queue waits respect the remaining time."""
+
+    @pytest.mark.asyncio
+    async def test_retry_stops_when_backoff_exceeds_deadline(self) -> None:
+        retry = ExponentialBackoffRetry(RetryConfig(max_attempts=5, base_delay=1.0, jitter=False))
+        func = AsyncMock(side_effect=ProviderError("down", "test"))
+
+        start = time.monotonic()
+        with deadline_scope(0.5), pytest.raises(ProviderError):
+            await retry.execute(func)
+
+        assert func.call_count == 1
+        assert time.monotonic() - start < 0.5
+
+    @pytest.mark.asyncio
+    async def test_resilient_executor_checks_deadline(self) -> None:
+        executor = ResilientExecutor("deadline_test", "deadline_test")
+        func = AsyncMock(return_value="ok")
+
+        with deadline_scope(0.0), pytest.raises(DeadlineExceededError):
+            await executor.execute(func)
+
+        func.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_bulkhead_wait_capped_by_deadline(self) -> None:
+        bulkhead = Bulkhead(BulkheadConfig(max_concurrent=1, max_queue=5, max_wait=5.0, name="test"))
+        await bulkhead.acquire()
+
+        start = time.monotonic()
+        with deadline_scope(0.02), pytest.raises(RateLimitError):
+            await bulkhead.acquire()
+
+        assert time.monotonic() - start < 1.0
+
+
+class TestEntryPoints:
+    """Test deadlines and cancellation at the entry points."""
+
+    @pytest.mark.asyncio
+    async def test_client_applies_provider_timeout(self) -> None:
+        client = VPrismClient({"providers": {"timeout": 1}})
+        provider = MagicMock()
+        provider.name = "slow"
+        provider.bulkhead = Bulkhead(BulkheadConfig(name="slow"))
+
+        async def slow_get_data(query):
+            await asyncio.sleep(5)
+
+        provider.get_data = slow_get_data
+        query = client.query().asset("stock").market("cn").symbols(["000001"]).build()
+
+        with patch.object(client.router, "route_query", AsyncMock(return_value=provider)):
+            start = time.monotonic()
+            with pytest.raises(DeadlineExceededError):
+                await client.execute(query)
+
+        assert time.monotonic() - start < 2.0
+        assert client.router.get_provider_stats("slow")["successful_requests"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancel_on_disconnect(self) -> None:
+        request = MagicMock()
+        request.is_disconnected = AsyncMock(side_effect=[False, True])
+        cancelled = asyncio.Event()
+
+        async def work() -> None:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(Exception, match="Client closed request"):
+            await cancel_on_disconnect(request, work(), poll_interval=0.01)
+        await asyncio.sleep(0)
+
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_route_keeps_client_closed_status(self) -> None:
+        from fastapi import HTTPException
+
+        from vprism.web.routes.data_routes import get_stock_data
+
+        request = MagicMock()
+        request.is_disconnected = AsyncMock(return_value=True)
+        client = MagicMock()
+        client.execute = MagicMock(side_effect=lambda query: asyncio.sleep(5))
+        request.app.state.vprism_client = client
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_stock_data(request, "AAPL", market="us", timeframe="daily", start_date=None, end_date=None, limit=100)
+
+        assert exc_info.value.status_code == 499
+
+    @pytest.mark.asyncio
+    async def test_cancel_on_disconnect_returns_result(self) -> None:
+        request = MagicMock()
+        request.is_disconnected = AsyncMock(return_value=False)
+
+        async def work() -> str:
+            await asyncio.sleep(0.02)
+            return "done"
+
+        assert await cancel_on_disconnect(request, work(), poll_interval=0.01) == "done"
@@ -0,0 +1,228 @@
+"""Test chunked fetch planning for long historical ranges."""
+
+import asyncio
+from datetime import date, datetime, timedelta
+from unittest.mock import AsyncMock, PropertyMock, patch
+
+import pandas as pd
+import pytest
+
+from vprism.core.data.providers import AkShare, AlphaVantage, RateLimitConfig
+from vprism.core.data.providers.alpha_vantage import _output_size
+from vprism.core.exceptions import ProviderError
+from vprism.core.models import AssetType, DataQuery, MarketType, TimeFrame
+from vprism.core.patterns import Bulkhead, BulkheadConfig
+
+
+class _HistStub:
+    """akshare stub returning one bar per requested window start."""
+
+    def __init__(self, fail_windows: dict[str, int] | None = None, delay: float = 0.0, error: type[Exception] = ConnectionError):
+        self.calls: list[str] = []
+        self.fail_windows = dict(fail_windows or {})
+        self.error = error
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def stock_zh_a_hist(self, symbol, period, start_date, end_date, adjust):
+        self.calls.append(start_date)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.delay:
+                import time
+
+                time.sleep(self.delay)
+            if self.fail_windows.get(start_date, 0) > 0:
+                self.fail_windows[start_date] -= 1
+                raise self.error(f"window {start_date} failed")
+            day = datetime.strptime(start_date, "%Y%m%d")
+            return pd.DataFrame({"date": [day], "open": [1.0], "high": [1.0], "low": [1.0], "close": [1.0], "volume": [100]})
+        finally:
+            self.in_flight -= 1
+
+
+def _akshare(stub: _HistStub, max_retries: int = 2, concurrent: int = 3) -> AkShare:
+    provider = AkShare(
+        rate_limit=RateLimitConfig(
+            requests_per_minute=1000,
+            requests_per_hour=10000,
+            requests_per_day=10000,
+            concurrent_requests=concurrent,
+            max_retries=max_retries,
+            initial_delay=0.01,
+        )
+    )
+    provider._ak = stub
+    provider._initialized = True
+    provider._is_authenticated = True
+    return provider
+
+
+def _long_query() -> DataQuery:
+    return DataQuery(
+        asset=AssetType.STOCK,
+        market=MarketType.CN,
+        symbols=["000001"],
+        timeframe=TimeFrame.DAY_1,
+        start_date=date(2005, 1, 1),
+        end_date=date(2024, 12, 31),
+    )
+
+
+class TestFetchPlanner:
+    """Test FetchPlanner through the AkShare provider."""
+
+    @pytest.mark.asyncio
+    async def test_long_range_is_split_and_merged_in_order(self):
+        stub = _HistStub(delay=0.02)
+        provider = _akshare(stub)
+
+        response = await provider.get_data(_long_query())
+
+        plan_chunks = provider.split_query(_long_query())
+        assert len(plan_chunks) == 7
+        assert len(stub.calls) == 7
+        assert 1 < stub.max_in_flight <= 3
+        timestamps = [p.timestamp for p in response.data]
+        assert timestamps == sorted(timestamps)
+        assert timestamps[0].date() == date(2005, 1, 1)
+        assert response.metadata.total_records == 7
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_is_retried_individually(self):
+        stub = _HistStub(fail_windows={"20080101": 1})
+        provider = _akshare(stub)
+
+        response = await provider.get_data(_long_query())
+
+        assert len(response.data) == 7
+        assert stub.calls.count("20080101") == 2
+        assert len(stub.calls) == 8
+
+    @pytest.mark.asyncio
+    async def test_non_transient_error_is_not_retried(self):
+        stub = _HistStub(fail_windows={"20080101": 1}, error=ValueError)
+        provider = _akshare(stub)
+
+        with pytest.raises(ProviderError) as exc_info:
+            await provider.get_data(_long_query())
+
+        assert exc_info.value.details["completed_chunks"] == 6
+        assert stub.calls.count("20080101") == 1
+
+    @pytest.mark.asyncio
+    async def test_resume_after_partial_failure(self):
+        window = AkShare().split_query(_long_query())[3].start_date.strftime("%Y%m%d")
+        stub = _HistStub(fail_windows={window: 5})
+        provider = _akshare(stub, max_retries=2)
+
+        with pytest.raises(ProviderError) as exc_info:
+            await provider.get_data(_long_query())
+
+        assert exc_info.value.error_code == "PARTIAL_FETCH"
+        assert exc_info.value.details["completed_chunks"] == 6
+        assert len(provider.planner.get_pending_plans()) == 1
+
+        stub.fail_windows.clear()
+        stub.calls.clear()
+        response = await provider.get_data(_long_query())
+
+        assert stub.calls == [window]
+        assert len(response.data) == 7
+        assert provider.planner.get_pending_plans() == []
+
+    @pytest.mark.asyncio
+    async def test_short_range_is_a_single_call(self):
+        stub = _HistStub()
+        provider = _akshare(stub)
+        query = _long_query().model_copy(update={"start_date": date(2024, 1, 1), "start": datetime(2024, 1, 1)})
+
+        await provider.get_data(query)
+
+        assert stub.calls == ["20240101"]
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_bounds_requests(self):
+        stub = _HistStub()
+        provider = _akshare(stub)
+        provider.planner._limiter.max_calls = 2
+        provider.planner._limiter.period = 0.2
+
+        start = asyncio.get_running_loop().time()
+        await provider.get_data(_long_query().model_copy(update={"start_date": date(2016, 1, 1), "start": datetime(2016, 1, 1)}))
+        elapsed = asyncio.get_running_loop().time() - start
+
+        # 4 chunks with 2 per 0.2s window -> the last two wait for the window to roll
+        assert len(stub.calls) == 4
+        assert elapsed >= 0.15
+
+    @pytest.mark.asyncio
+    async def test_chunks_run_through_provider_bulkhead(self):
+        stub = _HistStub(delay=0.01)
+        provider = _akshare(stub, concurrent=3)
+        bulkhead = Bulkhead(BulkheadConfig(max_concurrent=1, max_queue=10, max_wait=1.0, name="planner-test"))
+
+        with patch.object(AkShare, "bulkhead", new_callable=PropertyMock, return_value=bulkhead):
+            # 外层已占用唯一槽位 (如 DataService), 分块拉取不应因此死锁
+            async with bulkhead:
+                response = await provider.get_data(_long_query())
+
+        assert len(response.data) == 7
+        assert stub.max_in_flight == 1
+        assert bulkhead.get_stats()["accepted"] == 8
+        assert bulkhead.active == 0
+
+    def test_pending_plans_are_bounded(self):
+        provider = _akshare(_HistStub())
+        planner = provider.planner
+        planner.max_plans = 2
+        queries = [_long_query().model_copy(update={"symbols": [f"00000{i}"]}) for i in range(3)]
+
+        for query in queries:
+            planner.plan(query)
+
+        assert [plan.query.symbols for plan in planner.get_pending_plans()] == [["000001"], ["000002"]]
+
+        planner.plan_ttl = 0.0
+        assert planner.get_pending_plans() == []
+
+
+class TestAlphaVantageWindow:
+    """Test AlphaVantage output size and date filtering."""
+
+    def test_compact_when_window_fits(self):
+        recent = DataQuery(asset=AssetType.STOCK, market=MarketType.US, symbols=["IBM"], start_date=datetime.now().date() - timedelta(days=30))
+        old = recent.model_copy(update={"start_date": date(2010, 1, 1)})
+        intraday = recent.model_copy(update={"timeframe": TimeFrame.MINUTE_5})
+
+        assert _output_size(recent) == "compact"
+        assert _output_size(old) == "full"
+        assert _output_size(intraday) == "full"
+        assert _output_size(recent.model_copy(update={"start_date": None})) == "full"
+
+    @pytest.mark.asyncio
+    async def test_points_filtered_to_window(self):
+        provider = AlphaVantage(api_key="demo")
+        provider._is_authenticated = True
+        series = {
+            "Time Series (Daily)": {
+                "2024-01-02": {"1. open": "1", "2. high": "1", "3. low": "1", "4. close": "1", "5. volume": "10"},
+                "2024-01-03": {"1. open": "1", "2. high": "1", "3. low": "1", "4. close": "1", "5. volume": "10"},
+                "2024-01-04": {"1. open": "1", "2. high": "1", "3. low": "1", "4. close": "1", "5. volume": "10"},
+            }
+        }
+        query = DataQuery(
+            asset=AssetType.STOCK,
+            market=MarketType.US,
+            symbols=["IBM"],
+            start_date=date(2024, 1, 3),
+            end_date=date(2024, 1, 3),
+        )
+
+        with patch.object(provider, "_request", AsyncMock(return_value=series)) as request:
+            response = await provider.get_data(query)
+
+        assert [p.timestamp.date() for p in response.data] == [date(2024, 1, 3)]
+        assert request.call_args[0][0]["outputsize"] == "full"
@@ -0,0 +1,168 @@
+"""Test hedged requests across providers."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from vprism.core.data.providers.base import AuthConfig, AuthType, DataProvider, ProviderCapability, RateLimitConfig
+from vprism.core.data.routing import DataRouter
+from vprism.core.exceptions import ProviderError
+from vprism.core.models import AssetType, DataQuery, MarketType
+from vprism.core.patterns import HedgedExecutor, HedgingPolicy
+
+
+class _SleepyProvider(DataProvider):
+    def __init__(self, name: str, delay: float, fail: bool = False) -> None:
+        super().__init__(
+            name,
+            AuthConfig(auth_type=AuthType.NONE, credentials={}),
+            RateLimitConfig(requests_per_minute=100, requests_per_hour=1000, requests_per_day=10000, concurrent_requests=5),
+        )
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self.cancelled = 0
+
+    def _discover_capability(self) -> ProviderCapability:
+        return ProviderCapability(
+            supported_assets={"stock"},
+            supported_markets={"us"},
+            supported_timeframes={"1d"},
+            max_symbols_per_request=10,
+            supports_real_time=True,
+            supports_historical=True,
+            data_delay_seconds=0,
+        )
+
+    async def authenticate(self) -> bool:
+        return True
+
+    async def get_data(self, query: DataQuery) -> Any:
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail:
+            raise ProviderError("down", self.name)
+        return self.name
+
+
+def _attempt(result: str, delay: float, fail: bool = False) -> Callable[[], Awaitable[str]]:
+    async def _call() -> str:
+        await asyncio.sleep(delay)
+        if fail:
+            raise ProviderError(result, "test")
+        return result
+
+    return _call
+
+
+class TestHedgedExecutor:
+    @pytest.mark.asyncio
+    async def test_fast_primary_sends_no_hedge(self) -> None:
+        hedger = HedgedExecutor()
+
+        index, result = await hedger.execute([_attempt("a", 0.0), _attempt("b", 0.0)], delay=0.1)
+
+        assert (index, result) == (0, "a")
+        assert hedger.get_stats()["hedges_sent"] == 0
+        assert hedger.primary_wins == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged_and_cancelled(self) -> None:
+        hedger = HedgedExecutor()
+        primary_cancelled = asyncio.Event()
+
+        async def slow_primary() -> str:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                primary_cancelled.set()
+                raise
+            return "a"
+
+        index, result = await hedger.execute([slow_primary, _attempt("b", 0.0)], delay=0.02)
+        await asyncio.sleep(0)
+
+        assert (index, result) == (1, "b")
+        assert primary_cancelled.is_set()
+        stats = hedger.get_stats()
+        assert stats["hedges_sent"] == 1
+        assert stats["hedge_wins"] == 1
+        assert stats["hedge_rate"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_primary_failure_falls_back_to_hedge(self) -> None:
+        hedger = HedgedExecutor()
+
+        index, result = await hedger.execute([_attempt("a", 0.05, fail=True), _attempt("b", 0.1)], delay=0.01)
+
+        assert (index, result) == (1, "b")
+
+    @pytest.mark.asyncio
+    async def test_all_attempts_fail(self) -> None:
+        hedger = HedgedExecutor()
+
+        with pytest.raises(ProviderError):
+            await hedger.execute([_attempt("a", 0.05, fail=True), _attempt("b", 0.0, fail=True)], delay=0.01)
+
+    @pytest.mark.asyncio
+    async def test_budget_caps_hedge_rate(self) -> None:
+        hedger = HedgedExecutor(HedgingPolicy(max_hedge_ratio=0.1, burst=1.0))
+
+        for _ in range(20):
+            await hedger.execute([_attempt("a", 0.01), _attempt("b", 0.0)], delay=0.0)
+
+        stats = hedger.get_stats()
+        assert stats["hedges_sent"] <= 3
+        assert stats["budget_denied"] >= 17
+        assert stats["requests"] == 20
+
+    def test_hedge_delay_uses_p95_with_floor(self) -> None:
+        hedger = HedgedExecutor(HedgingPolicy(default_delay=1.0, min_delay=0.05))
+
+        assert hedger.hedge_delay(None) == 1.0
+        assert hedger.hedge_delay(0.2) == 0.2
+        assert hedger.hedge_delay(0.001) == 0.05
+
+
+class TestRouterHedging:
+    @pytest.mark.asyncio
+    async def test_execute_hedged_uses_primary_p95(self) -> None:
+        primary = _SleepyProvider("primary", delay=1.0)
+        backup = _SleepyProvider("backup", delay=0.0)
+        registry = Mock()
+        registry.find_capable_providers = Mock(return_value=[backup, primary])
+        router = DataRouter(registry)
+        for _ in range(10):
+            router.update_provider_score("primary", success=True, latency_ms=20)
+        query = DataQuery(asset=AssetType.STOCK, market=MarketType.US, symbols=["AAPL"])
+        hedger = HedgedExecutor()
+
+        result = await router.execute_hedged(query, hedger)
+        await asyncio.sleep(0)
+
+        assert result == "backup"
+        assert primary.cancelled == 1
+        assert hedger.hedge_wins == 1
+        assert router.get_provider_stats("backup")["successful_requests"] == 1
+        # the cancelled primary call is not counted as a failure
+        assert router.get_provider_stats("primary")["total_requests"] == 10
+
+    @pytest.mark.asyncio
+    async def test_route_candidates_ranked(self) -> None:
+        fast = _SleepyProvider("fast", delay=0.0)
+        slow = _SleepyProvider("slow", delay=0.0)
+        registry = Mock()
+        registry.find_capable_providers = Mock(return_value=[slow, fast])
+        router = DataRouter(registry)
+        router.update_provider_score("slow", success=False, latency_ms=0)
+
+        candidates = await router.route_candidates(DataQuery(asset=AssetType.STOCK, market=MarketType.US, symbols=["AAPL"]))
+
+        assert [p.name for p in candidates] == ["fast", "slow"]
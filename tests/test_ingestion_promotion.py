@@ -0,0 +1,150 @@
+"""Test promotion of raw OHLCV batches into the normalized tables."""
+
+import re
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import duckdb
+import pytest
+
+from vprism.core.data.ingestion import PromotionJob, RawRecord, ingest
+from vprism.core.models.market import AssetType, MarketType
+from vprism.core.models.symbols import SymbolRule
+from vprism.core.services.symbols import SymbolService
+
+BASE = datetime(2024, 1, 2, 7, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+def conn():
+    connection = duckdb.connect(":memory:")
+    yield connection
+    connection.close()
+
+
+def _ingest(conn, symbols: list[str], days: int = 2, start: int = 0) -> str:
+    records = [RawRecord(symbol, BASE + timedelta(days=start + day), 10.0, 11.0, 9.0, 10.5, 1000.0) for symbol in symbols for day in range(days)]
+    return ingest(conn, records, provider="feed", market="cn").batch_id
+
+
+def _job(conn, service: SymbolService | None = None) -> PromotionJob:
+    return PromotionJob(conn, service or SymbolService(), market=MarketType.CN, asset_type=AssetType.STOCK)
+
+
+class TestPromotionJob:
+    """Test set-based raw to normalized promotion."""
+
+    def test_promotes_to_both_tables(self, conn) -> None:
+        batch_id = _ingest(conn, ["000001", "600000.SS"])
+
+        result = _job(conn).run()
+
+        assert result.batches == (batch_id,)
+        assert result.rows_promoted == 4
+        assert result.watermark is not None
+        normalized = conn.execute("SELECT DISTINCT c_symbol, tz_offset, currency FROM normalization_schema ORDER BY c_symbol").fetchall()
+        assert normalized == [("CN:STOCK:000001", 480, "CNY"), ("CN:STOCK:SH600000", 480, "CNY")]
+        ohlcv = conn.execute("SELECT symbol, timeframe, volume, batch_id FROM ohlcv ORDER BY symbol, ts").fetchall()
+        assert ohlcv[0] == ("CN:STOCK:000001", "1d", 1000, batch_id)
+        assert len(ohlcv) == 4
+        assert conn.execute("SELECT currency, exchange_tz FROM assets WHERE symbol = 'CN:STOCK:000001'").fetchone() == ("CNY", "Asia/Shanghai")
+
+    def test_watermark_resumes_incrementally(self, conn) -> None:
+        first = _ingest(conn, ["000001"])
+        second = _ingest(conn, ["000002"])
+        job = _job(conn)
+
+        assert job.run(max_batches=1).batches == (first,)
+        assert job.watermark()[1] == first
+        assert job.run().batches == (second,)
+        assert job.run().batches == ()
+
+        third = _ingest(conn, ["000001"], start=2)
+        assert job.run().batches == (third,)
+        assert conn.execute("SELECT count(*) FROM ohlcv").fetchone()[0] == 6
+
+    def test_failed_batch_rolls_back_and_keeps_watermark(self, conn) -> None:
+        first = _ingest(conn, ["000001"])
+        _ingest(conn, ["000002"])
+        service = SymbolService()
+        job = _job(conn, service)
+        real = service.normalize_batch
+        calls = []
+
+        def flaky(*args, **kwargs):
+            calls.append(args)
+            if len(calls) == 2:
+                raise RuntimeError("resolver down")
+            return real(*args, **kwargs)
+
+        with patch.object(service, "normalize_batch", flaky), pytest.raises(RuntimeError):
+            job.run()
+
+        assert job.watermark()[1] == first
+        assert conn.execute("SELECT count(*) FROM normalization_schema").fetchone()[0] == 2
+        assert job.run().rows_promoted == 2
+
+    def test_resolves_each_symbol_once_per_batch(self, conn) -> None:
+        _ingest(conn, ["000001", "000002"], days=5)
+        service = SymbolService()
+
+        with patch.object(service, "normalize_batch", wraps=service.normalize_batch) as normalize_batch:
+            _job(conn, service).run()
+
+        normalize_batch.assert_called_once()
+        assert sorted(normalize_batch.call_args.args[0]) == ["000001", "000002"]
+
+    def test_unresolved_symbols_are_reported(self, conn) -> None:
+        _ingest(conn, ["000001", "???"])
+
+        result = _job(conn).run()
+
+        assert result.unresolved_symbols == ("???",)
+        assert result.rows_promoted == 2
+
+    def test_unresolved_rows_are_quarantined_and_replayed(self, conn) -> None:
+        first = _ingest(conn, ["000001", "???"])
+        second = _ingest(conn, ["000002", "???"], start=2)
+        service = SymbolService()
+        job = _job(conn, service)
+
+        result = job.run()
+
+        assert result.batches == (first, second)
+        assert (result.rows_promoted, result.rows_quarantined) == (4, 4)
+        assert job.watermark()[1] == second
+        assert job.quarantined() == [(first, "???", 2), (second, "???", 2)]
+        assert job.run().batches == ()
+
+        placeholder = SymbolRule(id="placeholder", priority=1, pattern=re.compile(r"^\?{3}$"), transform=lambda raw, match: "UNKNOWN")
+        service.reload([*service.rules, placeholder])
+        replay = job.run()
+
+        assert (replay.batches, replay.rows_replayed) == ((), 4)
+        assert job.quarantined() == []
+        assert conn.execute("SELECT count(*) FROM ohlcv").fetchone()[0] == 8
+
+    def test_windowed_run_keeps_watermark(self, conn) -> None:
+        batch_id = _ingest(conn, ["000001"], days=4)
+        job = _job(conn)
+
+        window = job.run(start=BASE + timedelta(days=1), end=BASE + timedelta(days=2))
+
+        assert window.rows_promoted == 2
+        assert job.watermark() is None
+        assert job.run().rows_promoted == 4
+        assert job.watermark()[1] == batch_id
+
+    def test_explicit_batch_is_idempotent_and_windowed(self, conn) -> None:
+        batch_id = _ingest(conn, ["000001"], days=4)
+        job = _job(conn)
+
+        window = job.run(batch_id=batch_id, start=BASE + timedelta(days=1), end=BASE + timedelta(days=2))
+        full = job.run(batch_id=batch_id)
+        again = job.run(batch_id=batch_id)
+
+        assert window.rows_promoted == 2
+        assert full.rows_promoted == again.rows_promoted == 4
+        assert job.watermark() is None
+        assert conn.execute("SELECT count(*) FROM normalization_schema").fetchone()[0] == 4
+        assert conn.execute("SELECT count(*) FROM ohlcv").fetchone()[0] == 4
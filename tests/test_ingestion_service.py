@@ -0,0 +1,353 @@
+"""Test raw OHLCV ingestion into DuckDB."""
+
+import time
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import duckdb
+import numpy as np
+import pandas as pd
+import pytest
+
+from vprism.core.data.ingestion import (
+    ConflictPolicy,
+    IngestionConfig,
+    IngestionConfigError,
+    IngestionPipeline,
+    RawRecord,
+    ingest,
+    ingest_frame,
+    ingest_parallel,
+    ingest_stream,
+)
+from vprism.core.exceptions import DataValidationError
+
+BASE = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+def conn():
+    connection = duckdb.connect(":memory:")
+    yield connection
+    connection.close()
+
+
+def _records() -> list[RawRecord]:
+    return [
+        RawRecord("AAA", BASE, 10.0, 11.0, 9.0, 10.5, 100.0),
+        RawRecord("AAA", BASE + timedelta(days=1), 10.0, 11.0, 9.0, 10.5, None, provider="mirror"),
+        RawRecord("AAA", BASE + timedelta(days=1), 10.0, 11.0, 9.0, 10.5, 50.0),
+        RawRecord("BBB", BASE, 10.0, 9.0, 9.5, 10.0, 10.0),
+        RawRecord("", BASE, 10.0, 11.0, 9.0, 10.5, 10.0),
+        RawRecord("BBB", BASE + timedelta(days=2), 10.0, 11.0, 9.0, 10.5, 10.0),
+    ]
+
+
+def _frame(records: list[RawRecord]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "supplier_symbol": [r.supplier_symbol for r in records],
+            "timestamp": [r.timestamp for r in records],
+            "open": [r.open for r in records],
+            "high": [r.high for r in records],
+            "low": [r.low for r in records],
+            "close": [r.close for r in records],
+            "volume": [r.volume for r in records],
+            "provider": [r.provider for r in records],
+        }
+    )
+
+
+def _random_frame(rows: int, symbols: int, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = rng.uniform(5, 20, rows)
+    low = close - rng.uniform(-0.5, 1, rows)
+    return pd.DataFrame(
+        {
+            "supplier_symbol": [f"S{i:03d}" if i else None for i in rng.integers(0, symbols, rows)],
+            "timestamp": BASE + pd.to_timedelta(np.arange(rows) // 3 - rng.integers(0, 3, rows), unit="D"),
+            "open": close,
+            "high": close + 1,
+            "low": low,
+            "close": close,
+            "volume": np.where(rng.random(rows) < 0.1, np.nan, 100.0),
+        }
+    )
+
+
+def _rows(conn, batch_id: str) -> list[tuple]:
+    return conn.execute(
+        "SELECT supplier_symbol, market, ts, open, high, low, close, volume, provider FROM raw_ohlcv WHERE batch_id = ? ORDER BY supplier_symbol, ts",
+        [batch_id],
+    ).fetchall()
+
+
+class TestIngestFrame:
+    """Test the columnar ingestion entry point."""
+
+    @pytest.mark.parametrize("allow_duplicates", [False, True])
+    def test_matches_record_ingest(self, conn, allow_duplicates: bool) -> None:
+        config = IngestionConfig(allow_duplicates=allow_duplicates)
+
+        expected = ingest(conn, _records(), provider="feed", market="cn", config=config)
+        result = ingest_frame(conn, _frame(_records()), provider="feed", market="cn", config=config)
+
+        assert result.batch_id != expected.batch_id
+        assert result.written_rows == expected.written_rows == 3
+        assert result.rejected_rows == expected.rejected_rows
+        assert result.duplicates_dropped == expected.duplicates_dropped == 1
+        assert result.fail_reasons == expected.fail_reasons
+        assert result.issues == expected.issues
+        assert _rows(conn, result.batch_id) == _rows(conn, expected.batch_id)
+        assert ("AAA", "cn", datetime(2024, 1, 2), 10.0, 11.0, 9.0, 10.5, -1.0, "mirror") in _rows(conn, result.batch_id)
+
+    def test_optional_columns(self, conn) -> None:
+        frame = _frame(_records()[:1]).drop(columns=["volume", "provider"])
+
+        result = ingest_frame(conn, frame, provider="feed", market="us")
+
+        assert result.written_rows == 1
+        assert [issue.code for issue in result.issues] == ["MISSING_VOLUME_DEFAULTED"]
+        assert _rows(conn, result.batch_id)[0][-2:] == (-1.0, "feed")
+
+    def test_missing_required_column(self, conn) -> None:
+        with pytest.raises(DataValidationError) as exc_info:
+            ingest_frame(conn, _frame(_records()).drop(columns=["close"]), provider="feed", market="cn")
+
+        assert exc_info.value.validation_errors == {"missing_columns": ["close"]}
+
+    def test_nothing_to_write(self, conn) -> None:
+        result = ingest_frame(conn, _frame(_records()[3:5]), provider="feed", market="cn")
+
+        assert result.written_rows == 0
+        assert result.rejected_rows == 2
+
+    def test_batch_size_limit(self, conn) -> None:
+        with pytest.raises(IngestionConfigError):
+            ingest_frame(conn, _frame(_records()), provider="feed", market="cn", config=IngestionConfig(max_batch_rows=2))
+
+    def test_arrow_table(self, conn) -> None:
+        pa = pytest.importorskip("pyarrow")
+
+        result = ingest_frame(conn, pa.Table.from_pandas(_frame(_records())), provider="feed", market="cn")
+
+        assert result.written_rows == 3
+
+
+class TestIngestStream:
+    """Test chunked streaming ingestion."""
+
+    def test_chunks_match_single_batch(self, conn) -> None:
+        expected = ingest(conn, _records(), provider="feed", market="cn")
+        result = ingest_stream(conn, iter(_records()), provider="feed", market="cn", config=IngestionConfig(chunk_rows=2))
+
+        assert result.written_rows == expected.written_rows
+        assert result.rejected_rows == expected.rejected_rows
+        assert result.duplicates_dropped == expected.duplicates_dropped == 1
+        assert result.issues == expected.issues
+        assert result.fail_reasons == expected.fail_reasons
+        assert len(result.chunk_timings_ms) == 3
+        assert _rows(conn, result.batch_id) == _rows(conn, expected.batch_id)
+
+    def test_monotonic_state_crosses_chunks(self, conn) -> None:
+        records = [
+            RawRecord("AAA", BASE + timedelta(days=5), 10.0, 11.0, 9.0, 10.5, 1.0),
+            RawRecord("AAA", BASE + timedelta(days=3), 10.0, 11.0, 9.0, 10.5, 1.0),
+            RawRecord("AAA", BASE + timedelta(days=6), 10.0, 11.0, 9.0, 10.5, 1.0),
+        ]
+
+        result = ingest_stream(conn, records, provider="feed", market="cn", config=IngestionConfig(chunk_rows=1))
+
+        assert [(issue.index, issue.code) for issue in result.issues] == [(1, "NON_MONOTONIC_TIMESTAMP")]
+        assert result.written_rows == 2
+
+    @pytest.mark.parametrize("monotonic", [True, False])
+    def test_repeated_key_is_caught_in_any_later_chunk(self, conn, monotonic) -> None:
+        # the second row is fatal (high < low), the last repeats the first key
+        records = [
+            RawRecord("AAA", BASE + timedelta(days=5), 10.0, 11.0, 9.0, 10.5, 1.0),
+            RawRecord("AAA", BASE + timedelta(days=3), 10.0, 9.0, 11.0, 10.5, 1.0),
+            RawRecord("AAA", BASE + timedelta(days=4), 10.0, 11.0, 9.0, 10.5, 1.0),
+            RawRecord("AAA", BASE + timedelta(days=5), 10.0, 11.0, 9.0, 10.5, 1.0),
+        ]
+        config = IngestionConfig(chunk_rows=1, enforce_monotonic_ts=monotonic)
+
+        expected = ingest(conn, records, provider="feed", market="cn", config=config)
+        conn.execute("DELETE FROM raw_ohlcv")
+        result = ingest_stream(conn, records, provider="feed", market="cn", config=config)
+
+        assert result.written_rows == expected.written_rows
+        assert result.duplicates_dropped == expected.duplicates_dropped == 1
+        assert sorted((issue.index, issue.code) for issue in result.issues) == sorted((issue.index, issue.code) for issue in expected.issues)
+        assert conn.execute("SELECT count(*) FROM raw_ohlcv").fetchone()[0] == expected.written_rows
+
+    def test_consumes_input_lazily_and_commits_per_chunk(self, conn) -> None:
+        committed = []
+
+        def replay():
+            for day in range(6):
+                if day == 4:
+                    committed.append(conn.execute("SELECT count(*) FROM raw_ohlcv").fetchone()[0])
+                yield RawRecord("AAA", BASE + timedelta(days=day), 10.0, 11.0, 9.0, 10.5, 1.0)
+            raise RuntimeError("source failed")
+
+        with pytest.raises(RuntimeError):
+            ingest_stream(conn, replay(), provider="feed", market="cn", config=IngestionConfig(chunk_rows=2))
+
+        assert committed == [4]
+        assert conn.execute("SELECT count(*) FROM raw_ohlcv").fetchone()[0] == 6
+
+    def test_failed_chunk_is_rolled_back(self, conn) -> None:
+        from vprism.core.data.ingestion import service as service_module
+
+        records = [RawRecord("AAA", BASE + timedelta(days=day), 10.0, 11.0, 9.0, 10.5, 1.0) for day in range(4)]
+        real = service_module._write_rows
+        calls = []
+
+        def fail_after_second_write(*args, **kwargs):
+            counts = real(*args, **kwargs)
+            calls.append(counts)
+            if len(calls) == 2:
+                raise duckdb.ConstraintException("write failed")
+            return counts
+
+        with patch.object(service_module, "_write_rows", fail_after_second_write), pytest.raises(duckdb.ConstraintException):
+            ingest_stream(conn, records, provider="feed", market="cn", config=IngestionConfig(chunk_rows=2))
+
+        assert calls == [(2, 0), (2, 0)]
+        assert conn.execute("SELECT count(*) FROM raw_ohlcv").fetchone()[0] == 2
+
+    def test_repeats_spread_over_many_chunks_are_dropped(self, conn) -> None:
+        records = [RawRecord("AAA", BASE + timedelta(days=day % 3), 10.0, 11.0, 9.0, 10.5, 1.0) for day in range(9)]
+
+        result = ingest_stream(conn, records, provider="feed", market="cn", config=IngestionConfig(chunk_rows=2, enforce_monotonic_ts=False))
+
+        assert (result.written_rows, result.duplicates_dropped) == (3, 6)
+        assert [issue.index for issue in result.issues] == [3, 4, 5, 6, 7, 8]
+        assert conn.execute("SELECT count(*) FROM raw_ohlcv").fetchone()[0] == 3
+
+    def test_chunk_size_capped_by_batch_limit(self) -> None:
+        assert IngestionConfig(chunk_rows=100, max_batch_rows=10).stream_chunk_rows() == 10
+        with pytest.raises(IngestionConfigError):
+            IngestionConfig(chunk_rows=0).stream_chunk_rows()
+
+
+class TestIngestionPipeline:
+    """Test parallel symbol-partitioned ingestion."""
+
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_matches_frame_ingest(self, conn, workers: int) -> None:
+        frame = _random_frame(3000, symbols=25)
+        expected = ingest_frame(conn, frame, provider="feed", market="cn")
+        result = ingest_parallel(conn, frame, provider="feed", market="cn", config=IngestionConfig(workers=workers, commit_rows=500))
+
+        assert result.rejected_rows > 0
+        assert result.duplicates_dropped > 0
+        assert result.written_rows == expected.written_rows
+        assert result.rejected_rows == expected.rejected_rows
+        assert result.duplicates_dropped == expected.duplicates_dropped
+        assert result.issues == expected.issues
+        assert result.fail_reasons == expected.fail_reasons
+        assert _rows(conn, result.batch_id) == _rows(conn, expected.batch_id)
+
+    def test_stage_stats_and_commit_batching(self, conn) -> None:
+        pipeline = IngestionPipeline(conn, provider="feed", market="cn", config=IngestionConfig(workers=2, commit_rows=1000))
+
+        result = pipeline.run(_random_frame(5000, symbols=40))
+
+        stats = pipeline.get_stats()
+        stages = stats["stages"]
+        assert stats["workers"] == 2
+        assert stages["partition"]["rows"] == 5000
+        assert stages["validate"]["rows"] == 5000
+        assert stages["validate"]["batches"] == 8
+        assert stages["write"]["rows"] == result.written_rows
+        assert stages["write"]["batches"] == len(result.chunk_timings_ms) > 1
+        assert stages["validate"]["rows_per_second"] > 0
+
+    def test_bounded_queue_applies_backpressure(self, conn) -> None:
+        from vprism.core.data.ingestion import pipeline as pipeline_module
+
+        real_write = pipeline_module._write_in_transaction
+
+        def slow_write(connection, rows, on_existing):
+            time.sleep(0.02)
+            return real_write(connection, rows, on_existing)
+
+        pipeline = IngestionPipeline(conn, provider="feed", market="cn", config=IngestionConfig(workers=4, queue_depth=1, commit_rows=1))
+        with patch.object(pipeline_module, "_write_in_transaction", slow_write):
+            result = pipeline.run(_random_frame(2000, symbols=40))
+
+        stats = pipeline.get_stats()
+        assert stats["max_queue_depth"] <= 1
+        assert stats["stages"]["validate"]["blocked_seconds"] > 0
+        assert result.written_rows == conn.execute("SELECT count(*) FROM raw_ohlcv").fetchone()[0]
+
+    def test_worker_failure_propagates(self, conn) -> None:
+        from vprism.core.data.ingestion import pipeline as pipeline_module
+
+        with (
+            patch.object(pipeline_module, "_prepare_columns", side_effect=RuntimeError("boom")),
+            pytest.raises(RuntimeError, match="boom"),
+        ):
+            ingest_parallel(conn, _random_frame(500, symbols=40), provider="feed", market="cn", config=IngestionConfig(workers=4, queue_depth=1))
+
+    def test_rejects_invalid_settings(self, conn) -> None:
+        with pytest.raises(IngestionConfigError):
+            IngestionPipeline(conn, provider="feed", market="cn", config=IngestionConfig(queue_depth=0))
+
+
+class TestIncrementalIngest:
+    """Test cross-batch dedupe against rows already in raw_ohlcv."""
+
+    def test_default_appends_every_run(self, conn) -> None:
+        ingest_frame(conn, _frame(_records()), provider="feed", market="cn")
+        ingest_frame(conn, _frame(_records()), provider="feed", market="cn")
+
+        assert conn.execute("SELECT count(*) FROM raw_ohlcv").fetchone()[0] == 6
+
+    @pytest.mark.parametrize("entry", ["records", "frame", "stream", "parallel"])
+    def test_skip_rerun_writes_nothing(self, conn, entry: str) -> None:
+        config = IngestionConfig(on_existing=ConflictPolicy.SKIP, chunk_rows=2, workers=2)
+        runners = {
+            "records": lambda: ingest(conn, _records(), provider="feed", market="cn", config=config),
+            "frame": lambda: ingest_frame(conn, _frame(_records()), provider="feed", market="cn", config=config),
+            "stream": lambda: ingest_stream(conn, _records(), provider="feed", market="cn", config=config),
+            "parallel": lambda: ingest_parallel(conn, _frame(_records()), provider="feed", market="cn", config=config),
+        }
+
+        first = runners[entry]()
+        second = runners[entry]()
+
+        assert (first.written_rows, first.skipped_rows) == (3, 0)
+        assert (second.written_rows, second.skipped_rows) == (0, 3)
+        assert second.replaced_rows == 0
+        assert conn.execute("SELECT count(*) FROM raw_ohlcv").fetchone()[0] == 3
+
+    def test_skip_keeps_new_keys_and_ignores_other_markets(self, conn) -> None:
+        config = IngestionConfig(on_existing=ConflictPolicy.SKIP)
+        ingest_frame(conn, _frame(_records()[:1]), provider="feed", market="us", config=config)
+        ingest_frame(conn, _frame(_records()[:1]), provider="feed", market="cn", config=config)
+
+        result = ingest_frame(conn, _frame(_records()), provider="feed", market="cn", config=config)
+
+        assert (result.written_rows, result.skipped_rows) == (2, 1)
+        assert conn.execute("SELECT count(*) FROM raw_ohlcv").fetchone()[0] == 4
+
+    def test_upsert_replaces_stored_rows(self, conn) -> None:
+        config = IngestionConfig(on_existing=ConflictPolicy.UPSERT)
+        first = ingest_frame(conn, _frame(_records()), provider="feed", market="cn", config=config)
+        revised = _frame(_records())
+        revised["close"] = 10.75
+
+        second = ingest_frame(conn, revised, provider="feed", market="cn", config=config)
+
+        assert (second.written_rows, second.replaced_rows, second.skipped_rows) == (3, 3, 0)
+        stored = conn.execute("SELECT DISTINCT close, batch_id FROM raw_ohlcv").fetchall()
+        assert stored == [(10.75, second.batch_id)]
+        assert first.batch_id != second.batch_id
+
+    def test_no_secondary_index_on_raw_ohlcv(self, conn) -> None:
+        ingest_frame(conn, _frame(_records()), provider="feed", market="cn", config=IngestionConfig(on_existing=ConflictPolicy.SKIP))
+
+        assert conn.execute("SELECT count(*) FROM duckdb_indexes() WHERE table_name = 'raw_ohlcv'").fetchone()[0] == 0
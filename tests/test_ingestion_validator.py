@@ -0,0 +1,232 @@
+"""Test vectorized validation of raw OHLCV ingestion batches."""
+
+import math
+import random
+import time
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from vprism.core.data.ingestion.models import RawRecord
+from vprism.core.data.ingestion.validator import ValidationIssue, validate_batch, validate_columns
+
+BASE = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def _record(symbol="AAA", minute=0, open_=10.0, high=11.0, low=9.0, close=10.5, volume=100.0):
+    ts = None if minute is None else BASE + timedelta(minutes=minute)
+    return RawRecord(supplier_symbol=symbol, timestamp=ts, open=open_, high=high, low=low, close=close, volume=volume)
+
+
+def _reference(records, enforce_monotonic_ts=True):
+    """Row-at-a-time statement of the validation rules, used to check parity."""
+
+    issues = []
+    valid = []
+    last = {}
+    for index, r in enumerate(records):
+        found = []
+        if not r.supplier_symbol:
+            found.append(("supplier_symbol", "MISSING_FIELD", True))
+        if r.timestamp is None:
+            found.append(("timestamp", "MISSING_FIELD", True))
+        for field in ("open", "high", "low", "close"):
+            value = getattr(r, field)
+            if value is None:
+                found.append((field, "MISSING_FIELD", True))
+            elif not math.isfinite(value):
+                found.append((field, "NON_FINITE_VALUE", True))
+        if not found:
+            if r.low - r.high > 1e-12:
+                found.append(("low_high", "LOW_ABOVE_HIGH", True))
+            else:
+                if r.open - r.high > 1e-12 or r.low - r.open > 1e-12:
+                    found.append(("open", "OPEN_OUT_OF_RANGE", True))
+                if r.close - r.high > 1e-12 or r.low - r.close > 1e-12:
+                    found.append(("close", "CLOSE_OUT_OF_RANGE", True))
+        if r.volume is None:
+            found.append(("volume", "MISSING_VOLUME_DEFAULTED", False))
+        elif not math.isfinite(r.volume) or (r.volume < 0 and abs(r.volume + 1) > 1e-12):
+            found.append(("volume", "NEGATIVE_VOLUME", True))
+        fatal = any(item[2] for item in found)
+        if enforce_monotonic_ts and not fatal and r.supplier_symbol:
+            if r.supplier_symbol in last and r.timestamp < last[r.supplier_symbol]:
+                found.append(("timestamp", "NON_MONOTONIC_TIMESTAMP", True))
+                fatal = True
+            else:
+                last[r.supplier_symbol] = r.timestamp
+        elif r.supplier_symbol and r.timestamp is not None:
+            last[r.supplier_symbol] = r.timestamp
+        issues.extend((index, field, code) for field, code, _ in found)
+        if not fatal:
+            valid.append(index)
+    return valid, issues
+
+
+def _summary(issues: list[ValidationIssue]) -> list[tuple[int, str, str]]:
+    return [(issue.index, issue.field, issue.code) for issue in issues]
+
+
+class TestValidateBatch:
+    """Test record-level validation results."""
+
+    def test_issue_codes_and_order(self) -> None:
+        records = [
+            _record(symbol="", minute=None, open_=None, high=math.inf),
+            _record(low=12.0),
+            _record(open_=12.0, close=8.0),
+            _record(volume=None),
+            _record(volume=-5.0),
+            _record(volume=-1.0),
+        ]
+
+        validated, issues = validate_batch(records, market="cn")
+
+        assert _summary(issues) == [
+            (0, "supplier_symbol", "MISSING_FIELD"),
+            (0, "timestamp", "MISSING_FIELD"),
+            (0, "open", "MISSING_FIELD"),
+            (0, "high", "NON_FINITE_VALUE"),
+            (1, "low_high", "LOW_ABOVE_HIGH"),
+            (2, "open", "OPEN_OUT_OF_RANGE"),
+            (2, "close", "CLOSE_OUT_OF_RANGE"),
+            (3, "volume", "MISSING_VOLUME_DEFAULTED"),
+            (4, "volume", "NEGATIVE_VOLUME"),
+        ]
+        assert issues[0].message == "supplier_symbol is required"
+        assert [issue.fatal for issue in issues if issue.index == 3] == [False]
+        assert [v.index for v in validated] == [3, 5]
+        assert validated[0].record.volume == -1.0
+        assert records[3].volume is None
+
+    def test_monotonic_per_symbol(self) -> None:
+        records = [
+            _record("AAA", minute=5),
+            _record("BBB", minute=1),
+            _record("AAA", minute=3),
+            _record("AAA", minute=5),
+            _record("AAA", minute=1, low=20.0),
+            _record("AAA", minute=2),
+        ]
+
+        validated, issues = validate_batch(records, market="cn")
+
+        assert _summary(issues) == [
+            (2, "timestamp", "NON_MONOTONIC_TIMESTAMP"),
+            (4, "low_high", "LOW_ABOVE_HIGH"),
+        ]
+        # a row rejected for another reason still resets the symbol's last timestamp
+        assert [v.index for v in validated] == [0, 1, 3, 5]
+
+        _, relaxed = validate_batch(records, market="cn", enforce_monotonic_ts=False)
+        assert [issue.code for issue in relaxed] == ["LOW_ABOVE_HIGH"]
+
+    def test_matches_reference_on_random_batches(self) -> None:
+        rng = random.Random(7)
+        choices = [None, math.nan, math.inf, -1.0, -3.0, 0.0, 8.0, 9.0, 10.0, 11.0, 12.0]
+        for _ in range(50):
+            records = [
+                RawRecord(
+                    supplier_symbol=rng.choice(["AAA", "BBB", "CCC", ""]),
+                    timestamp=None if rng.random() < 0.05 else BASE + timedelta(minutes=rng.randrange(20)),
+                    open=rng.choice(choices),
+                    high=rng.choice(choices[5:] * 3 + choices),
+                    low=rng.choice(choices[5:] * 3 + choices),
+                    close=rng.choice(choices),
+                    volume=rng.choice([None, 1.0, 5.0, -1.0, -2.0, math.nan]),
+                )
+                for _ in range(rng.randrange(1, 60))
+            ]
+            enforce = rng.random() < 0.8
+
+            validated, issues = validate_batch(records, market="cn", enforce_monotonic_ts=enforce)
+
+            expected_valid, expected_issues = _reference(records, enforce)
+            assert [v.index for v in validated] == expected_valid
+            assert _summary(issues) == expected_issues
+
+    def test_carry_makes_chunks_match_whole_batch(self) -> None:
+        rng = random.Random(11)
+        for _ in range(30):
+            records = [
+                _record(
+                    symbol=rng.choice(["AAA", "BBB"]),
+                    minute=rng.randrange(10),
+                    low=rng.choice([9.0, 9.0, 9.0, 20.0]),
+                )
+                for _ in range(40)
+            ]
+            _, expected = validate_batch(records, market="cn")
+
+            carry: dict[object, int] = {}
+            issues = []
+            start = 0
+            while start < len(records):
+                chunk = records[start : start + rng.randrange(1, 8)]
+                result = validate_columns(
+                    **{name: [getattr(r, name) for r in chunk] for name in ("supplier_symbol", "timestamp", "open", "high", "low", "close", "volume")},
+                    market="cn",
+                    carry=carry,
+                )
+                issues.extend((issue.index + start, issue.field, issue.code) for issue in result.issues)
+                start += len(chunk)
+
+            assert issues == _summary(expected)
+
+    def test_empty_batch(self) -> None:
+        assert validate_batch([], market="cn") == ([], [])
+
+
+class TestValidateColumns:
+    """Test column-level validation."""
+
+    def test_series_nulls_are_missing(self) -> None:
+        frame = pd.DataFrame(
+            {
+                "supplier_symbol": ["AAA", "AAA", None],
+                "timestamp": pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03"]),
+                "open": [10.0, np.nan, 10.0],
+                "high": [11.0, 11.0, np.inf],
+                "low": [9.0, 9.0, 9.0],
+                "close": [10.0, 10.0, 10.0],
+                "volume": [1.0, 1.0, np.nan],
+            }
+        )
+
+        result = validate_columns(**{name: frame[name] for name in frame.columns}, market="cn")
+
+        assert result.valid.tolist() == [True, False, False]
+        assert _summary(result.issues) == [
+            (1, "open", "MISSING_FIELD"),
+            (2, "supplier_symbol", "MISSING_FIELD"),
+            (2, "high", "NON_FINITE_VALUE"),
+            (2, "volume", "MISSING_VOLUME_DEFAULTED"),
+        ]
+        assert result.volume.tolist() == [1.0, 1.0, -1.0]
+
+    @pytest.mark.perf
+    def test_million_rows_under_a_second(self) -> None:
+        size = 1_000_000
+        symbols = np.array([f"S{i % 500}" for i in range(size)], dtype=object)
+        timestamps = pd.Series(pd.date_range("2020-01-01", periods=size, freq="min"))
+        prices = np.full(size, 10.0)
+        prices[::1000] = np.nan
+
+        start = time.perf_counter()
+        result = validate_columns(
+            supplier_symbol=symbols,
+            timestamp=timestamps,
+            open=prices,
+            high=prices + 1,
+            low=prices - 1,
+            close=prices,
+            volume=np.full(size, 100.0),
+            market="cn",
+        )
+        elapsed = time.perf_counter() - start
+
+        assert len(result.issues) == 4000
+        assert int(result.valid.sum()) == size - 1000
+        assert elapsed < 1.0
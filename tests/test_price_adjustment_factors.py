@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import time
 from datetime import date, datetime
 from decimal import Decimal
 
+import numpy as np
+import pandas as pd  # type: ignore[import-untyped]
+import pytest
+
 from vprism.core.models.base import DataPoint
 from vprism.core.models.corporate_actions import CorporateActionFactor
 from vprism.core.models.market import MarketType
 from vprism.core.models.query import Adjustment
-from vprism.core.services.adjustment import adjust_prices
+from vprism.core.services.adjustment import adjust_frame, adjust_prices
 
 
 def _dp(d: date, o: float, h: float, low: float, c: float, v: int) -> DataPoint:
@@ -55,3 +60,101 @@ def test_adjust_prices_missing_factor_date_no_change():
     pts = [_dp(date(2024, 1, 2), 10, 11, 9, 10, 1000)]
     out = adjust_prices(pts, Adjustment.FORWARD, factors)
     assert out[0].close_price == Decimal("10") and out[0].volume == Decimal("1000")
+
+
+def _factor(symbol: str, d: date, forward: str, backward: str) -> CorporateActionFactor:
+    return CorporateActionFactor(symbol=symbol, market=MarketType.CN, date=d, forward_factor=Decimal(forward), backward_factor=Decimal(backward))
+
+
+def _bars(symbol: str, days: list[date], close: list[float]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "symbol": symbol,
+            "ts": pd.to_datetime(days),
+            "open": close,
+            "high": close,
+            "low": close,
+            "close": close,
+            "volume": [1000.0] * len(days),
+        }
+    )
+
+
+def test_adjust_prices_single_copy_per_bar():
+    factors = [_factor("000001", date(2024, 1, 2), "2", "0.5")]
+    pts = [_dp(date(2024, 1, 1), 10, 11, 9, 10, 1000), _dp(date(2024, 1, 2), 12, 13, 11, 12, 1500)]
+    out = adjust_prices(pts, Adjustment.FORWARD, factors)
+    assert out[0] is pts[0]
+    assert (out[1].open_price, out[1].high_price, out[1].low_price, out[1].close_price) == (Decimal("24"), Decimal("26"), Decimal("22"), Decimal("24"))
+
+
+def test_adjust_frame_matches_datapoint_path():
+    factors = [_factor("000001", date(2024, 1, 1), "1", "1"), _factor("000001", date(2024, 1, 2), "2", "0.5")]
+    frame = _bars("000001", [date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 3)], [10.0, 12.0, 13.0])
+    out = adjust_frame(frame, factors, Adjustment.BACKWARD)
+    assert out["close"].tolist() == [10.0, 6.0, 13.0]
+    assert out["volume"].tolist() == [1000.0, 2000.0, 1000.0]
+    assert frame["close"].tolist() == [10.0, 12.0, 13.0]
+
+
+def test_adjust_frame_aligns_per_symbol_and_asof():
+    factors = pd.DataFrame(
+        {
+            "symbol": ["B", "A"],
+            "date": [date(2024, 1, 1), date(2024, 1, 2)],
+            "forward_factor": [3.0, 2.0],
+            "backward_factor": [1.0, 1.0],
+        }
+    )
+    days = [date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 5)]
+    frame = pd.concat([_bars("A", days, [1.0, 1.0, 1.0]), _bars("B", days, [1.0, 1.0, 1.0])], ignore_index=True)
+
+    exact = adjust_frame(frame, factors, Adjustment.FORWARD)
+    assert exact["close"].tolist() == [1.0, 2.0, 1.0, 3.0, 1.0, 1.0]
+
+    carried = adjust_frame(frame, factors, Adjustment.FORWARD, tolerance=None)
+    assert carried["close"].tolist() == [1.0, 2.0, 2.0, 3.0, 3.0, 3.0]
+
+    bounded = adjust_frame(frame, factors, Adjustment.FORWARD, tolerance=1)
+    assert bounded["close"].tolist() == [1.0, 2.0, 1.0, 3.0, 3.0, 1.0]
+
+
+def test_adjust_frame_zero_factor_keeps_volume():
+    frame = _bars("000001", [date(2024, 1, 1)], [10.0])
+    out = adjust_frame(frame, [_factor("000001", date(2024, 1, 1), "0", "0")], Adjustment.FORWARD)
+    assert out["close"].tolist() == [0.0]
+    assert out["volume"].tolist() == [1000.0]
+
+
+@pytest.mark.perf
+def test_adjust_frame_throughput():
+    symbols, days = 500, 4_900
+    rng = np.random.default_rng(7)
+    dates = pd.bdate_range("2005-01-03", periods=days)
+    frame = pd.DataFrame(
+        {
+            "symbol": np.repeat([f"{i:06d}" for i in range(symbols)], days),
+            "ts": np.tile(dates.values, symbols),
+            "open": rng.uniform(5, 50, symbols * days),
+            "high": rng.uniform(5, 50, symbols * days),
+            "low": rng.uniform(5, 50, symbols * days),
+            "close": rng.uniform(5, 50, symbols * days),
+            "volume": rng.uniform(1e4, 1e6, symbols * days),
+        }
+    )
+    factors = pd.DataFrame(
+        {
+            "symbol": frame["symbol"],
+            "date": frame["ts"],
+            "forward_factor": rng.uniform(0.5, 1.0, symbols * days),
+            "backward_factor": rng.uniform(1.0, 2.0, symbols * days),
+        }
+    )
+
+    start = time.perf_counter()
+    out = adjust_frame(frame, factors, Adjustment.BACKWARD)
+    elapsed = time.perf_counter() - start
+
+    print(f"{len(frame):,} bars in {elapsed:.2f}s")
+    np.testing.assert_allclose(out["close"], frame["close"] * factors["backward_factor"])
+    assert elapsed < 10
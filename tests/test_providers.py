@@ -1,6 +1,6 @@
 """Test data provider adapter framework."""
 
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from decimal import Decimal
 from unittest.mock import Mock, patch
 
@@ -8,6 +8,8 @@ import pytest
 
 from vprism.core.data.providers import (
     AkShare,
+    DataProvider,
+    ProviderCapability,
     ProviderRegistry,
     YFinance,
 )
@@ -59,6 +61,74 @@ class TestProviderBase:
         assert result is True
         assert provider.is_authenticated is True
 
+    def test_split_query_by_symbol_and_window(self):
+        """Test chunk planning: per symbol, non-overlapping date windows."""
+        provider = YFinance()
+
+        query = DataQuery(
+            asset=AssetType.STOCK,
+            market=MarketType.US,
+            symbols=["AAPL", "MSFT"],
+            raw_symbols=["aapl", "msft"],
+            timeframe=TimeFrame.MINUTE_1,
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 20),
+        )
+        parts = provider.split_query(query)
+
+        assert len(parts) == 6
+        assert [p.symbols for p in parts[:3]] == [["AAPL"]] * 3
+        assert parts[3].raw_symbols == ["msft"]
+        assert [(p.start_date, p.end_date) for p in parts[:3]] == [
+            (date(2024, 1, 1), date(2024, 1, 7)),
+            (date(2024, 1, 8), date(2024, 1, 14)),
+            (date(2024, 1, 15), date(2024, 1, 20)),
+        ]
+        assert parts[0].start == query.start
+        assert parts[2].end == query.end
+        for prev, nxt in zip(parts[:2], parts[1:3], strict=True):
+            assert nxt.start_date - prev.end_date == timedelta(days=1)
+
+    def test_split_query_daily_is_per_symbol_only(self):
+        """Test that daily queries without a date-range endpoint are only split by symbol."""
+        provider = AkShare()
+        query = DataQuery(
+            asset=AssetType.STOCK,
+            market=MarketType.US,
+            symbols=["000001"],
+            start_date=date(2000, 1, 1),
+            end_date=date(2024, 1, 1),
+        )
+
+        assert provider.split_query(query) == [query]
+
+    @pytest.mark.asyncio
+    async def test_stream_data_yields_incrementally(self):
+        """Test stream_data fetches chunk by chunk."""
+        provider = YFinance()
+        query = DataQuery(
+            asset=AssetType.STOCK,
+            market=MarketType.US,
+            symbols=["AAPL", "MSFT"],
+            timeframe=TimeFrame.DAY_1,
+        )
+        fetched: list[list[str]] = []
+
+        async def _get_data(part):
+            fetched.append(part.symbols)
+            point = DataPoint(symbol=part.symbols[0], market=MarketType.US, timestamp=datetime(2024, 1, 2), close_price=Decimal("1"), provider="yfinance")
+            return Mock(data=[point])
+
+        with patch.object(provider, "get_data", side_effect=_get_data):
+            stream = provider.stream_data(query)
+            first = await anext(stream)
+            assert first.symbol == "AAPL"
+            assert fetched == [["AAPL"]]
+            rest = [p async for p in stream]
+
+        assert [p.symbol for p in rest] == ["MSFT"]
+        assert fetched == [["AAPL"], ["MSFT"]]
+
 
 class TestAkShare:
     """Test AkShare provider."""
@@ -120,6 +190,87 @@ class TestAkShare:
             assert dp.symbol == "000001"
             assert dp.close_price == Decimal("10.5")
 
+    @staticmethod
+    def _hist_stub(calls: list[tuple[str, str]]):
+        import pandas as pd
+
+        class _AkStub:
+            def stock_zh_a_hist(self, **kwargs):
+                calls.append((kwargs["adjust"], kwargs["start_date"]))
+                frame = pd.DataFrame(
+                    {
+                        "date": [datetime(2024, 1, 2), datetime(2024, 1, 3), datetime(2024, 1, 4)],
+                        "open": [10.0, 5.0, 6.0],
+                        "high": [10.0, 5.0, 6.0],
+                        "low": [10.0, 5.0, 6.0],
+                        "close": [10.0, 5.0, 6.0],
+                        "volume": [1000, 2000, 2000],
+                    }
+                )
+                return frame[(frame["date"] >= kwargs["start_date"]) & (frame["date"] <= kwargs["end_date"])]
+
+        return _AkStub()
+
+    @pytest.mark.asyncio
+    async def test_akshare_adjusts_locally_with_corporate_actions(self):
+        """Test that adjusted queries fetch raw bars and apply factors built from full history."""
+        from vprism.core.data.storage.duckdb_factory import VPrismDuckDBFactory
+        from vprism.core.models.corporate_actions import SplitEvent
+        from vprism.core.models.query import Adjustment
+        from vprism.core.services.corporate_actions import CorporateActionService
+
+        with VPrismDuckDBFactory().connection() as conn:
+            service = CorporateActionService(conn)
+            service.ingest(splits=[SplitEvent(symbol="000001", market=MarketType.CN, ex_date=date(2024, 1, 3), numerator=2, denominator=1)])
+            provider = AkShare(corporate_actions=service)
+            calls: list[tuple[str, str]] = []
+            provider._ak = self._hist_stub(calls)
+            provider._initialized = True
+
+            def query(start: date, adjustment: Adjustment) -> DataQuery:
+                return DataQuery(
+                    asset=AssetType.STOCK, market=MarketType.CN, symbols=["000001"], start_date=start, end_date=date(2024, 1, 4), adjustment=adjustment
+                )
+
+            window = await provider.get_data(query(date(2024, 1, 3), Adjustment.BACKWARD))
+            again = await provider.get_data(query(date(2024, 1, 2), Adjustment.FORWARD))
+            dividends, splits = await provider._get_corporate_action_events("000001", MarketType.CN)
+            restarted = AkShare(corporate_actions=CorporateActionService(conn))
+            restarted._ak = self._hist_stub(calls)
+            restarted._initialized = True
+            after_restart = await restarted.get_data(query(date(2024, 1, 3), Adjustment.BACKWARD))
+
+        # window fetch, one full-history fetch to build factors, then the stored factors are reused, also after a restart
+        assert calls == [("", "20240103"), ("", "19700101"), ("", "20240102"), ("", "20240103")]
+        assert after_restart.data == window.data
+        assert [dp.close_price for dp in window.data] == [Decimal("10"), Decimal("12")]
+        assert [dp.close_price for dp in again.data] == [Decimal("5"), Decimal("5"), Decimal("6")]
+        assert (dividends, len(splits)) == ([], 1)
+
+    @pytest.mark.asyncio
+    async def test_akshare_keeps_supplier_adjustment_without_events(self):
+        """Test that symbols without stored events are still adjusted by the supplier."""
+        from vprism.core.data.storage.duckdb_factory import VPrismDuckDBFactory
+        from vprism.core.models.query import Adjustment
+        from vprism.core.services.corporate_actions import CorporateActionService
+
+        with VPrismDuckDBFactory().connection() as conn:
+            provider = AkShare(corporate_actions=CorporateActionService(conn))
+            calls: list[tuple[str, str]] = []
+            provider._ak = self._hist_stub(calls)
+            provider._initialized = True
+            query = DataQuery(
+                asset=AssetType.STOCK,
+                market=MarketType.CN,
+                symbols=["000001"],
+                start_date=date(2024, 1, 2),
+                end_date=date(2024, 1, 4),
+                adjustment=Adjustment.FORWARD,
+            )
+            await provider.get_data(query)
+
+        assert calls == [("qfq", "20240102")]
+
 
 class TestYFinance:
     """Test YFinance provider."""
@@ -210,6 +361,79 @@ class TestProviderRegistry:
         assert any(p.name == "akshare" for p in cn_providers)
         assert any(p.name == "yfinance" for p in us_providers)
 
+    def test_capability_index_reused_and_invalidated(self):
+        """Test that lookups are served from the capability index until registration changes."""
+        registry = ProviderRegistry()
+        akshare = AkShare()
+        yahoo = YFinance()
+        registry.register(akshare)
+        query = DataQuery(asset=AssetType.STOCK, market=MarketType.US, symbols=["AAPL"], timeframe=TimeFrame.DAY_1)
+
+        assert yahoo not in registry.find_capable_providers(query)
+
+        registry.register(yahoo)
+        capable = registry.find_capable_providers(query)
+        assert yahoo in capable
+
+        with patch.object(DataProvider, "can_handle_query", side_effect=AssertionError("per-provider scan")):
+            assert registry.find_capable_providers(query) == capable
+
+        registry.mark_unhealthy("yfinance")
+        assert yahoo not in registry.find_capable_providers(query)
+        registry.mark_healthy("yfinance")
+
+        registry.unregister("yfinance")
+        assert yahoo not in registry.find_capable_providers(query)
+
+    @pytest.mark.asyncio
+    async def test_capability_index_refresh(self):
+        """Test that refreshing capabilities rebuilds the index."""
+        registry = ProviderRegistry()
+        yahoo = YFinance()
+        registry.register(yahoo)
+        query = DataQuery(asset=AssetType.STOCK, market=MarketType.US, symbols=["AAPL"], timeframe=TimeFrame.DAY_1)
+        assert registry.find_capable_providers(query) == [yahoo]
+
+        cn_only = ProviderCapability(
+            supported_assets={"stock"},
+            supported_markets={"cn"},
+            supported_timeframes={"1d"},
+            max_symbols_per_request=10,
+            supports_real_time=False,
+            supports_historical=True,
+            data_delay_seconds=0,
+        )
+        with patch.object(YFinance, "_discover_capability", lambda self: cn_only):
+            await registry.refresh_provider_capabilities()
+            assert registry.find_capable_providers(query) == []
+
+    def test_capability_index_checks_symbol_limit_per_query(self):
+        """Test that max_symbols_per_request is still applied per query."""
+        registry = ProviderRegistry()
+        yahoo = YFinance()
+        registry.register(yahoo)
+        limit = yahoo.capability.max_symbols_per_request
+        small = DataQuery(asset=AssetType.STOCK, market=MarketType.US, symbols=["AAPL"])
+        large = small.model_copy(update={"symbols": [f"S{i}" for i in range(limit + 1)]})
+
+        assert registry.find_capable_providers(small) == [yahoo]
+        assert registry.find_capable_providers(large) == []
+
+    def test_custom_can_handle_query_is_respected(self):
+        """Test that providers overriding can_handle_query are asked per query."""
+
+        class PickyYFinance(YFinance):
+            def can_handle_query(self, query):
+                return query.symbols == ["AAPL"]
+
+        registry = ProviderRegistry()
+        picky = PickyYFinance()
+        registry.register(picky)
+        query = DataQuery(asset=AssetType.STOCK, market=MarketType.US, symbols=["AAPL"])
+
+        assert registry.find_capable_providers(query) == [picky]
+        assert registry.find_capable_providers(query.model_copy(update={"symbols": ["MSFT"]})) == []
+
     def test_register_unregister(self):
         """Test provider registration and unregistration."""
         registry = ProviderRegistry()
@@ -236,6 +460,81 @@ class TestProviderRegistry:
         registry.mark_unhealthy("akshare")
         assert registry.is_healthy("akshare") is False
 
+    def test_passive_health_from_traffic(self):
+        """Test that live call outcomes drive health without probing."""
+        registry = ProviderRegistry()
+        registry.register(AkShare())
+
+        for _ in range(4):
+            registry.record_call("akshare", success=False)
+        assert registry.is_healthy("akshare") is True
+
+        registry.record_call("akshare", success=False)
+        assert registry.is_healthy("akshare") is False
+        assert registry.provider_metadata["akshare"]["passive_calls"] == 5
+        assert registry.is_idle("akshare") is False
+
+        registry.record_call("akshare", success=True)
+        assert registry.is_healthy("akshare") is False
+        registry.record_call("unknown", success=True)
+
+    @pytest.mark.asyncio
+    async def test_health_check_probes_only_idle_providers(self):
+        """Test that providers with live traffic spend no quota on health checks."""
+        registry = ProviderRegistry()
+        registry._probe_jitter = 0.0
+        akshare = AkShare()
+        yahoo = YFinance()
+        registry.register(akshare)
+        registry.register(yahoo)
+        registry.record_call("akshare", success=True)
+
+        with (
+            patch.object(AkShare, "probe", return_value=True) as akshare_probe,
+            patch.object(YFinance, "probe", return_value=True) as yahoo_probe,
+            patch.object(DataProvider, "get_data", side_effect=AssertionError("quota spent")),
+        ):
+            await registry._check_all_providers_health()
+
+        akshare_probe.assert_not_called()
+        yahoo_probe.assert_called_once()
+        assert registry.provider_metadata["yfinance"]["health_check_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unhealthy_provider_recovers_via_probe(self):
+        """Test that a provider marked unhealthy by traffic is probed and restored."""
+        registry = ProviderRegistry()
+        registry._probe_jitter = 0.0
+        registry.register(AkShare())
+        for _ in range(5):
+            registry.record_call("akshare", success=False)
+        assert registry.is_healthy("akshare") is False
+
+        with patch.object(AkShare, "probe", return_value=True):
+            await registry._check_all_providers_health()
+
+        assert registry.is_healthy("akshare") is True
+        # a single failure after recovery does not re-trip on stale history
+        registry.record_call("akshare", success=False)
+        assert registry.is_healthy("akshare") is True
+
+    @pytest.mark.asyncio
+    async def test_health_probes_run_without_registry_lock(self):
+        """Test that slow probes do not hold the registry lock."""
+        registry = ProviderRegistry()
+        registry._probe_jitter = 0.0
+        registry.register(AkShare())
+        lock_free_during_probe = []
+
+        async def _probe(self):
+            lock_free_during_probe.append(not registry._lock.locked())
+            return True
+
+        with patch.object(AkShare, "probe", _probe):
+            await registry._check_all_providers_health()
+
+        assert lock_free_during_probe == [True]
+
     def test_provider_list(self):
         """Test provider list retrieval."""
         registry = ProviderRegistry()
@@ -6,9 +6,10 @@ from vprism.core.exceptions import ProviderError, RateLimitError
 from vprism.core.patterns import (
     ExponentialBackoffRetry,
     ResilientExecutor,
+    RetryBudget,
     RetryConfig,
 )
-from vprism.core.patterns.retry import RetryState
+from vprism.core.patterns.retry import RetryState, retry_budget_registry
 
 
 class TestRetryConfig:
@@ -149,6 +150,96 @@ class TestExponentialBackoffRetry:
         assert retry_instance.last_exception is None
 
 
+class TestRetryBudget:
+    """Test shared retry budgets and retry-after handling."""
+
+    @staticmethod
+    def _always_fail(counter: list[int]):
+        async def _func() -> None:
+            counter[0] += 1
+            raise ProviderError("down", "test_provider")
+
+        return _func
+
+    @pytest.mark.asyncio
+    async def test_budget_caps_retries_across_requests(self) -> None:
+        budget = RetryBudget(ratio=0.1, max_tokens=2.0, name="brownout")
+        config = RetryConfig(max_attempts=3, base_delay=0.0, jitter=False, budget=budget)
+        calls = [0]
+
+        for _ in range(20):
+            with pytest.raises(ProviderError):
+                await ExponentialBackoffRetry(config).execute(self._always_fail(calls))
+
+        stats = budget.get_stats()
+        assert stats["requests"] == 20
+        # 2 initial tokens plus 0.1 per request
+        assert stats["retries"] <= 4
+        assert calls[0] == 20 + stats["retries"]
+        assert stats["amplification"] == pytest.approx(calls[0] / 20)
+        assert stats["denied"] > 0
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_retry_after_is_honoured(self) -> None:
+        retry = ExponentialBackoffRetry(RetryConfig(max_attempts=3, base_delay=5.0, jitter=False))
+        calls = 0
+
+        async def limited() -> str:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RateLimitError("slow down", "test_provider", retry_after=0)
+            return "ok"
+
+        assert await retry.execute(limited) == "ok"
+        assert calls == 2
+        assert retry.total_delay == 0.0
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_without_retry_after_is_skipped(self) -> None:
+        retry = ExponentialBackoffRetry(RetryConfig(max_attempts=3, base_delay=0.0))
+        calls = 0
+
+        async def limited() -> None:
+            nonlocal calls
+            calls += 1
+            raise RateLimitError("slow down", "test_provider", retry_after=None if calls == 1 else 0)
+
+        with pytest.raises(RateLimitError):
+            await retry.execute(limited)
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_retry_after_beyond_max_delay_is_skipped(self) -> None:
+        retry = ExponentialBackoffRetry(RetryConfig(max_attempts=3, max_delay=1.0))
+
+        async def limited() -> None:
+            raise RateLimitError("come back tomorrow", "test_provider", retry_after=86400)
+
+        with pytest.raises(RateLimitError):
+            await retry.execute(limited)
+        assert retry.attempt_count == 1
+
+    @pytest.mark.asyncio
+    async def test_resilient_executors_share_budget_by_name(self) -> None:
+        calls = [0]
+        executor = ResilientExecutor(
+            "budget_circuit",
+            "budget_shared_retry",
+            circuit_config={"failure_threshold": 100, "minimum_calls": 100},
+            retry_config={"max_attempts": 2, "base_delay": 0.0},
+        )
+
+        for _ in range(15):
+            with pytest.raises(ProviderError):
+                await executor.execute(self._always_fail(calls))
+
+        stats = retry_budget_registry.get_all_stats()["budget_shared_retry"]
+        assert stats["requests"] == 15
+        assert stats["retries"] < 15
+        assert stats["denied"] > 0
+
+
 class TestResilientExecutor:
     """Test resilient executor."""
 
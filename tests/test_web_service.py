@@ -1,5 +1,6 @@
 """Test FastAPI web service endpoints."""
 
+import json
 from datetime import datetime
 from decimal import Decimal
 from unittest.mock import AsyncMock, Mock
@@ -14,6 +15,7 @@ from vprism.core.models import (
     ProviderInfo,
     ResponseMetadata,
 )
+from vprism.core.patterns.hedging import HedgedExecutor
 from vprism.web.app import create_app
 
 # ---------------------------------------------------------------------------
@@ -168,6 +170,21 @@ class TestVPrismWebService:
         data = response.json()
         assert data["success"] is True
         assert "uptime" in data["data"]
+        assert data["data"]["hedging"] is None
+
+    @pytest.mark.asyncio
+    async def test_metrics_include_hedger_stats(self, client, vprism_mock_client):
+        """Test /metrics exports hedge rate and wins next to bulkheads and retry budgets."""
+        hedger = HedgedExecutor()
+        hedger.requests, hedger.hedges_sent, hedger.hedge_wins, hedger.primary_wins = 20, 2, 1, 19
+        vprism_mock_client.hedger = hedger
+
+        response = await client.get("/api/v1/metrics")
+
+        hedging = response.json()["data"]["hedging"]
+        assert hedging["hedge_rate"] == pytest.approx(0.1)
+        assert hedging["hedge_wins"] == 1
+        assert hedging["primary_wins"] == 19
 
     # -- Data endpoints -----------------------------------------------------
 
@@ -190,6 +207,43 @@ class TestVPrismWebService:
         assert "AAPL" in data["message"]
         vprism_mock_client.execute.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_stream_stock_data(self, client, vprism_mock_client):
+        """Test GET /data/stock/{symbol}/stream emits NDJSON per data point."""
+        chunks = [
+            Mock(data=[_stock_point(close="100.0"), _stock_point(close="101.0")]),
+            Mock(data=[_stock_point(close="102.0")]),
+        ]
+
+        async def _stream(query):
+            for chunk in chunks:
+                yield chunk
+
+        vprism_mock_client.stream = _stream
+
+        response = await client.get("/api/v1/data/stock/AAPL/stream")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["close_price"] for line in lines] == ["100.0", "101.0", "102.0"]
+
+    @pytest.mark.asyncio
+    async def test_stream_stock_data_error(self, client, vprism_mock_client):
+        """Test that a mid-stream failure is reported as a final NDJSON line."""
+
+        async def _stream(query):
+            yield Mock(data=[_stock_point()])
+            raise RuntimeError("provider down")
+
+        vprism_mock_client.stream = _stream
+
+        response = await client.get("/api/v1/data/stock/AAPL/stream")
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert len(lines) == 2
+        assert lines[-1] == {"success": False, "error": "provider down"}
+
     @pytest.mark.asyncio
     async def test_post_stock_data(self, client, vprism_mock_client):
         """Test POST /data/stock."""
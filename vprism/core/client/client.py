@@ -3,15 +3,24 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from collections.abc import Coroutine
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from vprism.core.client.builder import QueryBuilder
 from vprism.core.config.settings import ConfigManager, load_config_from_env
 from vprism.core.models.market import AssetType, MarketType, TimeFrame
 from vprism.core.models.query import DataQuery
 from vprism.core.models.response import DataResponse
+from vprism.core.patterns.deadline import deadline_scope, with_deadline
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from vprism.core.data.providers.base import DataChunk
+    from vprism.core.patterns.hedging import HedgedExecutor
+    from vprism.core.services.data import DataService
 
 
 class VPrismClient:
@@ -37,6 +46,8 @@ class VPrismClient:
 
         self.registry = ProviderRegistry()
         self.router = DataRouter(self.registry)
+        self.hedger: HedgedExecutor | None = None
+        self._data_service: DataService | None = None
         self._configured = True
         self._apply_config()
 
@@ -52,6 +63,16 @@ class VPrismClient:
     def _apply_config(self) -> None:
         """Apply configuration to components."""
         from vprism.core.data.providers.factory import create_default_providers
+        from vprism.core.patterns.hedging import HedgedExecutor, HedgingPolicy
+
+        provider_config = self.config_manager.get_config().providers
+        if not provider_config.hedging:
+            self.hedger = None
+        elif self.hedger is None or self.hedger.policy.max_hedge_ratio != provider_config.hedge_budget_ratio:
+            self.hedger = HedgedExecutor(HedgingPolicy(max_hedge_ratio=provider_config.hedge_budget_ratio))
+        if self._data_service is not None:
+            self._data_service.hedger = self.hedger
+            self._data_service.provider_config = provider_config
 
         if len(self.registry) == 0:
             providers = create_default_providers()
@@ -59,6 +80,15 @@ class VPrismClient:
                 self.registry.register(provider)
             self.router.refresh_scores()
 
+    @property
+    def data_service(self) -> DataService:
+        """Data service sharing this client's router, used for cached/persisted streaming."""
+        if self._data_service is None:
+            from vprism.core.services.data import DataService
+
+            self._data_service = DataService(router=self.router, hedger=self.hedger, provider_config=self.config_manager.get_config().providers)
+        return self._data_service
+
     def query(self) -> QueryBuilder:
         """Get a query builder instance."""
         return QueryBuilder()
@@ -71,13 +101,45 @@ class VPrismClient:
 
         Returns:
             DataResponse with the query results.
+
+        Raises:
+            DeadlineExceededError: The query did not finish within ``providers.timeout`` seconds.
+        """
+        if not self._configured:
+            self._apply_config()
+
+        with deadline_scope(self.config_manager.get_config().providers.timeout):
+            if self.hedger is not None:
+                return await self.router.execute_hedged(query, self.hedger)
+
+            provider = await self.router.route_query(query)
+            async with provider.bulkhead:
+                started = time.perf_counter()
+                try:
+                    response: DataResponse = await with_deadline(provider.get_data(query))
+                except Exception:
+                    self.router.update_provider_score(provider.name, False, (time.perf_counter() - started) * 1000)
+                    raise
+                self.router.update_provider_score(provider.name, True, (time.perf_counter() - started) * 1000)
+            return response
+
+    async def stream(self, query: DataQuery) -> AsyncIterator[DataChunk]:
+        """Execute a data query incrementally.
+
+        Args:
+            query: The query to execute.
+
+        Each chunk is served from, or written to, the cache and storage as it
+        arrives (see ``DataService.stream``).
+
+        Yields:
+            DataChunk per symbol / date window, in order.
         """
         if not self._configured:
             self._apply_config()
 
-        provider = await self.router.route_query(query)
-        response: DataResponse = await provider.get_data(query)
-        return response
+        async for chunk in self.data_service.stream(query):
+            yield chunk
 
     def get(
         self,
@@ -32,6 +32,13 @@ class ProviderConfig:
     rate_limit: bool = True
     backoff_factor: float = 1.0
     max_backoff: int = 60
+    hedging: bool = False
+    hedge_budget_ratio: float = 0.1
+    # 提供商熔断器的滑动窗口阈值
+    breaker_minimum_calls: int = 10
+    breaker_failure_rate: float = 0.5
+    breaker_slow_call_duration: float = 10.0
+    breaker_slow_call_rate: float = 0.8
 
 
 @dataclass
@@ -2,17 +2,27 @@
 
 from __future__ import annotations
 
-from vprism.core.data.ingestion.config import IngestionConfig, IngestionConfigError
+from vprism.core.data.ingestion.config import ConflictPolicy, IngestionConfig, IngestionConfigError
 from vprism.core.data.ingestion.models import RawRecord
-from vprism.core.data.ingestion.service import FailureSummary, IngestionResult, ingest
+from vprism.core.data.ingestion.pipeline import IngestionPipeline, StageStats, ingest_parallel
+from vprism.core.data.ingestion.promotion import PromotionJob, PromotionResult
+from vprism.core.data.ingestion.service import FailureSummary, IngestionResult, ingest, ingest_frame, ingest_stream
 from vprism.core.data.ingestion.validator import ValidationIssue
 
 __all__ = [
+    "ConflictPolicy",
     "FailureSummary",
     "IngestionConfig",
     "IngestionConfigError",
+    "IngestionPipeline",
     "IngestionResult",
+    "PromotionJob",
+    "PromotionResult",
     "RawRecord",
+    "StageStats",
     "ValidationIssue",
     "ingest",
+    "ingest_frame",
+    "ingest_parallel",
+    "ingest_stream",
 ]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from enum import StrEnum
 
 from vprism.core.exceptions.base import VPrismError
 
@@ -14,6 +15,13 @@ class IngestionConfigError(VPrismError):
         super().__init__(message, "INGESTION_CONFIG_ERROR")
 
 
+class ConflictPolicy(StrEnum):
+    """How incremental ingestion treats rows whose natural key is already stored."""
+
+    SKIP = "skip"
+    UPSERT = "upsert"
+
+
 @dataclass(slots=True, frozen=True)
 class IngestionConfig:
     """Runtime configuration toggles controlling ingestion behaviour."""
@@ -21,6 +29,12 @@ class IngestionConfig:
     max_batch_rows: int | None = None
     enforce_monotonic_ts: bool = True
     allow_duplicates: bool = False
+    chunk_rows: int = 50_000
+    workers: int | None = None
+    queue_depth: int = 4
+    commit_rows: int = 500_000
+    # None appends every batch; a policy anti-joins on (supplier_symbol, market, ts) against stored rows
+    on_existing: ConflictPolicy | None = None
 
     def validate_batch_size(self, batch_size: int) -> None:
         """Ensure the configured batch size limit is respected."""
@@ -31,3 +45,14 @@ class IngestionConfig:
             raise IngestionConfigError("max_batch_rows must be positive when provided")
         if batch_size > self.max_batch_rows:
             raise IngestionConfigError(f"batch size {batch_size} exceeds configured limit {self.max_batch_rows}")
+
+    def stream_chunk_rows(self) -> int:
+        """Rows per chunk for streaming ingestion, capped by ``max_batch_rows``."""
+
+        if self.chunk_rows <= 0:
+            raise IngestionConfigError("chunk_rows must be positive")
+        if self.max_batch_rows is None:
+            return self.chunk_rows
+        if self.max_batch_rows <= 0:
+            raise IngestionConfigError("max_batch_rows must be positive when provided")
+        return min(self.chunk_rows, self.max_batch_rows)
@@ -0,0 +1,262 @@
+"""Parallel ingestion: symbol-partitioned validation feeding a single DuckDB writer."""
+
+from __future__ import annotations
+
+import os
+import queue
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime
+from operator import attrgetter
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
+
+import numpy as np
+import pandas as pd  # type: ignore[import-untyped]
+
+try:  # pragma: no cover - optional at runtime for typing.
+    from duckdb import DuckDBPyConnection
+except Exception:  # pragma: no cover
+    DuckDBPyConnection = "DuckDBPyConnection"  # type: ignore[misc,assignment]
+
+from vprism.core.data.ingestion.config import ConflictPolicy, IngestionConfig, IngestionConfigError
+from vprism.core.data.ingestion.service import (
+    IngestionResult,
+    _as_frame,
+    _ChunkOutcome,
+    _prepare_columns,
+    _summarise,
+    _write_in_transaction,
+)
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from vprism.core.data.ingestion.validator import ValidationIssue
+
+# Partitions per worker, so uneven symbol sizes still balance across the pool
+_PARTITIONS_PER_WORKER = 4
+_PUT_POLL_SECONDS = 0.05
+
+
+@dataclass(slots=True)
+class StageStats:
+    """Throughput counters for one pipeline stage."""
+
+    name: str
+    batches: int = 0
+    rows: int = 0
+    busy_seconds: float = 0.0
+    blocked_seconds: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, rows: int, busy_seconds: float, blocked_seconds: float = 0.0) -> None:
+        """Record one batch processed by the stage."""
+
+        with self._lock:
+            self.batches += 1
+            self.rows += rows
+            self.busy_seconds += busy_seconds
+            self.blocked_seconds += blocked_seconds
+
+    @property
+    def rows_per_second(self) -> float:
+        """Rows processed per second of busy time (summed across workers)."""
+
+        return self.rows / self.busy_seconds if self.busy_seconds > 0 else 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the current counters."""
+
+        return {
+            "batches": self.batches,
+            "rows": self.rows,
+            "busy_seconds": self.busy_seconds,
+            "blocked_seconds": self.blocked_seconds,
+            "rows_per_second": self.rows_per_second,
+        }
+
+
+class IngestionPipeline:
+    """Validate symbol partitions on a thread pool and write them through one connection.
+
+    A symbol's rows never span partitions, so the per-symbol monotonic and
+    duplicate checks need no state shared between workers. Prepared partitions
+    pass through a bounded queue, which blocks workers when the writer falls
+    behind. The calling thread is the only one touching the connection and
+    commits once at least ``config.commit_rows`` rows are pending.
+    """
+
+    def __init__(
+        self,
+        conn: DuckDBPyConnection,
+        *,
+        provider: str,
+        market: str,
+        config: IngestionConfig | None = None,
+    ) -> None:
+        self.conn = conn
+        self.provider = provider
+        self.market = market
+        self.config = config or IngestionConfig()
+        if self.config.queue_depth <= 0 or self.config.commit_rows <= 0:
+            raise IngestionConfigError("queue_depth and commit_rows must be positive")
+        self.workers = self.config.workers or os.cpu_count() or 1
+        self.stages = {name: StageStats(name) for name in ("partition", "validate", "write")}
+        self.max_queue_depth = 0
+
+    def run(self, data: Any) -> IngestionResult:
+        """Validate and persist a DataFrame or Arrow table; results match :func:`ingest_frame`."""
+
+        frame = _as_frame(data)
+        self.config.validate_batch_size(len(frame))
+
+        start = perf_counter()
+        batch_id = uuid4().hex
+        ingest_time = datetime.now(UTC)
+        partitions = self._partition(frame)
+
+        results: queue.Queue[tuple[npt.NDArray[np.intp], _ChunkOutcome] | BaseException] = queue.Queue(maxsize=self.config.queue_depth)
+        cancelled = threading.Event()
+        issues: list[ValidationIssue] = []
+        duplicate_issues: list[ValidationIssue] = []
+        commit_timings: list[float] = []
+        pending: list[Any] = []
+        pending_rows = written_rows = existing_rows = rejected_rows = duplicates_dropped = 0
+
+        pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="vprism-ingest")
+        try:
+            for positions in partitions:
+                pool.submit(self._validate, frame, positions, results, cancelled, batch_id, ingest_time)
+            for _ in partitions:
+                self.max_queue_depth = max(self.max_queue_depth, results.qsize())
+                item = results.get()
+                if isinstance(item, BaseException):
+                    raise item
+                positions, outcome = item
+                issues.extend(replace(issue, index=int(positions[issue.index])) for issue in outcome.issues)
+                duplicate_issues.extend(replace(issue, index=int(positions[issue.index])) for issue in outcome.duplicate_issues)
+                rejected_rows += outcome.rejected_rows
+                duplicates_dropped += outcome.duplicates_dropped
+                if outcome.rows is not None:
+                    pending.append(outcome.rows)
+                    pending_rows += outcome.written_rows
+                if pending_rows >= self.config.commit_rows:
+                    inserted, existing = self._commit(pending, commit_timings)
+                    written_rows += inserted
+                    existing_rows += existing
+                    pending, pending_rows = [], 0
+            if pending:
+                inserted, existing = self._commit(pending, commit_timings)
+                written_rows += inserted
+                existing_rows += existing
+        except BaseException:
+            cancelled.set()
+            raise
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+        # Partitions finish out of order; a stable sort restores row order and
+        # keeps each row's issues in validation order.
+        issues.sort(key=attrgetter("index"))
+        duplicate_issues.sort(key=attrgetter("index"))
+        issues.extend(duplicate_issues)
+
+        return IngestionResult(
+            batch_id=batch_id,
+            written_rows=written_rows,
+            rejected_rows=rejected_rows,
+            duration_ms=(perf_counter() - start) * 1000,
+            fail_reasons=_summarise(Counter(issue.code for issue in issues)),
+            issues=tuple(issues),
+            duplicates_dropped=duplicates_dropped,
+            chunk_timings_ms=tuple(commit_timings),
+            skipped_rows=existing_rows if self.config.on_existing is ConflictPolicy.SKIP else 0,
+            replaced_rows=existing_rows if self.config.on_existing is ConflictPolicy.UPSERT else 0,
+        )
+
+    def _partition(self, frame: Any) -> list[npt.NDArray[np.intp]]:
+        """Split row positions into groups holding whole symbols."""
+
+        started = perf_counter()
+        codes, uniques = pd.factorize(frame["supplier_symbol"])
+        count = max(1, min(self.workers * _PARTITIONS_PER_WORKER, len(uniques)))
+        buckets = np.where(codes < 0, 0, codes % count)
+        order = np.argsort(buckets, kind="stable")
+        bounds = np.searchsorted(buckets[order], np.arange(count + 1))
+        partitions = [order[lo:hi] for lo, hi in zip(bounds[:-1], bounds[1:], strict=True) if hi > lo]
+        self.stages["partition"].record(len(frame), perf_counter() - started)
+        return partitions
+
+    def _validate(
+        self,
+        frame: Any,
+        positions: npt.NDArray[np.intp],
+        results: queue.Queue[tuple[npt.NDArray[np.intp], _ChunkOutcome] | BaseException],
+        cancelled: threading.Event,
+        batch_id: str,
+        ingest_time: datetime,
+    ) -> None:
+        started = perf_counter()
+        item: tuple[npt.NDArray[np.intp], _ChunkOutcome] | BaseException
+        try:
+            part = frame.iloc[positions].reset_index(drop=True)
+            item = (
+                positions,
+                _prepare_columns(
+                    {name: part[name] for name in part.columns},
+                    provider=self.provider,
+                    market=self.market,
+                    config=self.config,
+                    batch_id=batch_id,
+                    ingest_time=ingest_time,
+                ),
+            )
+        except BaseException as e:  # handed to the writer thread, which re-raises it
+            item = e
+        busy = perf_counter() - started
+
+        waiting = perf_counter()
+        while not cancelled.is_set():
+            try:
+                results.put(item, timeout=_PUT_POLL_SECONDS)
+                break
+            except queue.Full:
+                continue
+        self.stages["validate"].record(len(positions), busy, perf_counter() - waiting)
+
+    def _commit(self, pending: list[Any], timings: list[float]) -> tuple[int, int]:
+        """Write pending partitions in one transaction, appending the commit time in ms to ``timings``."""
+
+        started = perf_counter()
+        rows = pd.concat(pending, ignore_index=True)
+        counts = _write_in_transaction(self.conn, rows, self.config.on_existing)
+        elapsed = perf_counter() - started
+        self.stages["write"].record(len(rows), elapsed)
+        timings.append(elapsed * 1000)
+        return counts
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get per-stage throughput counters."""
+
+        return {
+            "workers": self.workers,
+            "max_queue_depth": self.max_queue_depth,
+            "stages": {name: stage.snapshot() for name, stage in self.stages.items()},
+        }
+
+
+def ingest_parallel(
+    conn: DuckDBPyConnection,
+    data: Any,
+    *,
+    provider: str,
+    market: str,
+    config: IngestionConfig | None = None,
+) -> IngestionResult:
+    """Run :class:`IngestionPipeline` once over ``data``."""
+
+    return IngestionPipeline(conn, provider=provider, market=market, config=config).run(data)
@@ -0,0 +1,312 @@
+"""Set-based promotion of raw OHLCV batches into the normalized tables."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+import pandas as pd  # type: ignore[import-untyped]
+
+try:  # pragma: no cover - optional at runtime for typing.
+    from duckdb import DuckDBPyConnection
+except Exception:  # pragma: no cover
+    DuckDBPyConnection = "DuckDBPyConnection"  # type: ignore[misc,assignment]
+
+from vprism.core.data.schema import NORMALIZATION_BASE_TABLE, PROMOTION_QUARANTINE_TABLE, PROMOTION_WATERMARKS_TABLE, RAW_OHLCV_TABLE
+from vprism.core.data.storage.schema import create_all_tables
+from vprism.core.models.market import AssetType, MarketType
+
+if TYPE_CHECKING:
+    from vprism.core.services.symbols import SymbolService
+
+# Listing currency and exchange time zone per market.
+MARKET_CONVENTIONS: dict[MarketType, tuple[str, str]] = {
+    MarketType.CN: ("CNY", "Asia/Shanghai"),
+    MarketType.US: ("USD", "America/New_York"),
+    MarketType.HK: ("HKD", "Asia/Hong_Kong"),
+    MarketType.EU: ("EUR", "Europe/Berlin"),
+    MarketType.JP: ("JPY", "Asia/Tokyo"),
+    MarketType.UK: ("GBP", "Europe/London"),
+    MarketType.AU: ("AUD", "Australia/Sydney"),
+    MarketType.GLOBAL: ("USD", "UTC"),
+}
+
+_MAP_VIEW = "vprism_promotion_symbols"
+_STAGE_TABLE = "vprism_promotion_stage"
+
+
+@dataclass(slots=True, frozen=True)
+class PromotionResult:
+    """Outcome of one promotion run."""
+
+    job: str
+    batches: tuple[str, ...]
+    rows_promoted: int
+    unresolved_symbols: tuple[str, ...]
+    watermark: datetime | None
+    duration_ms: float
+    # Rows of unresolved symbols moved to ``promotion_quarantine`` by this run.
+    rows_quarantined: int = 0
+    # Quarantined rows promoted by this run once their symbol resolved.
+    rows_replayed: int = 0
+
+
+class PromotionJob:
+    """Promote ``raw_ohlcv`` rows into ``normalization_schema`` and ``ohlcv``.
+
+    Each raw batch is promoted in one transaction: its distinct supplier symbols
+    are resolved through :class:`SymbolService` in a single call, joined back in
+    DuckDB and written to both tables with set-based statements. Incremental
+    runs follow a per-job watermark on ``(ingest_time, batch_id)`` that advances
+    in the same transaction, so an interrupted run resumes at the first
+    unpromoted batch. Rows whose symbol does not resolve are recorded per
+    ``(batch_id, supplier_symbol)`` in ``promotion_quarantine`` and the watermark
+    moves on; each run first replays the quarantined symbols that resolve now.
+    Re-promoting a batch replaces its rows.
+    """
+
+    def __init__(
+        self,
+        conn: DuckDBPyConnection,
+        symbol_service: SymbolService,
+        *,
+        market: MarketType,
+        asset_type: AssetType,
+        timeframe: str = "1d",
+        job: str | None = None,
+    ) -> None:
+        self.conn = conn
+        self.symbol_service = symbol_service
+        self.market = market
+        self.asset_type = asset_type
+        self.timeframe = timeframe
+        self.job = job or f"{market.value}:{asset_type.value}:{timeframe}"
+        self.currency, self.timezone = MARKET_CONVENTIONS[market]
+        for table in (RAW_OHLCV_TABLE, NORMALIZATION_BASE_TABLE, PROMOTION_WATERMARKS_TABLE, PROMOTION_QUARANTINE_TABLE):
+            table.ensure(conn)
+        create_all_tables(conn)
+
+    def watermark(self) -> tuple[datetime, str] | None:
+        """Return the last promoted ``(ingest_time, batch_id)``, if any."""
+
+        row = self.conn.execute("SELECT ingest_time, batch_id FROM promotion_watermarks WHERE job = ?", [self.job]).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def quarantined(self) -> list[tuple[str, str, int]]:
+        """Return the quarantined ``(batch_id, supplier_symbol, rows)`` of this job."""
+
+        rows = self.conn.execute(
+            "SELECT batch_id, supplier_symbol, row_count FROM promotion_quarantine WHERE job = ? ORDER BY quarantined_at, batch_id, supplier_symbol",
+            [self.job],
+        ).fetchall()
+        return [(row[0], row[1], int(row[2])) for row in rows]
+
+    def run(
+        self,
+        *,
+        batch_id: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        max_batches: int | None = None,
+    ) -> PromotionResult:
+        """Replay resolvable quarantined rows, then promote pending batches, or only ``batch_id`` when given.
+
+        ``start``/``end`` bound the bar timestamps promoted from each batch. Runs
+        with an explicit ``batch_id`` or a ``start``/``end`` window leave the
+        watermark untouched, and windowed runs leave the quarantine alone, since
+        rows outside the window were not promoted.
+        """
+
+        started = perf_counter()
+        whole = start is None and end is None
+        replayed = self._replay_quarantine() if batch_id is None and whole else 0
+        batches = self._pending_batches(batch_id, max_batches)
+        promoted = 0
+        quarantined = 0
+        unresolved: set[str] = set()
+        for batch, ingest_time in batches:
+            self.conn.execute("BEGIN TRANSACTION")
+            try:
+                rows, missing = self._promote_batch(batch, start, end)
+                if whole:
+                    quarantined += self._quarantine(batch, missing)
+                if batch_id is None and whole:
+                    self.conn.execute(
+                        "INSERT OR REPLACE INTO promotion_watermarks VALUES (?, ?, ?, ?, ?)",
+                        [self.job, ingest_time, batch, rows, datetime.now(UTC)],
+                    )
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            promoted += rows
+            unresolved.update(missing)
+
+        mark = self.watermark()
+        return PromotionResult(
+            job=self.job,
+            batches=tuple(batch for batch, _ in batches),
+            rows_promoted=promoted,
+            unresolved_symbols=tuple(sorted(unresolved)),
+            watermark=mark[0] if mark else None,
+            duration_ms=(perf_counter() - started) * 1000,
+            rows_quarantined=quarantined,
+            rows_replayed=replayed,
+        )
+
+    def _quarantine(self, batch_id: str, missing: list[str]) -> int:
+        """Make the quarantine of a fully promoted batch hold exactly its unresolved symbols; returns their row count."""
+
+        self.conn.execute(
+            "DELETE FROM promotion_quarantine WHERE job = ? AND batch_id = ? AND NOT list_contains(?, supplier_symbol)",
+            [self.job, batch_id, missing],
+        )
+        if not missing:
+            return 0
+        row = self.conn.execute(
+            """
+            INSERT OR REPLACE INTO promotion_quarantine
+            SELECT ?, batch_id, trim(supplier_symbol) AS symbol, count(*), ?
+            FROM raw_ohlcv WHERE batch_id = ? AND market = ? AND list_contains(?, trim(supplier_symbol))
+            GROUP BY batch_id, symbol
+            RETURNING row_count
+            """,
+            [self.job, datetime.now(UTC).replace(tzinfo=None), batch_id, self.market.value, missing],
+        ).fetchall()
+        return sum(int(r[0]) for r in row)
+
+    def _replay_quarantine(self) -> int:
+        """Promote the quarantined rows whose symbols resolve now; returns the rows promoted."""
+
+        entries = self.quarantined()
+        if not entries:
+            return 0
+        resolution = self.symbol_service.normalize_batch(sorted({symbol for _, symbol, _ in entries}), self.market, self.asset_type)
+        resolved = {item.raw_symbol for item in resolution.items if item.canonical is not None}
+        by_batch: dict[str, list[str]] = defaultdict(list)
+        for batch, symbol, _ in entries:
+            if symbol in resolved:
+                by_batch[batch].append(symbol)
+
+        replayed = 0
+        for batch, symbols in by_batch.items():
+            self.conn.execute("BEGIN TRANSACTION")
+            try:
+                rows, _ = self._promote_batch(batch, None, None, symbols)
+                self.conn.execute(
+                    "DELETE FROM promotion_quarantine WHERE job = ? AND batch_id = ? AND list_contains(?, supplier_symbol)",
+                    [self.job, batch, symbols],
+                )
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            replayed += rows
+        return replayed
+
+    def _pending_batches(self, batch_id: str | None, max_batches: int | None) -> list[tuple[str, datetime]]:
+        query = "SELECT batch_id, max(ingest_time) AS ingest_time FROM raw_ohlcv WHERE market = ?"
+        params: list[object] = [self.market.value]
+        if batch_id is not None:
+            query += " AND batch_id = ?"
+            params.append(batch_id)
+        query += " GROUP BY batch_id"
+        mark = self.watermark() if batch_id is None else None
+        if mark is not None:
+            query += " HAVING max(ingest_time) > ? OR (max(ingest_time) = ? AND batch_id > ?)"
+            params.extend([mark[0], mark[0], mark[1]])
+        query += " ORDER BY ingest_time, batch_id"
+        if max_batches is not None:
+            query += f" LIMIT {int(max_batches)}"
+        return [(row[0], row[1]) for row in self.conn.execute(query, params).fetchall()]
+
+    def _promote_batch(self, batch_id: str, start: datetime | None, end: datetime | None, symbols: list[str] | None = None) -> tuple[int, list[str]]:
+        """Stage, resolve and write one batch, or only its ``symbols``; returns (rows promoted, unresolved symbols)."""
+
+        filters = "r.batch_id = ? AND r.market = ?"
+        params: list[object] = [batch_id, self.market.value]
+        if symbols is not None:
+            filters += " AND list_contains(?, trim(r.supplier_symbol))"
+            params.append(symbols)
+        if start is not None:
+            filters += " AND r.ts >= ?"
+            params.append(_naive_utc(start))
+        if end is not None:
+            filters += " AND r.ts <= ?"
+            params.append(_naive_utc(end))
+
+        raw_symbols = [row[0] for row in self.conn.execute(f"SELECT DISTINCT r.supplier_symbol FROM raw_ohlcv r WHERE {filters}", params).fetchall()]
+        resolution = self.symbol_service.normalize_batch(raw_symbols, self.market, self.asset_type)
+        mapping = pd.DataFrame(
+            {
+                "supplier_symbol": [item.raw_symbol for item in resolution.items if item.canonical is not None],
+                "c_symbol": [item.canonical.canonical for item in resolution.items if item.canonical is not None],
+            },
+            dtype=object,
+        )
+        missing = [item.raw_symbol for item in resolution.items if item.canonical is None]
+        if mapping.empty:
+            return 0, missing
+
+        self.conn.register(_MAP_VIEW, mapping)
+        try:
+            # Several supplier spellings can resolve to one canonical symbol; keep one row per bar.
+            self.conn.execute(
+                f"""
+                CREATE OR REPLACE TEMP TABLE {_STAGE_TABLE} AS
+                SELECT r.supplier_symbol, r.ts, r.open, r.high, r.low, r.close, r.volume, r.provider, r.market,
+                       date_diff('minute', r.ts, timezone(?, timezone('UTC', r.ts)))::INTEGER AS tz_offset,
+                       m.c_symbol
+                FROM raw_ohlcv r JOIN {_MAP_VIEW} m ON trim(r.supplier_symbol) = m.supplier_symbol
+                WHERE {filters}
+                QUALIFY row_number() OVER (PARTITION BY m.c_symbol, r.ts, r.provider ORDER BY r.supplier_symbol) = 1
+                """,
+                [self.timezone, *params],
+            )
+        finally:
+            self.conn.unregister(_MAP_VIEW)
+
+        try:
+            self.conn.execute(
+                f"""
+                DELETE FROM normalization_schema n USING {_STAGE_TABLE} s
+                WHERE n.c_symbol = s.c_symbol AND n.timestamp = s.ts AND n.provider = s.provider
+                """
+            )
+            self.conn.execute(
+                f"""
+                INSERT INTO normalization_schema
+                    (supplier_symbol, timestamp, open, high, low, close, volume, provider, market, tz_offset, currency, c_symbol)
+                SELECT supplier_symbol, ts, open, high, low, close, volume, provider, market, tz_offset, ?, c_symbol
+                FROM {_STAGE_TABLE}
+                """,
+                [self.currency],
+            )
+            self.conn.execute(
+                f"""
+                INSERT OR IGNORE INTO assets (symbol, market, name, asset_type, currency, exchange_tz)
+                SELECT DISTINCT c_symbol, market, c_symbol, ?, ?, ? FROM {_STAGE_TABLE}
+                """,
+                [self.asset_type.value, self.currency, self.timezone],
+            )
+            self.conn.execute(
+                f"""
+                INSERT OR REPLACE INTO ohlcv (symbol, market, ts, timeframe, provider, open, high, low, close, volume, batch_id)
+                SELECT c_symbol, market, ts, ?, provider, open, high, low, close, round(volume)::BIGINT, ?
+                FROM {_STAGE_TABLE}
+                """,
+                [self.timeframe, batch_id],
+            )
+            row = self.conn.execute(f"SELECT count(*) FROM {_STAGE_TABLE}").fetchone()
+        finally:
+            self.conn.execute(f"DROP TABLE IF EXISTS {_STAGE_TABLE}")
+        return (int(row[0]) if row else 0), missing
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """``raw_ohlcv.ts`` stores naive UTC; convert aware bounds to match."""
+
+    return value.astimezone(UTC).replace(tzinfo=None) if value.tzinfo else value
@@ -4,24 +4,32 @@ from __future__ import annotations
 
 from collections import Counter
 from collections.abc import Iterable, Sequence  # noqa: TC003
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
+from itertools import batched
 from time import perf_counter
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
+import numpy as np
+import pandas as pd  # type: ignore[import-untyped]
+
 try:  # pragma: no cover - optional at runtime for typing.
     from duckdb import DuckDBPyConnection
 except Exception:  # pragma: no cover
     DuckDBPyConnection = "DuckDBPyConnection"  # type: ignore[misc,assignment]
 
-from vprism.core.data.ingestion.config import IngestionConfig
+from vprism.core.data.ingestion.config import ConflictPolicy, IngestionConfig
 from vprism.core.data.ingestion.validator import (
+    Column,
     ValidatedRecord,
     ValidationIssue,
+    timestamp_index,
     validate_batch,
+    validate_columns,
 )
 from vprism.core.data.schema import RAW_OHLCV_TABLE
+from vprism.core.exceptions.base import DataValidationError
 
 if TYPE_CHECKING:
     from vprism.core.data.ingestion.models import RawRecord
@@ -46,6 +54,9 @@ class IngestionResult:
     fail_reasons: tuple[FailureSummary, ...]
     issues: tuple[ValidationIssue, ...]
     duplicates_dropped: int = 0
+    chunk_timings_ms: tuple[float, ...] = ()
+    skipped_rows: int = 0
+    replaced_rows: int = 0
 
 
 def _prepare_rows(
@@ -77,6 +88,13 @@ def _prepare_rows(
     return rows
 
 
+_INSERT_COLUMNS = "supplier_symbol, market, ts, open, high, low, close, volume, provider, batch_id, ingest_time"
+_FRAME_COLUMNS = ("supplier_symbol", "timestamp", "open", "high", "low", "close")
+_FRAME_VIEW = "vprism_ingest_frame"
+_DUPLICATE_MESSAGE = "duplicate supplier_symbol/market/timestamp within batch"
+_KEY_MATCH = "r.supplier_symbol = s.supplier_symbol AND r.market = s.market AND r.ts = s.ts"
+
+
 def _summarise(counter: Counter[str]) -> tuple[FailureSummary, ...]:
     summaries = [FailureSummary(code=code, count=count) for code, count in counter.items()]
     summaries.sort(key=lambda item: (-item.count, item.code))
@@ -128,7 +146,7 @@ def ingest(
                     index=validated_record.index,
                     field="timestamp",
                     code="DUPLICATE_ROW",
-                    message="duplicate supplier_symbol/market/timestamp within batch",
+                    message=_DUPLICATE_MESSAGE,
                     fatal=is_fatal,
                 )
             )
@@ -144,14 +162,15 @@ def ingest(
         ingest_time=ingest_time,
     )
 
-    written_rows = 0
-    if rows_to_insert:
+    written_rows = existing_rows = 0
+    if rows_to_insert and config.on_existing is not None:
+        frame = pd.DataFrame(rows_to_insert, columns=_INSERT_COLUMNS.split(", "))
+        frame["ts"] = timestamp_index(frame["ts"].to_numpy(dtype=object))
+        written_rows, existing_rows = _write_in_transaction(conn, frame, config.on_existing)
+    elif rows_to_insert:
         RAW_OHLCV_TABLE.ensure(conn)
         conn.executemany(
-            (
-                "INSERT INTO raw_ohlcv (supplier_symbol, market, ts, open, high, low, close, volume, provider, batch_id, ingest_time) "
-                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
-            ),
+            f"INSERT INTO raw_ohlcv ({_INSERT_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
             rows_to_insert,
         )
         written_rows = len(rows_to_insert)
@@ -167,4 +186,390 @@ def ingest(
         fail_reasons=_summarise(issue_counter),
         issues=tuple(issues),
         duplicates_dropped=duplicates_dropped,
+        skipped_rows=existing_rows if config.on_existing is ConflictPolicy.SKIP else 0,
+        replaced_rows=existing_rows if config.on_existing is ConflictPolicy.UPSERT else 0,
+    )
+
+
+def _as_frame(data: Any) -> Any:
+    """Accept a pandas DataFrame or anything exposing ``to_pandas`` (e.g. a pyarrow Table)."""
+
+    if isinstance(data, pd.DataFrame):
+        frame = data
+    elif hasattr(data, "to_pandas"):
+        frame = data.to_pandas()
+    else:
+        raise DataValidationError(f"unsupported frame type {type(data).__name__}")
+    missing = [column for column in _FRAME_COLUMNS if column not in frame.columns]
+    if missing:
+        raise DataValidationError(
+            f"frame is missing required columns: {', '.join(missing)}",
+            validation_errors={"missing_columns": missing},
+        )
+    return frame.reset_index(drop=True)
+
+
+@dataclass(slots=True)
+class _StreamState:
+    """Per-symbol state carried across the chunks of one stream."""
+
+    last_timestamps: dict[Any, int] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class _ChunkOutcome:
+    written_rows: int
+    rejected_rows: int
+    duplicates_dropped: int
+    issues: list[ValidationIssue]
+    duplicate_issues: list[ValidationIssue]
+    rows: Any | None = None
+    # Chunk row position of each row in ``rows``.
+    positions: Any | None = None
+
+
+def _prepare_columns(
+    columns: dict[str, Column],
+    *,
+    provider: str,
+    market: str,
+    config: IngestionConfig,
+    batch_id: str,
+    ingest_time: datetime,
+    offset: int = 0,
+    state: _StreamState | None = None,
+) -> _ChunkOutcome:
+    """Validate, dedupe and normalise one columnar chunk into ``raw_ohlcv`` rows.
+
+    Issue indexes are shifted by ``offset``. Duplicate-row issues are returned
+    separately so callers can list them after all validation issues, as
+    :func:`ingest` does. Touches no connection, so it is safe to run in workers.
+    """
+
+    size = len(columns["supplier_symbol"])
+    validation = validate_columns(
+        supplier_symbol=columns["supplier_symbol"],
+        timestamp=columns["timestamp"],
+        open=columns["open"],
+        high=columns["high"],
+        low=columns["low"],
+        close=columns["close"],
+        volume=columns.get("volume", [None] * size),
+        market=market,
+        enforce_monotonic_ts=config.enforce_monotonic_ts,
+        carry=state.last_timestamps if state is not None else None,
+    )
+    issues = validation.issues
+    accepted = validation.valid.copy()
+
+    rows = np.flatnonzero(accepted)
+    keys = pd.DataFrame(
+        {
+            "supplier_symbol": _values(columns["supplier_symbol"])[rows],
+            "timestamp": timestamp_index(_values(columns["timestamp"])[rows]),
+        }
+    )
+    duplicated = np.array(keys.duplicated(keep="first"), dtype=bool)
+    duplicate_rows = rows[duplicated]
+    is_fatal = not config.allow_duplicates
+    duplicate_issues = [
+        ValidationIssue(index=row + offset, field="timestamp", code="DUPLICATE_ROW", message=_DUPLICATE_MESSAGE, fatal=is_fatal)
+        for row in duplicate_rows.tolist()
+    ]
+    accepted[duplicate_rows] = False
+
+    written_rows = int(accepted.sum())
+    insert = None
+    if written_rows:
+        provider_values = _values(columns["provider"])[accepted] if "provider" in columns else None
+        insert = pd.DataFrame(
+            {
+                "supplier_symbol": _values(columns["supplier_symbol"])[accepted],
+                "market": market,
+                "ts": keys.loc[~duplicated, "timestamp"].reset_index(drop=True),
+                **{field: validation.prices[field][accepted] for field in ("open", "high", "low", "close")},
+                "volume": validation.volume[accepted],
+                "provider": provider if provider_values is None else pd.Series(provider_values).fillna(provider).to_numpy(),
+                "batch_id": batch_id,
+                "ingest_time": ingest_time,
+            }
+        )
+
+    if offset:
+        issues = [replace(issue, index=issue.index + offset) for issue in issues]
+    return _ChunkOutcome(
+        written_rows=written_rows,
+        rejected_rows=size - int(validation.valid.sum()) + (int(duplicate_rows.size) if is_fatal else 0),
+        duplicates_dropped=int(duplicate_rows.size),
+        issues=issues,
+        duplicate_issues=duplicate_issues,
+        rows=insert,
+        positions=np.flatnonzero(accepted) if insert is not None else None,
+    )
+
+
+def _drop_written_keys(
+    conn: DuckDBPyConnection,
+    outcome: _ChunkOutcome,
+    *,
+    batch_id: str,
+    config: IngestionConfig,
+    offset: int,
+    skipped: str | None = None,
+) -> None:
+    """Mark chunk rows whose key an earlier chunk of ``batch_id`` already took as duplicates; in place.
+
+    Earlier keys are found with an anti-join against the batch's rows in
+    ``raw_ohlcv``, plus the ``skipped`` temp table of keys that
+    :attr:`ConflictPolicy.SKIP` left unwritten; this chunk's skipped keys are
+    appended to it. No per-key state is kept in Python between chunks.
+    """
+
+    if outcome.rows is None or outcome.positions is None:
+        return
+    RAW_OHLCV_TABLE.ensure(conn)
+    rows, positions = outcome.rows, outcome.positions
+    conn.register(_FRAME_VIEW, rows.assign(position=np.arange(len(rows))))
+    try:
+        source = f"(SELECT position, supplier_symbol, market, ts::TIMESTAMP AS ts FROM {_FRAME_VIEW}) s"
+        bounds = list(conn.execute(f"SELECT epoch_us(min(ts)), epoch_us(max(ts)) FROM {source}").fetchone() or (None, None))
+        stored = f"SELECT 1 FROM raw_ohlcv r WHERE r.ts BETWEEN make_timestamp(?) AND make_timestamp(?) AND {_KEY_MATCH}"
+        taken = f"EXISTS ({stored} AND r.batch_id = ?)"
+        if skipped is not None:
+            taken += f" OR EXISTS (SELECT 1 FROM {skipped} r WHERE {_KEY_MATCH})"
+        found = [row[0] for row in conn.execute(f"SELECT position FROM {source} WHERE {taken} ORDER BY position", [*bounds, batch_id]).fetchall()]
+        if skipped is not None:
+            conn.execute(
+                f"INSERT INTO {skipped} SELECT supplier_symbol, market, ts FROM {source} WHERE NOT list_contains(?, position) AND EXISTS ({stored})",
+                [found, *bounds],
+            )
+    finally:
+        conn.unregister(_FRAME_VIEW)
+    if not found:
+        return
+
+    hits = np.array(found, dtype=np.intp)
+    is_fatal = not config.allow_duplicates
+    outcome.duplicate_issues = sorted(
+        outcome.duplicate_issues
+        + [
+            ValidationIssue(index=int(row) + offset, field="timestamp", code="DUPLICATE_ROW", message=_DUPLICATE_MESSAGE, fatal=is_fatal)
+            for row in positions[hits].tolist()
+        ],
+        key=lambda issue: issue.index,
+    )
+    keep = np.ones(len(rows), dtype=bool)
+    keep[hits] = False
+    outcome.rows = rows[keep].reset_index(drop=True) if keep.any() else None
+    outcome.positions = positions[keep] if keep.any() else None
+    outcome.written_rows -= int(hits.size)
+    outcome.duplicates_dropped += int(hits.size)
+    if is_fatal:
+        outcome.rejected_rows += int(hits.size)
+
+
+def _write_rows(conn: DuckDBPyConnection, rows: Any, on_existing: ConflictPolicy | None = None) -> tuple[int, int]:
+    """Insert a normalised ``raw_ohlcv`` frame through a registered DuckDB view.
+
+    Returns ``(inserted, existing)``, where ``existing`` counts incoming rows
+    whose natural key was already stored. With :attr:`ConflictPolicy.SKIP`
+    those rows are anti-joined away; with :attr:`ConflictPolicy.UPSERT` the
+    stored rows are deleted first, so the caller must hold a transaction.
+    """
+
+    RAW_OHLCV_TABLE.ensure(conn)
+    conn.register(_FRAME_VIEW, rows)
+    try:
+        # Cast once so key comparisons see exactly what the insert stores.
+        source = f"(SELECT * REPLACE (ts::TIMESTAMP AS ts) FROM {_FRAME_VIEW}) s"
+        insert = f"INSERT INTO raw_ohlcv ({_INSERT_COLUMNS}) SELECT {_INSERT_COLUMNS} FROM {source}"
+        if on_existing is None:
+            return _count(conn.execute(insert)), 0
+        # Bounding r.ts to the batch's range lets DuckDB skip row groups by zone map
+        # before the key join, so the check scales with the batch rather than the table.
+        bounds = list(conn.execute(f"SELECT epoch_us(min(ts)), epoch_us(max(ts)) FROM {source}").fetchone() or (None, None))
+        stored = f"SELECT 1 FROM raw_ohlcv r WHERE r.ts BETWEEN make_timestamp(?) AND make_timestamp(?) AND {_KEY_MATCH}"
+        existing = _count(conn.execute(f"SELECT count(*) FROM {source} WHERE EXISTS ({stored})", bounds))
+        if on_existing is ConflictPolicy.UPSERT:
+            conn.execute(
+                f"DELETE FROM raw_ohlcv r WHERE r.ts BETWEEN make_timestamp(?) AND make_timestamp(?) AND EXISTS (SELECT 1 FROM {source} WHERE {_KEY_MATCH})",
+                bounds,
+            )
+            return _count(conn.execute(insert)), existing
+        return _count(conn.execute(f"{insert} WHERE NOT EXISTS ({stored})", bounds)), existing
+    finally:
+        conn.unregister(_FRAME_VIEW)
+
+
+def _write_in_transaction(conn: DuckDBPyConnection, rows: Any, on_existing: ConflictPolicy | None) -> tuple[int, int]:
+    conn.execute("BEGIN TRANSACTION")
+    try:
+        counts = _write_rows(conn, rows, on_existing)
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    return counts
+
+
+def _count(cursor: Any) -> int:
+    row = cursor.fetchone()
+    return int(row[0]) if row else 0
+
+
+def _values(column: Column) -> Any:
+    """Column as a NumPy array without converting element types."""
+
+    if isinstance(column, list | tuple):
+        values = np.empty(len(column), dtype=object)
+        values[:] = column
+        return values
+    return np.asarray(column)
+
+
+def ingest_frame(
+    conn: DuckDBPyConnection,
+    data: Any,
+    *,
+    provider: str,
+    market: str,
+    config: IngestionConfig | None = None,
+) -> IngestionResult:
+    """Validate and persist a columnar batch without materialising ``RawRecord`` objects.
+
+    ``data`` is a pandas DataFrame or Arrow table with the ``RawRecord`` field
+    names as columns; ``volume`` and ``provider`` are optional. Validation,
+    in-batch dedupe and the insert all run on whole columns, and issue indexes
+    are row positions. Results match :func:`ingest` for the same rows.
+    """
+
+    config = config or IngestionConfig()
+
+    frame = _as_frame(data)
+    config.validate_batch_size(len(frame))
+
+    start = perf_counter()
+    batch_id = uuid4().hex
+    outcome = _prepare_columns(
+        {name: frame[name] for name in frame.columns},
+        provider=provider,
+        market=market,
+        config=config,
+        batch_id=batch_id,
+        ingest_time=datetime.now(UTC),
+    )
+    written_rows = existing_rows = 0
+    if outcome.rows is not None:
+        written_rows, existing_rows = _write_in_transaction(conn, outcome.rows, config.on_existing)
+    duration_ms = (perf_counter() - start) * 1000
+    issues = outcome.issues + outcome.duplicate_issues
+
+    return IngestionResult(
+        batch_id=batch_id,
+        written_rows=written_rows,
+        rejected_rows=outcome.rejected_rows,
+        duration_ms=duration_ms,
+        fail_reasons=_summarise(Counter(issue.code for issue in issues)),
+        issues=tuple(issues),
+        duplicates_dropped=outcome.duplicates_dropped,
+        skipped_rows=existing_rows if config.on_existing is ConflictPolicy.SKIP else 0,
+        replaced_rows=existing_rows if config.on_existing is ConflictPolicy.UPSERT else 0,
+    )
+
+
+def ingest_stream(
+    conn: DuckDBPyConnection,
+    records: Iterable[RawRecord],
+    *,
+    provider: str,
+    market: str,
+    config: IngestionConfig | None = None,
+) -> IngestionResult:
+    """Validate and persist an unbounded record iterator in fixed-size chunks.
+
+    Records are consumed ``config.chunk_rows`` at a time. Each chunk is inserted
+    in its own transaction. Monotonic-timestamp state carries across chunk
+    boundaries exactly (one timestamp per symbol), and each chunk is deduped
+    against the rows earlier chunks wrote under the stream's batch id with an
+    anti-join in DuckDB (plus a temp table of the keys
+    :attr:`ConflictPolicy.SKIP` left unwritten), so Python memory stays flat
+    and results match :func:`ingest` whether or not timestamps are monotonic.
+    All chunks share one batch id and issue indexes are positions in the whole stream.
+    """
+
+    config = config or IngestionConfig()
+    chunk_rows = config.stream_chunk_rows()
+
+    start = perf_counter()
+    batch_id = uuid4().hex
+    ingest_time = datetime.now(UTC)
+    state = _StreamState()
+    issues: list[ValidationIssue] = []
+    duplicate_issues: list[ValidationIssue] = []
+    chunk_timings: list[float] = []
+    written_rows = existing_rows = rejected_rows = duplicates_dropped = offset = 0
+    # Keys SKIP left unwritten are not in the batch's rows; later chunks check them here.
+    skipped = f"vprism_stream_skipped_{batch_id}" if config.on_existing is ConflictPolicy.SKIP else None
+    if skipped is not None:
+        conn.execute(f"CREATE TEMP TABLE {skipped} (supplier_symbol VARCHAR, market VARCHAR, ts TIMESTAMP)")
+
+    try:
+        for chunk in batched(records, chunk_rows, strict=False):
+            chunk_start = perf_counter()
+            columns: dict[str, Column] = {
+                "supplier_symbol": [record.supplier_symbol for record in chunk],
+                "timestamp": [record.timestamp for record in chunk],
+                "open": [record.open for record in chunk],
+                "high": [record.high for record in chunk],
+                "low": [record.low for record in chunk],
+                "close": [record.close for record in chunk],
+                "volume": [record.volume for record in chunk],
+                "provider": [record.provider for record in chunk],
+            }
+            conn.execute("BEGIN TRANSACTION")
+            try:
+                outcome = _prepare_columns(
+                    columns,
+                    provider=provider,
+                    market=market,
+                    config=config,
+                    batch_id=batch_id,
+                    ingest_time=ingest_time,
+                    offset=offset,
+                    state=state,
+                )
+                _drop_written_keys(conn, outcome, batch_id=batch_id, config=config, offset=offset, skipped=skipped)
+                inserted = existing = 0
+                if outcome.rows is not None:
+                    inserted, existing = _write_rows(conn, outcome.rows, config.on_existing)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            offset += len(chunk)
+            written_rows += inserted
+            existing_rows += existing
+            rejected_rows += outcome.rejected_rows
+            duplicates_dropped += outcome.duplicates_dropped
+            issues.extend(outcome.issues)
+            duplicate_issues.extend(outcome.duplicate_issues)
+            chunk_timings.append((perf_counter() - chunk_start) * 1000)
+    finally:
+        if skipped is not None:
+            conn.execute(f"DROP TABLE IF EXISTS {skipped}")
+
+    duration_ms = (perf_counter() - start) * 1000
+    issues.extend(duplicate_issues)
+
+    return IngestionResult(
+        batch_id=batch_id,
+        written_rows=written_rows,
+        rejected_rows=rejected_rows,
+        duration_ms=duration_ms,
+        fail_reasons=_summarise(Counter(issue.code for issue in issues)),
+        issues=tuple(issues),
+        duplicates_dropped=duplicates_dropped,
+        chunk_timings_ms=tuple(chunk_timings),
+        skipped_rows=existing_rows if config.on_existing is ConflictPolicy.SKIP else 0,
+        replaced_rows=existing_rows if config.on_existing is ConflictPolicy.UPSERT else 0,
     )
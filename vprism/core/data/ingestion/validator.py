@@ -3,17 +3,20 @@
 from __future__ import annotations
 
 from collections.abc import Sequence  # noqa: TC003
-from dataclasses import dataclass
-from math import isfinite
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any
 
-from vprism.core.data.ingestion.models import RawRecord
+import numpy as np
+import pandas as pd  # type: ignore[import-untyped]
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from vprism.core.data.ingestion.models import RawRecord
 
 _DEFAULT_VOLUME = -1.0
 _EPSILON = 1e-12
-
-if TYPE_CHECKING:
-    from datetime import datetime
+_PRICE_FIELDS = ("open", "high", "low", "close")
 
 
 @dataclass(slots=True, frozen=True)
@@ -35,24 +38,209 @@ class ValidatedRecord:
     record: RawRecord
 
 
-def _is_missing(value: object) -> bool:
-    return value is None
+# A column is a Python sequence, a NumPy array or a pandas Series
+type Column = Sequence[Any] | npt.NDArray[Any]
 
 
-def _ensure_finite(value: float) -> bool:
-    return isfinite(value)
-
+@dataclass(slots=True, frozen=True)
+class ColumnarValidation:
+    """Outcome of validating a batch held as columns."""
 
-def _violates_low_high(low: float, high: float) -> bool:
-    return (low - high) > _EPSILON
+    valid: npt.NDArray[np.bool_]
+    prices: dict[str, npt.NDArray[np.float64]]
+    volume: npt.NDArray[np.float64]
+    issues: list[ValidationIssue]
 
 
-def _above_high(value: float, high: float) -> bool:
-    return (value - high) > _EPSILON
+@dataclass(slots=True, frozen=True)
+class _Check:
+    field: str
+    code: str
+    message: str
+    fatal: bool = True
 
 
-def _below_low(value: float, low: float) -> bool:
-    return (low - value) > _EPSILON
+def _object_column(values: Column) -> npt.NDArray[Any]:
+    if not isinstance(values, list | tuple):
+        return np.asarray(values, dtype=object)
+    column: npt.NDArray[Any] = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+def _null_mask(values: Column) -> npt.NDArray[np.bool_]:
+    """Missing-value mask: ``None`` for Python sequences, any null marker for array columns."""
+
+    if isinstance(values, list | tuple):
+        return np.fromiter((value is None for value in values), dtype=bool, count=len(values))
+    return np.asarray(pd.isna(values), dtype=bool)
+
+
+def _numeric_column(values: Column) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.bool_]]:
+    """Float column with NaN for missing values, plus the missing-value mask."""
+
+    if not isinstance(values, list | tuple):
+        return np.array(pd.to_numeric(values, errors="coerce"), dtype=np.float64), _null_mask(values)
+    column = np.array(values, dtype=np.float64)
+    missing = np.isnan(column)
+    # ``None`` and NaN both become NaN; only the (rare) NaN rows need a second look.
+    for row in np.flatnonzero(missing).tolist():
+        missing[row] = values[row] is None
+    return column, missing
+
+
+def _timestamp_ordinals(values: Column) -> npt.NDArray[np.int64]:
+    """Timestamps as sortable integers; timezone-aware values compare in UTC."""
+
+    return np.asarray(timestamp_index(values).as_unit("ns").asi8, dtype=np.int64)
+
+
+def timestamp_index(values: Column) -> Any:
+    """Timestamps as a ``DatetimeIndex``; mixed timezone offsets are converted to UTC."""
+
+    try:
+        return pd.DatetimeIndex(values)
+    except (TypeError, ValueError):
+        return pd.DatetimeIndex(pd.to_datetime(values, utc=True))
+
+
+def _non_monotonic(
+    symbols: npt.NDArray[Any],
+    ordinals: npt.NDArray[np.int64],
+    fatal: npt.NDArray[np.bool_],
+    keyed: npt.NDArray[np.bool_],
+    carry: dict[Any, int] | None = None,
+) -> npt.NDArray[np.bool_]:
+    """Rows whose timestamp moves backwards within their symbol.
+
+    Matches the sequential rule: a passing row advances the symbol's last
+    timestamp, a rejected row never does, and a row already fatal for another
+    reason resets it to its own timestamp. Between resets the last timestamp is
+    therefore the running maximum of the segment, computed here per
+    (symbol, segment) with one ``maximum.accumulate`` over offset dense ranks.
+
+    ``carry`` holds each symbol's last timestamp from earlier chunks; it seeds
+    the state like a reset row and is updated in place with this chunk's state.
+    """
+
+    result = np.zeros(len(fatal), dtype=bool)
+    rows = np.flatnonzero(keyed)
+    seeds = carry or {}
+    if rows.size + len(seeds) == 0:
+        return result
+    # carried state goes first so it precedes the chunk's rows within each symbol
+    position = np.concatenate([np.full(len(seeds), -1), rows])
+    group_symbols = np.concatenate([_object_column(list(seeds)), symbols[rows]])
+    group_ordinals = np.concatenate([np.fromiter(seeds.values(), dtype=np.int64, count=len(seeds)), ordinals[rows]])
+    reset = np.concatenate([np.ones(len(seeds), dtype=bool), fatal[rows]])
+
+    codes, uniques = pd.factorize(group_symbols)
+    order = np.argsort(codes, kind="stable")
+    position, codes, reset = position[order], codes[order], reset[order]
+    values, rank = np.unique(group_ordinals[order], return_inverse=True)
+    rank = rank.astype(np.int64)
+    starts = reset.copy()
+    starts[0] = True
+    starts[1:] |= codes[1:] != codes[:-1]
+    width = int(rank.max()) + 1
+    segment = np.cumsum(starts, dtype=np.int64)
+    running = np.maximum.accumulate(segment * width + rank)
+    backwards = np.zeros(position.size, dtype=bool)
+    backwards[1:] = ~starts[1:] & (segment[1:] * width + rank[1:] < running[:-1])
+    result[position[backwards]] = True
+
+    if carry is not None:
+        ends = np.flatnonzero(np.append(codes[1:] != codes[:-1], True))
+        last = values[running[ends] - segment[ends] * width]
+        carry.update(zip(uniques[codes[ends]].tolist(), last.tolist(), strict=True))
+    return result
+
+
+def validate_columns(
+    *,
+    supplier_symbol: Column,
+    timestamp: Column,
+    open: Column,  # noqa: A002
+    high: Column,
+    low: Column,
+    close: Column,
+    volume: Column,
+    market: str,
+    enforce_monotonic_ts: bool = True,
+    carry: dict[Any, int] | None = None,
+) -> ColumnarValidation:
+    """Validate a batch given as columns using whole-column mask operations.
+
+    Python lists treat only ``None`` as missing (NaN is reported as non-finite),
+    matching :func:`validate_batch`; array and Series columns treat any null
+    marker as missing. Issues are returned in row order, and in the same
+    per-row order as the record validator, for failing rows only.
+
+    ``carry`` maps each symbol to its last timestamp (as nanosecond ordinal)
+    from earlier chunks of the same stream and is updated in place, so a batch
+    split into chunks validates exactly like the whole batch.
+    """
+
+    del market  # monotonic state is keyed per symbol within a single market
+    symbols = _object_column(supplier_symbol)
+    size = len(symbols)
+    checks: list[tuple[_Check, npt.NDArray[np.bool_]]] = []
+
+    symbol_missing = _null_mask(supplier_symbol) | (symbols == "")
+    timestamp_missing = _null_mask(timestamp)
+    checks.append((_Check("supplier_symbol", "MISSING_FIELD", "supplier_symbol is required"), symbol_missing))
+    checks.append((_Check("timestamp", "MISSING_FIELD", "timestamp is required"), timestamp_missing))
+    fatal = symbol_missing | timestamp_missing
+
+    prices: dict[str, npt.NDArray[np.float64]] = {}
+    with np.errstate(invalid="ignore"):
+        for field, values in zip(_PRICE_FIELDS, (open, high, low, close), strict=True):
+            column, missing = _numeric_column(values)
+            non_finite = ~missing & ~np.isfinite(column)
+            checks.append((_Check(field, "MISSING_FIELD", f"{field} is required"), missing))
+            checks.append((_Check(field, "NON_FINITE_VALUE", f"{field} must be finite"), non_finite))
+            fatal |= missing | non_finite
+            prices[field] = column
+
+        low_, high_ = prices["low"], prices["high"]
+        in_range = ~fatal
+        low_above_high = in_range & ((low_ - high_) > _EPSILON)
+        in_range &= ~low_above_high
+        open_out = in_range & (((prices["open"] - high_) > _EPSILON) | ((low_ - prices["open"]) > _EPSILON))
+        close_out = in_range & (((prices["close"] - high_) > _EPSILON) | ((low_ - prices["close"]) > _EPSILON))
+        checks.append((_Check("low_high", "LOW_ABOVE_HIGH", "low price cannot exceed high price"), low_above_high))
+        checks.append((_Check("open", "OPEN_OUT_OF_RANGE", "open price must lie within [low, high]"), open_out))
+        checks.append((_Check("close", "CLOSE_OUT_OF_RANGE", "close price must lie within [low, high]"), close_out))
+        fatal |= low_above_high | open_out | close_out
+
+        volumes, volume_missing = _numeric_column(volume)
+        volumes[volume_missing] = _DEFAULT_VOLUME
+        negative = ~volume_missing & (~np.isfinite(volumes) | ((volumes < 0) & (np.abs(volumes - _DEFAULT_VOLUME) > _EPSILON)))
+    checks.append((_Check("volume", "MISSING_VOLUME_DEFAULTED", "volume missing; defaulted to -1", fatal=False), volume_missing))
+    checks.append((_Check("volume", "NEGATIVE_VOLUME", "volume must be non-negative"), negative))
+    fatal |= negative
+
+    if enforce_monotonic_ts and size:
+        keyed = ~symbol_missing & ~timestamp_missing
+        backwards = _non_monotonic(symbols, _timestamp_ordinals(timestamp), fatal, keyed, carry)
+        checks.append((_Check("timestamp", "NON_MONOTONIC_TIMESTAMP", "timestamps must be non-decreasing per symbol"), backwards))
+        fatal |= backwards
+
+    return ColumnarValidation(valid=~fatal, prices=prices, volume=volumes, issues=_collect_issues(checks))
+
+
+def _collect_issues(checks: list[tuple[_Check, npt.NDArray[np.bool_]]]) -> list[ValidationIssue]:
+    rows = [np.flatnonzero(mask) for _, mask in checks]
+    if not any(r.size for r in rows):
+        return []
+    index = np.concatenate(rows)
+    order = np.concatenate([np.full(r.size, position) for position, r in enumerate(rows)])
+    sort = np.lexsort((order, index))
+    issues: list[ValidationIssue] = []
+    for row, position in zip(index[sort].tolist(), order[sort].tolist(), strict=True):
+        check = checks[position][0]
+        issues.append(ValidationIssue(index=row, field=check.field, code=check.code, message=check.message, fatal=check.fatal))
+    return issues
 
 
 def validate_batch(
@@ -61,165 +249,26 @@ def validate_batch(
     market: str,
     enforce_monotonic_ts: bool = True,
 ) -> tuple[list[ValidatedRecord], list[ValidationIssue]]:
-    """Validate a batch of records and return sanitised successes with issues."""
-
-    issues: list[ValidationIssue] = []
-    validated: list[ValidatedRecord] = []
-    last_ts_by_symbol: dict[tuple[str, str], datetime] = {}
-
-    for index, record in enumerate(records):
-        fatal = False
-        symbol = record.supplier_symbol
-        timestamp = record.timestamp
-
-        if not symbol:
-            issues.append(
-                ValidationIssue(
-                    index=index,
-                    field="supplier_symbol",
-                    code="MISSING_FIELD",
-                    message="supplier_symbol is required",
-                )
-            )
-            fatal = True
-
-        if timestamp is None:
-            issues.append(
-                ValidationIssue(
-                    index=index,
-                    field="timestamp",
-                    code="MISSING_FIELD",
-                    message="timestamp is required",
-                )
-            )
-            fatal = True
-
-        numeric_fields = {
-            "open": record.open,
-            "high": record.high,
-            "low": record.low,
-            "close": record.close,
-        }
-        for field, value in numeric_fields.items():
-            if _is_missing(value):
-                issues.append(
-                    ValidationIssue(
-                        index=index,
-                        field=field,
-                        code="MISSING_FIELD",
-                        message=f"{field} is required",
-                    )
-                )
-                fatal = True
-                continue
-            if not _ensure_finite(value):
-                issues.append(
-                    ValidationIssue(
-                        index=index,
-                        field=field,
-                        code="NON_FINITE_VALUE",
-                        message=f"{field} must be finite",
-                    )
-                )
-                fatal = True
-
-        if not fatal:
-            assert record.low is not None
-            assert record.high is not None
-            assert record.open is not None
-            assert record.close is not None
-
-            low = record.low
-            high = record.high
-            open_ = record.open
-            close = record.close
-
-            if _violates_low_high(low, high):
-                issues.append(
-                    ValidationIssue(
-                        index=index,
-                        field="low_high",
-                        code="LOW_ABOVE_HIGH",
-                        message="low price cannot exceed high price",
-                    )
-                )
-                fatal = True
-            else:
-                if _above_high(open_, high) or _below_low(open_, low):
-                    issues.append(
-                        ValidationIssue(
-                            index=index,
-                            field="open",
-                            code="OPEN_OUT_OF_RANGE",
-                            message="open price must lie within [low, high]",
-                        )
-                    )
-                    fatal = True
-                if _above_high(close, high) or _below_low(close, low):
-                    issues.append(
-                        ValidationIssue(
-                            index=index,
-                            field="close",
-                            code="CLOSE_OUT_OF_RANGE",
-                            message="close price must lie within [low, high]",
-                        )
-                    )
-                    fatal = True
-
-        volume = record.volume
-        if volume is None:
-            issues.append(
-                ValidationIssue(
-                    index=index,
-                    field="volume",
-                    code="MISSING_VOLUME_DEFAULTED",
-                    message="volume missing; defaulted to -1",
-                    fatal=False,
-                )
-            )
-            volume = _DEFAULT_VOLUME
-        else:
-            if not _ensure_finite(volume) or volume < 0 and abs(volume - _DEFAULT_VOLUME) > _EPSILON:
-                issues.append(
-                    ValidationIssue(
-                        index=index,
-                        field="volume",
-                        code="NEGATIVE_VOLUME",
-                        message="volume must be non-negative",
-                    )
-                )
-                fatal = True
-
-        symbol_key = (market, symbol) if symbol else None
-
-        if enforce_monotonic_ts and not fatal and symbol_key:
-            previous = last_ts_by_symbol.get(symbol_key)
-            if previous is not None and timestamp < previous:
-                issues.append(
-                    ValidationIssue(
-                        index=index,
-                        field="timestamp",
-                        code="NON_MONOTONIC_TIMESTAMP",
-                        message="timestamps must be non-decreasing per symbol",
-                    )
-                )
-                fatal = True
-            else:
-                last_ts_by_symbol[symbol_key] = timestamp
-        elif symbol_key and timestamp is not None:
-            last_ts_by_symbol[symbol_key] = timestamp
-
-        if not fatal:
-            sanitised = RawRecord(
-                supplier_symbol=symbol,
-                timestamp=timestamp,
-                open=record.open,
-                high=record.high,
-                low=record.low,
-                close=record.close,
-                volume=volume,
-                provider=record.provider,
-            )
-            validated.append(ValidatedRecord(index=index, record=sanitised))
-
-    return validated, issues
+    """Validate a batch of records and return sanitised successes with issues.
+
+    Records are split into columns and checked by :func:`validate_columns`;
+    passing records are returned as-is unless their volume was defaulted.
+    """
+
+    result = validate_columns(
+        supplier_symbol=[record.supplier_symbol for record in records],
+        timestamp=[record.timestamp for record in records],
+        open=[record.open for record in records],
+        high=[record.high for record in records],
+        low=[record.low for record in records],
+        close=[record.close for record in records],
+        volume=[record.volume for record in records],
+        market=market,
+        enforce_monotonic_ts=enforce_monotonic_ts,
+    )
+
+    validated = [
+        ValidatedRecord(index, record if (record := records[index]).volume is not None else replace(record, volume=_DEFAULT_VOLUME))
+        for index in np.flatnonzero(result.valid).tolist()
+    ]
+    return validated, result.issues
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 from vprism.core.data.providers.base import (
     AuthConfig,
     AuthType,
+    DataChunk,
     DataProvider,
     ProviderCapability,
     RateLimitConfig,
@@ -24,6 +25,7 @@ if TYPE_CHECKING:
 
 __all__ = [
     "DataProvider",
+    "DataChunk",
     "ProviderCapability",
     "RateLimitConfig",
     "AuthConfig",
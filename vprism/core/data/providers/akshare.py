@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import AsyncIterator, Callable
-from datetime import datetime
+from collections.abc import Callable
+from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 from pydantic import ValidationError
@@ -24,12 +24,30 @@ from vprism.core.models.market import AssetType, MarketType
 from vprism.core.models.query import Adjustment, DataQuery
 from vprism.core.models.response import DataResponse, ProviderInfo, ResponseMetadata
 
+if TYPE_CHECKING:
+    from vprism.core.models.corporate_actions import DividendEvent, SplitEvent
+    from vprism.core.services.corporate_actions import CorporateActionService
+
+# 东财日线接口按日期区间拉取, 长区间按约三年一块切分
+_HIST_CHUNK_SPAN = timedelta(days=365 * 3)
+# 健康探测使用的股票代码
+_PROBE_SYMBOL = "000001"
+
 
 class AkShare(DataProvider):
     """akshare数据提供商实现."""
 
-    def __init__(self, auth_config: AuthConfig | None = None, rate_limit: RateLimitConfig | None = None) -> None:
-        """初始化akshare提供商."""
+    def __init__(
+        self,
+        auth_config: AuthConfig | None = None,
+        rate_limit: RateLimitConfig | None = None,
+        corporate_actions: CorporateActionService | None = None,
+    ) -> None:
+        """初始化akshare提供商.
+
+        配置 ``corporate_actions`` 后, 有本地除权除息事件的代码改为拉取不复权数据, 用全历史因子本地复权;
+        没有事件的代码仍由供应商复权.
+        """
         if auth_config is None:
             auth_config = AuthConfig(auth_type=AuthType.NONE, credentials={})
 
@@ -43,6 +61,7 @@ class AkShare(DataProvider):
         )
         self._initialized = False
         self._ak = None
+        self.corporate_actions = corporate_actions
         self._handler_map: dict[AssetType, Callable[[DataQuery], Any]] = {
             AssetType.STOCK: self._get_stock_data,
             AssetType.ETF: self._get_etf_data,
@@ -61,6 +80,12 @@ class AkShare(DataProvider):
             data_delay_seconds=0,
         )
 
+    def chunk_span(self, query: DataQuery) -> timedelta | None:
+        """仅对支持日期区间的接口按日期切分, 美股/港股日线与基金净值接口总是返回全量历史."""
+        if query.asset == AssetType.ETF or (query.asset == AssetType.STOCK and query.market == MarketType.CN):
+            return _HIST_CHUNK_SPAN
+        return None
+
     async def _initialize_akshare(self) -> None:
         """Dynamically import and initialize akshare."""
         if self._ak:
@@ -96,6 +121,26 @@ class AkShare(DataProvider):
             logger.error(f"AkShare connection failed: {e}")
             return False
 
+    async def probe(self) -> bool:
+        """轻量探活: 只拉取单只股票最近几天的日线, 不拉全市场行情."""
+        try:
+            await self._initialize_akshare()
+            if self._ak is None:
+                return False
+            today = datetime.now()
+            df = await asyncio.to_thread(
+                self._ak.stock_zh_a_hist,
+                symbol=_PROBE_SYMBOL,
+                period="daily",
+                start_date=(today - timedelta(days=7)).strftime("%Y%m%d"),
+                end_date=today.strftime("%Y%m%d"),
+                adjust="",
+            )
+            return df is not None
+        except Exception as e:
+            logger.warning(f"AkShare probe failed: {e}")
+            return False
+
     async def get_data(self, query: DataQuery) -> DataResponse:
         """获取数据."""
         start_time = asyncio.get_event_loop().time()
@@ -105,6 +150,11 @@ class AkShare(DataProvider):
             raise ProviderError("AkShare not initialized after authentication", self.name)
         if not self.can_handle_query(query):
             raise ProviderError(f"{self.name} cannot handle query: {query}", self.name)
+        service = self.corporate_actions
+        if service is not None and query.market is not None and await self._adjusts_locally(query, service, query.market):
+            return await self._get_locally_adjusted(query, service, query.market)
+        if len(self.split_query(query)) > 1:
+            return await self.planner.fetch(query)
 
         handler = self._handler_map.get(query.asset)
         if not handler:
@@ -141,6 +191,33 @@ class AkShare(DataProvider):
             source=ProviderInfo(name=self.name),
         )
 
+    @staticmethod
+    async def _adjusts_locally(query: DataQuery, service: CorporateActionService, market: MarketType) -> bool:
+        """复权查询且每个代码都有本地除权除息事件时才绕过供应商复权; 没有事件的代码仍由供应商复权."""
+        symbols = query.symbols
+        if not query.adjustment or query.adjustment == Adjustment.NONE or not symbols:
+            return False
+        return await asyncio.to_thread(lambda: all(service.has_events(symbol, market) for symbol in symbols))
+
+    async def _get_locally_adjusted(self, query: DataQuery, service: CorporateActionService, market: MarketType) -> DataResponse:
+        """取查询窗口的不复权数据, 用全历史构建并落库的因子复权.
+
+        因子只在缺失、落后于窗口或库中事件哈希变化时重建, 重建需要拉取该代码的全部不复权历史.
+        服务调用会访问 DuckDB, 放到工作线程执行以免阻塞事件循环.
+        """
+        raw = await self.get_data(query.model_copy(update={"adjustment": Adjustment.NONE}))
+        full_history = query.start_date is None and query.end_date is None
+        for symbol in query.symbols or []:
+            days = [point.timestamp.date() for point in raw.data if point.symbol == symbol]
+            if not days or not await asyncio.to_thread(service.needs_factors, symbol, market, max(days)):
+                continue
+            history = raw.data
+            if not full_history:
+                unbounded = {"start": None, "end": None, "start_date": None, "end_date": None}
+                history = (await self.get_data(query.model_copy(update={**unbounded, "symbols": [symbol], "adjustment": Adjustment.NONE}))).data
+            await asyncio.to_thread(service.build_factors, symbol, market, [point for point in history if point.symbol == symbol])
+        return raw.model_copy(update={"data": await asyncio.to_thread(service.adjust, raw.data, query.adjustment)})
+
     async def _get_stock_data(self, query: DataQuery) -> Any:
         """Fetch stock data."""
         if not query.symbols:
@@ -153,7 +230,8 @@ class AkShare(DataProvider):
             adjust = ""  # akshare uses empty string for no adjustment
 
         if query.market == MarketType.CN:
-            return self._ak.stock_zh_a_hist(
+            return await asyncio.to_thread(
+                self._ak.stock_zh_a_hist,
                 symbol=symbol,
                 period="daily",
                 start_date=query.start_date.strftime("%Y%m%d") if query.start_date else "19700101",
@@ -161,9 +239,9 @@ class AkShare(DataProvider):
                 adjust=adjust,
             )
         elif query.market == MarketType.US:
-            return self._ak.stock_us_daily(symbol=symbol, adjust=adjust)
+            return await asyncio.to_thread(self._ak.stock_us_daily, symbol=symbol, adjust=adjust)
         elif query.market == MarketType.HK:
-            return self._ak.stock_hk_daily(symbol=symbol, adjust=adjust)
+            return await asyncio.to_thread(self._ak.stock_hk_daily, symbol=symbol, adjust=adjust)
         raise ProviderError(f"Unsupported market for stocks: {query.market}", self.name)
 
     async def _get_etf_data(self, query: DataQuery) -> Any:
@@ -173,7 +251,8 @@ class AkShare(DataProvider):
         if self._ak is None:
             raise ProviderError("AkShare module not loaded", self.name)
         symbol = query.symbols[0]
-        return self._ak.fund_etf_hist_em(
+        return await asyncio.to_thread(
+            self._ak.fund_etf_hist_em,
             symbol=symbol,
             period="daily",
             start_date=query.start_date.strftime("%Y%m%d") if query.start_date else "19700101",
@@ -187,11 +266,14 @@ class AkShare(DataProvider):
         if self._ak is None:
             raise ProviderError("AkShare module not loaded", self.name)
         symbol = query.symbols[0]
-        return self._ak.fund_open_fund_info_em(symbol=symbol, indicator="单位净值走势")
+        return await asyncio.to_thread(self._ak.fund_open_fund_info_em, symbol=symbol, indicator="单位净值走势")
 
-    async def _get_corporate_action_events(self, symbol: str, market: MarketType) -> tuple[list, list]:
-        """Return placeholder corporate action events (dividends, splits)."""
-        return [], []
+    async def _get_corporate_action_events(self, symbol: str, market: MarketType) -> tuple[list[DividendEvent], list[SplitEvent]]:
+        """Return stored corporate action events (dividends, splits); empty without a corporate action service."""
+        if self.corporate_actions is None:
+            return [], []
+        action_set = self.corporate_actions.events(symbol, market)
+        return list(action_set.dividends), list(action_set.splits)
 
     def _df_to_datapoints(self, df: Any, query: DataQuery) -> list[DataPoint]:
         """Convert pandas DataFrame to a list of DataPoint objects."""
@@ -254,12 +336,6 @@ class AkShare(DataProvider):
 
         return data_points
 
-    async def stream_data(self, query: DataQuery) -> AsyncIterator[DataPoint]:
-        """流式获取数据."""
-        data_response = await self.get_data(query)
-        for data_point in data_response.data:
-            yield data_point
-
     async def get_real_time_quote(self, symbol: str, market: str = "cn") -> dict[str, Any] | None:
         """获取实时报价."""
         # This is a placeholder and should be implemented if needed.
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import math
 from datetime import datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any
@@ -15,13 +16,13 @@ from vprism.core.data.providers.base import (
     ProviderCapability,
     RateLimitConfig,
 )
-from vprism.core.exceptions.base import ProviderError
+from vprism.core.exceptions.base import ProviderError, RateLimitError
 from vprism.core.models.base import DataPoint
 from vprism.core.models.market import AssetType, MarketType, TimeFrame
 from vprism.core.models.response import DataResponse, ProviderInfo, ResponseMetadata
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from datetime import timedelta
 
     from vprism.core.models.query import DataQuery
 
@@ -37,6 +38,22 @@ _INTERVAL_MAP: dict[TimeFrame, str] = {
 # Intraday timeframes share the same API function prefix pattern
 _INTRADAY_TIMEFRAMES = frozenset(_INTERVAL_MAP.keys())
 
+# outputsize=compact returns only the latest 100 bars
+_COMPACT_BARS = 100
+
+# Free-tier limits are per minute; default retry-after when none is given
+_RATE_LIMIT_WINDOW = 60
+
+# Upper bound of bars per calendar day (US regular session is 390 minutes)
+_BARS_PER_DAY: dict[TimeFrame, int] = {
+    TimeFrame.MINUTE_1: 390,
+    TimeFrame.MINUTE_5: 78,
+    TimeFrame.MINUTE_15: 26,
+    TimeFrame.MINUTE_30: 13,
+    TimeFrame.HOUR_1: math.ceil(390 / 60),
+    TimeFrame.DAY_1: 1,
+}
+
 
 def _api_function(prefix: str, timeframe: TimeFrame) -> str:
     """Resolve the AlphaVantage API function name."""
@@ -47,6 +64,15 @@ def _api_function(prefix: str, timeframe: TimeFrame) -> str:
     return f"{prefix}_{suffix}"
 
 
+def _output_size(query: DataQuery) -> str:
+    """Use ``compact`` when the latest 100 bars are guaranteed to cover the requested window."""
+    bars_per_day = _BARS_PER_DAY.get(query.timeframe or TimeFrame.DAY_1)
+    if bars_per_day is None or query.start_date is None:
+        return "full"
+    days = (datetime.now().date() - query.start_date).days + 1
+    return "compact" if days * bars_per_day <= _COMPACT_BARS else "full"
+
+
 class AlphaVantage(DataProvider):
     """Alpha Vantage data provider."""
 
@@ -101,6 +127,8 @@ class AlphaVantage(DataProvider):
             await self.authenticate()
             if not self.is_authenticated:
                 raise ProviderError("AlphaVantage authentication failed", "AlphaVantage")
+        if len(self.split_query(query)) > 1:
+            return await self.planner.fetch(query)
         try:
             data_points = await self._fetch_data(query)
             return DataResponse(
@@ -114,10 +142,9 @@ class AlphaVantage(DataProvider):
         except Exception as e:
             raise ProviderError(f"Failed to fetch data from AlphaVantage: {e}", "AlphaVantage") from e
 
-    async def stream_data(self, query: DataQuery) -> AsyncIterator[DataPoint]:
-        data_response = await self.get_data(query)
-        for dp in data_response.data:
-            yield dp
+    def chunk_span(self, query: DataQuery) -> timedelta | None:
+        # The time-series endpoints take no date range, so only split per symbol.
+        return None
 
     # ------------------------------------------------------------------ #
     # Internal fetch logic (unified for stock / forex / crypto)
@@ -128,10 +155,7 @@ class AlphaVantage(DataProvider):
             return []
         data_points: list[DataPoint] = []
         for symbol in query.symbols:
-            try:
-                data_points.extend(await self._fetch_symbol_data(symbol, query))
-            except Exception as e:
-                logger.warning(f"Error fetching data for {symbol}: {e}")
+            data_points.extend(await self._fetch_symbol_data(symbol, query))
         return data_points
 
     async def _fetch_symbol_data(self, symbol: str, query: DataQuery) -> list[DataPoint]:
@@ -162,24 +186,39 @@ class AlphaVantage(DataProvider):
         else:  # stock / etf / index / default
             prefix = "TIME_SERIES"
             function = _api_function(prefix, timeframe)
-            params = {"function": function, "symbol": symbol, "apikey": self.api_key, "outputsize": "full"}
+            params = {"function": function, "symbol": symbol, "apikey": self.api_key, "outputsize": _output_size(query)}
             if timeframe in _INTRADAY_TIMEFRAMES:
                 params["interval"] = _INTERVAL_MAP[timeframe]
 
         data = await self._request(params)
-        return self._parse_time_series(data, symbol, market)
+        points = self._parse_time_series(data, symbol, market)
+        if query.start_date or query.end_date:
+            points = [
+                p
+                for p in points
+                if (query.start_date is None or p.timestamp.date() >= query.start_date) and (query.end_date is None or p.timestamp.date() <= query.end_date)
+            ]
+        return points
 
     async def _request(self, params: dict[str, str]) -> dict[str, Any]:
         """Execute a single AlphaVantage API request."""
         import aiohttp
 
         async with aiohttp.ClientSession() as session, session.get(self.BASE_URL, params=params) as response:
+            if response.status == 429:
+                retry_after = response.headers.get("Retry-After")
+                raise RateLimitError(
+                    "AlphaVantage rate limit (HTTP 429)",
+                    "AlphaVantage",
+                    retry_after=int(retry_after) if retry_after and retry_after.isdigit() else _RATE_LIMIT_WINDOW,
+                )
             data: dict[str, Any] = await response.json()
 
         if "Error Message" in data:
             raise ProviderError(f"AlphaVantage API error: {data['Error Message']}", "AlphaVantage")
         if "Note" in data:
-            raise ProviderError(f"AlphaVantage rate limit: {data['Note']}", "AlphaVantage")
+            # free-tier quota is per minute, so the next window can retry
+            raise RateLimitError(f"AlphaVantage rate limit: {data['Note']}", "AlphaVantage", retry_after=_RATE_LIMIT_WINDOW)
         return data
 
     def _parse_time_series(self, data: dict[str, Any], symbol: str, market: str) -> list[DataPoint]:
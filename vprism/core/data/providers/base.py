@@ -3,13 +3,18 @@
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
 from enum import Enum
-from typing import Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 from vprism.core.models.base import DataPoint
-from vprism.core.models.market import AssetType
+from vprism.core.models.market import TimeFrame
 from vprism.core.models.query import DataQuery
 from vprism.core.models.response import DataResponse
+from vprism.core.patterns.bulkhead import Bulkhead, BulkheadConfig, bulkhead_registry
+
+if TYPE_CHECKING:
+    from vprism.core.data.providers.planner import FetchPlanner
 
 
 class AuthType(str, Enum):
@@ -47,6 +52,8 @@ class RateLimitConfig:
     backoff_factor: float = 2.0
     max_retries: int = 3
     initial_delay: float = 1.0
+    max_queue: int = 100
+    max_queue_wait: float = 5.0
 
 
 @dataclass
@@ -58,6 +65,26 @@ class AuthConfig:
     required_fields: list[str] = field(default_factory=list)
 
 
+@dataclass
+class DataChunk:
+    """流式数据块: 单个符号在单个日期窗口内的数据."""
+
+    query: DataQuery
+    data: list[DataPoint]
+
+
+# 默认按时间框架切分日期窗口, 日线及以上默认不切分 (整段历史规模有限)
+_DEFAULT_CHUNK_SPANS: dict[TimeFrame, timedelta] = {
+    TimeFrame.TICK: timedelta(days=1),
+    TimeFrame.MINUTE_1: timedelta(days=7),
+    TimeFrame.MINUTE_5: timedelta(days=30),
+    TimeFrame.MINUTE_15: timedelta(days=60),
+    TimeFrame.MINUTE_30: timedelta(days=90),
+    TimeFrame.HOUR_1: timedelta(days=180),
+    TimeFrame.HOUR_4: timedelta(days=365),
+}
+
+
 @runtime_checkable
 class ProviderProtocol(Protocol):
     name: str
@@ -69,6 +96,8 @@ class ProviderProtocol(Protocol):
 
     def stream_data(self, query: DataQuery) -> AsyncIterator[DataPoint]: ...  # pragma: no cover
 
+    def stream_chunks(self, query: DataQuery) -> AsyncIterator[DataChunk]: ...  # pragma: no cover
+
     def can_handle_query(self, query: DataQuery) -> bool: ...
 
     async def authenticate(self) -> bool: ...
@@ -99,6 +128,7 @@ class DataProvider(ProviderProtocol, ABC):
         self.rate_limit = rate_limit
         self._capability: ProviderCapability | None = None
         self._is_authenticated = False
+        self._planner: FetchPlanner | None = None
 
     @property
     def capability(self) -> ProviderCapability:
@@ -128,7 +158,109 @@ class DataProvider(ProviderProtocol, ABC):
         """
         pass
 
-    @abstractmethod
+    def chunk_span(self, query: DataQuery) -> timedelta | None:
+        """单个数据块覆盖的日期跨度.
+
+        Args:
+            query: 数据查询对象
+
+        Returns:
+            日期跨度, None 表示不按日期切分
+        """
+        return _DEFAULT_CHUNK_SPANS.get(query.timeframe)
+
+    @property
+    def bulkhead(self) -> Bulkhead:
+        """提供商级隔舱: 并发上限为 ``concurrent_requests``, 同名提供商共享."""
+        bulkhead = bulkhead_registry.get_bulkhead(self.name)
+        if bulkhead is None:
+            bulkhead = bulkhead_registry.get_or_create(
+                self.name,
+                BulkheadConfig(
+                    max_concurrent=max(self.rate_limit.concurrent_requests, 1),
+                    max_queue=self.rate_limit.max_queue,
+                    max_wait=self.rate_limit.max_queue_wait,
+                    name=self.name,
+                ),
+            )
+        return bulkhead
+
+    @property
+    def planner(self) -> "FetchPlanner":
+        """分块拉取计划器 (按需创建, 保存未完成的计划)."""
+        if self._planner is None:
+            from vprism.core.data.providers.planner import FetchPlanner
+
+            self._planner = FetchPlanner(self)
+        return self._planner
+
+    def split_query(self, query: DataQuery) -> list[DataQuery]:
+        """将查询切分为按符号、按日期窗口的子查询.
+
+        窗口按自然日对齐且互不重叠, 首尾窗口保留原查询的 start/end.
+
+        Args:
+            query: 数据查询对象
+
+        Returns:
+            有序的子查询列表
+        """
+        symbols = query.symbols or []
+        if not symbols:
+            return [query]
+
+        raw_symbols = query.raw_symbols if query.raw_symbols and len(query.raw_symbols) == len(symbols) else None
+        windows = self._date_windows(query)
+
+        parts: list[DataQuery] = []
+        for i, symbol in enumerate(symbols):
+            update: dict[str, object] = {"symbols": [symbol], "raw_symbols": [raw_symbols[i]] if raw_symbols else None}
+            if not windows:
+                parts.append(query.model_copy(update=update))
+                continue
+            for start, end, start_date, end_date in windows:
+                parts.append(query.model_copy(update={**update, "start": start, "end": end, "start_date": start_date, "end_date": end_date}))
+        return parts
+
+    def _date_windows(self, query: DataQuery) -> list[tuple[datetime, datetime, date, date]]:
+        """计算日期窗口, 无需切分时返回空列表."""
+        span = self.chunk_span(query)
+        if span is None or query.start_date is None or query.start is None:
+            return []
+        end_date = query.end_date or datetime.now().date()
+        end = query.end or datetime.combine(end_date, datetime.max.time())
+        step = max(span.days, 1)
+        if (end_date - query.start_date).days < step:
+            return []
+
+        windows: list[tuple[datetime, datetime, date, date]] = []
+        window_start = query.start_date
+        while window_start <= end_date:
+            window_end = min(window_start + timedelta(days=step - 1), end_date)
+            windows.append(
+                (
+                    query.start if window_start == query.start_date else datetime.combine(window_start, datetime.min.time()),
+                    end if window_end == end_date else datetime.combine(window_end, datetime.max.time()),
+                    window_start,
+                    window_end,
+                )
+            )
+            window_start = window_end + timedelta(days=1)
+        return windows
+
+    async def stream_chunks(self, query: DataQuery) -> AsyncIterator[DataChunk]:
+        """按数据块流式获取数据, 每次只持有一个数据块.
+
+        Args:
+            query: 数据查询对象
+
+        Yields:
+            按符号、日期顺序排列的数据块
+        """
+        for part in self.split_query(query):
+            response = await self.get_data(part)
+            yield DataChunk(query=part, data=response.data)
+
     async def stream_data(self, query: DataQuery) -> AsyncIterator[DataPoint]:
         """流式获取数据.
 
@@ -138,8 +270,9 @@ class DataProvider(ProviderProtocol, ABC):
         Yields:
             单个数据点
         """
-        if False:
-            yield
+        async for chunk in self.stream_chunks(query):
+            for point in chunk.data:
+                yield point
 
     def can_handle_query(self, query: DataQuery) -> bool:
         """检查提供商是否能处理查询.
@@ -203,25 +336,24 @@ class DataProvider(ProviderProtocol, ABC):
             "concurrent": self.rate_limit.concurrent_requests,
         }
 
+    async def probe(self) -> bool:
+        """轻量探活, 默认复用 ``authenticate`` 的连通性检查.
+
+        子类可覆盖为各自最便宜的端点, 不应拉取完整行情数据。
+
+        Returns:
+            提供商是否可用
+        """
+        return await self.authenticate()
+
     async def health_check(self) -> bool:
-        """健康检查.
+        """健康检查, 只做轻量探活而不消耗行情查询配额.
 
         Returns:
             提供商是否健康
         """
         try:
-            if not self.is_authenticated:
-                await self.authenticate()
-
-            # 执行简单的健康检查查询
-            test_query = DataQuery(asset=AssetType("stock"), symbols=["TEST"])
-
-            if self.can_handle_query(test_query):
-                result = await self.get_data(test_query)
-                return result is not None
-            else:
-                return True  # 如果不能处理测试查询，认为健康
-
+            return await self.probe()
         except Exception:
             return False
 
@@ -0,0 +1,167 @@
+"""长区间数据拉取计划: 分块、并发、逐块重试、按序合并."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from vprism.core.exceptions.base import NetworkError, ProviderError
+from vprism.core.models.response import DataResponse, ProviderInfo, ResponseMetadata
+from vprism.core.patterns.deadline import with_deadline
+from vprism.core.patterns.ratelimit import SlidingWindowRateLimiter
+from vprism.core.patterns.retry import ExponentialBackoffRetry, RetryConfig, retry_budget_registry
+
+if TYPE_CHECKING:
+    from vprism.core.data.providers.base import DataProvider
+    from vprism.core.models.base import DataPoint
+    from vprism.core.models.query import DataQuery
+
+# 只有瞬时故障值得逐块重试; 参数错误、无数据等 ProviderError 重试也不会成功
+TRANSIENT_ERRORS: tuple[type[Exception], ...] = (NetworkError, ConnectionError, TimeoutError)
+
+
+@dataclass
+class FetchPlan:
+    """一次拉取的分块计划, 保存已完成的数据块以便失败后续跑."""
+
+    query: DataQuery
+    chunks: list[DataQuery]
+    completed: dict[int, list[DataPoint]] = field(default_factory=dict)
+    failed: dict[int, Exception] = field(default_factory=dict)
+    created_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def pending(self) -> list[int]:
+        """尚未完成的数据块序号."""
+        return [i for i in range(len(self.chunks)) if i not in self.completed]
+
+    @property
+    def done(self) -> bool:
+        """是否全部完成."""
+        return len(self.completed) == len(self.chunks)
+
+    def merge(self) -> list[DataPoint]:
+        """按数据块顺序合并结果, 去除窗口边界上的重复数据点."""
+        seen: set[tuple[str, Any]] = set()
+        merged: list[DataPoint] = []
+        for i in range(len(self.chunks)):
+            for point in self.completed.get(i, []):
+                key = (point.symbol, point.timestamp)
+                if key in seen:
+                    continue
+                seen.add(key)
+                merged.append(point)
+        return merged
+
+
+class FetchPlanner:
+    """按提供商的速率限制并发执行分块拉取.
+
+    并发数取自 ``concurrent_requests``, 每分钟请求数取自 ``requests_per_minute``,
+    因瞬时故障 (:data:`TRANSIENT_ERRORS`) 失败的数据块按 ``max_retries``/``initial_delay``/
+    ``backoff_factor`` 单独重试。每个数据块都经过提供商的隔舱 (``provider.bulkhead``),
+    与其他请求共享并发上限。未完成的计划会被保留, 相同查询再次拉取时只补齐缺失的数据块;
+    保留的计划最多 ``max_plans`` 个, 超过 ``plan_ttl`` 秒未完成的计划被丢弃。
+    """
+
+    def __init__(self, provider: DataProvider, *, max_plans: int = 64, plan_ttl: float = 3600.0) -> None:
+        self.provider = provider
+        rate_limit = provider.rate_limit
+        self.retry_config = RetryConfig(
+            max_attempts=max(rate_limit.max_retries, 1),
+            base_delay=rate_limit.initial_delay,
+            exponential_base=rate_limit.backoff_factor,
+            retry_on_exceptions=list(TRANSIENT_ERRORS),
+            budget=retry_budget_registry.get_or_create(provider.name),
+        )
+        self.max_concurrency = max(rate_limit.concurrent_requests, 1)
+        self.max_plans = max_plans
+        self.plan_ttl = plan_ttl
+        self._limiter = SlidingWindowRateLimiter(max(rate_limit.requests_per_minute, 1))
+        self._plans: OrderedDict[str, FetchPlan] = OrderedDict()
+
+    @staticmethod
+    def _plan_key(query: DataQuery) -> str:
+        return query.model_dump_json(exclude={"raw_symbols"})
+
+    def plan(self, query: DataQuery) -> FetchPlan:
+        """获取查询的计划, 优先复用未完成的计划."""
+        self._evict()
+        key = self._plan_key(query)
+        plan = self._plans.get(key)
+        if plan is None:
+            plan = FetchPlan(query=query, chunks=self.provider.split_query(query))
+            self._plans[key] = plan
+            while len(self._plans) > self.max_plans:
+                self._plans.popitem(last=False)
+        self._plans.move_to_end(key)
+        return plan
+
+    def _evict(self) -> None:
+        """丢弃超过 ``plan_ttl`` 的计划."""
+        cutoff = time.monotonic() - self.plan_ttl
+        for key in [key for key, plan in self._plans.items() if plan.created_at < cutoff]:
+            del self._plans[key]
+
+    def get_pending_plans(self) -> list[FetchPlan]:
+        """获取尚未完成的计划."""
+        self._evict()
+        return list(self._plans.values())
+
+    async def execute(self, plan: FetchPlan) -> FetchPlan:
+        """并发执行计划中未完成的数据块, 失败记录在 ``plan.failed`` 中."""
+        plan.failed.clear()
+        # 经 DataService 调用时外层已占用一个隔舱槽位, 先交还, 由各数据块各自申请
+        self.provider.bulkhead.hand_back()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        await asyncio.gather(*(self._run_chunk(plan, i, semaphore) for i in plan.pending))
+        return plan
+
+    async def _run_chunk(self, plan: FetchPlan, index: int, semaphore: asyncio.Semaphore) -> None:
+        async def _attempt() -> list[DataPoint]:
+            async with semaphore, self.provider.bulkhead:
+                await self._limiter.acquire()
+                response = await with_deadline(self.provider.get_data(plan.chunks[index]))
+                return response.data
+
+        try:
+            plan.completed[index] = await ExponentialBackoffRetry(self.retry_config).execute(_attempt)
+        except Exception as e:
+            logger.warning(f"{self.provider.name} chunk {index + 1}/{len(plan.chunks)} failed: {e}")
+            plan.failed[index] = e
+
+    async def fetch(self, query: DataQuery) -> DataResponse:
+        """执行(或续跑)查询的计划并合并结果.
+
+        Raises:
+            ProviderError: 仍有数据块失败时抛出, 已完成的数据块会保留到下次调用
+        """
+        start = time.perf_counter()
+        plan = await self.execute(self.plan(query))
+        if not plan.done:
+            raise ProviderError(
+                f"{len(plan.failed)} of {len(plan.chunks)} chunks failed",
+                self.provider.name,
+                error_code="PARTIAL_FETCH",
+                details={
+                    "completed_chunks": len(plan.completed),
+                    "failed_chunks": {i: str(e) for i, e in sorted(plan.failed.items())},
+                },
+            )
+
+        self._plans.pop(self._plan_key(query), None)
+        data = plan.merge()
+        return DataResponse(
+            data=data,
+            metadata=ResponseMetadata(
+                total_records=len(data),
+                query_time_ms=(time.perf_counter() - start) * 1000,
+                data_source=self.provider.name,
+            ),
+            source=ProviderInfo(name=self.provider.name),
+        )
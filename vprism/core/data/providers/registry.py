@@ -2,14 +2,27 @@
 
 import asyncio
 import contextlib
+import random
+import time
+from collections import deque
 from datetime import UTC, datetime
 from typing import Any, TypedDict
 
 from loguru import logger as _logger
 
-from vprism.core.data.providers.base import DataProvider
+from vprism.core.data.providers.base import DataProvider, ProviderCapability
 from vprism.core.models.query import DataQuery
 
+# 能力索引键: (asset, market, timeframe) 的字符串值, 未指定时为 None
+CapabilityKey = tuple[str | None, str | None, str | None]
+
+# 被动健康判定: 最近调用窗口大小、最少调用数与失败率阈值
+_PASSIVE_WINDOW = 20
+_PASSIVE_MIN_CALLS = 5
+_PASSIVE_FAILURE_RATE = 0.5
+# 主动探测在各提供商之间随机错峰的上限(秒)
+_PROBE_JITTER_SECONDS = 30.0
+
 
 class HealthSummary(TypedDict):
     """健康状态摘要的类型定义."""
@@ -21,6 +34,11 @@ class HealthSummary(TypedDict):
     providers: list[dict[str, Any]]
 
 
+def _overrides_can_handle(provider: DataProvider) -> bool:
+    """提供商是否自定义了 ``can_handle_query`` (此时不能只依赖能力索引)."""
+    return type(provider).can_handle_query is not DataProvider.can_handle_query
+
+
 class ProviderRegistry:
     """提供商注册表，管理数据提供商的生命周期和健康状态."""
 
@@ -32,6 +50,12 @@ class ProviderRegistry:
         self._lock = asyncio.Lock()
         self._health_check_interval = 300  # 5分钟
         self._health_check_task: asyncio.Task[None] | None = None
+        # (asset, market, timeframe) -> 候选提供商 (按注册顺序), 注册变化或能力刷新时失效
+        self._capability_index: dict[CapabilityKey, list[DataProvider]] = {}
+        # 被动健康: 最近调用结果与最后一次真实流量时间 (单调时钟)
+        self._outcomes: dict[str, deque[bool]] = {}
+        self._last_traffic: dict[str, float] = {}
+        self._probe_jitter = _PROBE_JITTER_SECONDS
 
     def register(self, provider: DataProvider) -> None:
         """注册提供商.
@@ -46,7 +70,11 @@ class ProviderRegistry:
             "last_health_check": None,
             "health_check_count": 0,
             "total_failures": 0,
+            "passive_calls": 0,
         }
+        self._outcomes.pop(provider.name, None)
+        self._last_traffic.pop(provider.name, None)
+        self._capability_index.clear()
 
     def unregister(self, provider_name: str) -> bool:
         """注销提供商.
@@ -61,6 +89,9 @@ class ProviderRegistry:
             del self.providers[provider_name]
             del self.provider_health[provider_name]
             del self.provider_metadata[provider_name]
+            self._outcomes.pop(provider_name, None)
+            self._last_traffic.pop(provider_name, None)
+            self._capability_index.clear()
             return True
         return False
 
@@ -92,12 +123,40 @@ class ProviderRegistry:
         Returns:
             能处理该查询的提供商列表
         """
+        key: CapabilityKey = (
+            str(query.asset.value) if query.asset else None,
+            str(query.market.value) if query.market else None,
+            str(query.timeframe.value) if query.timeframe else None,
+        )
+        candidates = self._capability_index.get(key)
+        if candidates is None:
+            candidates = self._capability_index[key] = [p for p in self.providers.values() if self._supports(p, key)]
+
+        symbol_count = len(query.symbols) if query.symbols else 0
         capable = []
-        for provider in self.providers.values():
-            if self.provider_health.get(provider.name, False) and provider.can_handle_query(query):
+        for provider in candidates:
+            if not self.provider_health.get(provider.name, False):
+                continue
+            if _overrides_can_handle(provider):
+                if provider.can_handle_query(query):
+                    capable.append(provider)
+            elif symbol_count <= provider.capability.max_symbols_per_request:
                 capable.append(provider)
         return capable
 
+    @staticmethod
+    def _supports(provider: DataProvider, key: CapabilityKey) -> bool:
+        """索引条件: 自定义 ``can_handle_query`` 的提供商总是候选, 在查询时再判断."""
+        if _overrides_can_handle(provider):
+            return True
+        cap: ProviderCapability = provider.capability
+        asset, market, timeframe = key
+        return (
+            (asset is None or asset in cap.supported_assets)
+            and (market is None or market in cap.supported_markets)
+            and (timeframe is None or timeframe in cap.supported_timeframes)
+        )
+
     def mark_healthy(self, provider_name: str) -> None:
         """标记提供商为健康状态.
 
@@ -121,6 +180,35 @@ class ProviderRegistry:
                 self.provider_metadata[provider_name]["last_health_check"] = datetime.now(UTC)
                 self.provider_metadata[provider_name]["total_failures"] += 1
 
+    def record_call(self, provider_name: str, success: bool) -> None:
+        """记录一次真实调用结果, 据此被动判定健康状态.
+
+        最近窗口内失败率达到阈值时标记为不健康; 不健康的提供商出现成功调用时恢复。
+
+        Args:
+            provider_name: 提供商名称
+            success: 调用是否成功
+        """
+        if provider_name not in self.providers:
+            return
+        window = self._outcomes.setdefault(provider_name, deque(maxlen=_PASSIVE_WINDOW))
+        window.append(success)
+        self._last_traffic[provider_name] = time.monotonic()
+        self.provider_metadata[provider_name]["passive_calls"] += 1
+
+        healthy = self.provider_health.get(provider_name, False)
+        failure_rate = window.count(False) / len(window)
+        if len(window) >= _PASSIVE_MIN_CALLS and failure_rate >= _PASSIVE_FAILURE_RATE:
+            if healthy:
+                self.mark_unhealthy(provider_name)
+        elif success and not healthy:
+            self.mark_healthy(provider_name)
+
+    def is_idle(self, provider_name: str) -> bool:
+        """最近一个健康检查周期内是否没有真实流量."""
+        last = self._last_traffic.get(provider_name)
+        return last is None or time.monotonic() - last >= self._health_check_interval
+
     def is_healthy(self, provider_name: str) -> bool:
         """检查提供商是否健康.
 
@@ -187,15 +275,22 @@ class ProviderRegistry:
                 _logger.error(f"Health check error: {e}")
 
     async def _check_all_providers_health(self) -> None:
-        """检查所有提供商的健康状态."""
+        """主动探测空闲或不健康的提供商.
+
+        有真实流量的提供商由 ``record_call`` 被动判定, 不消耗额外配额;
+        各提供商的探测随机错峰, 避免同时打到上游。锁只在挑选待探测的提供商时持有,
+        探测期间 (含错峰等待) 不阻塞注册与路由。
+        """
         async with self._lock:
-            tasks = []
-            for provider in self.providers.values():
-                task = asyncio.create_task(self._check_provider_health(provider))
-                tasks.append(task)
+            candidates = [provider for provider in self.providers.values() if not self.provider_health.get(provider.name, False) or self.is_idle(provider.name)]
+
+        if candidates:
+            await asyncio.gather(*(self._probe_with_jitter(provider) for provider in candidates), return_exceptions=True)
 
-            if tasks:
-                await asyncio.gather(*tasks, return_exceptions=True)
+    async def _probe_with_jitter(self, provider: DataProvider) -> None:
+        """随机延迟后探测单个提供商."""
+        await asyncio.sleep(random.uniform(0, self._probe_jitter))
+        await self._check_provider_health(provider)
 
     async def _check_provider_health(self, provider: DataProvider) -> None:
         """检查单个提供商的健康状态.
@@ -207,6 +302,7 @@ class ProviderRegistry:
             is_healthy = await provider.health_check()
             if is_healthy:
                 self.mark_healthy(provider.name)
+                self._outcomes.pop(provider.name, None)
             else:
                 self.mark_unhealthy(provider.name)
 
@@ -229,6 +325,7 @@ class ProviderRegistry:
                 # 强制重新发现能力
                 provider._capability = None
                 _ = provider.capability  # 触发重新发现
+            self._capability_index.clear()
 
     def get_health_summary(self) -> HealthSummary:
         """获取健康状态摘要.
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
+import asyncio
 from datetime import datetime
 from decimal import Decimal
 from typing import Any
@@ -105,7 +105,7 @@ class YFinance(DataProvider):
             # 测试连接
             yf = _ensure_yfinance()
             ticker = yf.Ticker("AAPL")
-            hist = ticker.history(period="1d")
+            hist = await asyncio.to_thread(ticker.history, period="1d")
             if hist is not None and not hist.empty:
                 self._is_authenticated = True
                 logger.info("Successfully connected to Yahoo Finance")
@@ -141,15 +141,6 @@ class YFinance(DataProvider):
                 source=ProviderInfo(name="yfinance", endpoint="error"),
             )
 
-    async def stream_data(self, query: DataQuery) -> AsyncIterator[DataPoint]:
-        """流式获取数据."""
-        data_response = await self.get_data(query)
-        for data_point in data_response.data:
-            yield data_point
-        # mypy needs this to recognize it as an async generator
-        if False:
-            yield
-
     def _get_market_type(self, symbol: str) -> MarketType:
         """根据股票代码确定市场类型."""
         if symbol.endswith(".HK"):
@@ -199,7 +190,8 @@ class YFinance(DataProvider):
             yf = _ensure_yfinance()
             ticker = yf.Ticker(symbol)
 
-            data = ticker.history(start=query.start_date, end=query.end_date, interval=yf_timeframe)
+            # 在线程中执行阻塞调用, 使上层的截止时间与取消能够及时生效
+            data = await asyncio.to_thread(ticker.history, start=query.start_date, end=query.end_date, interval=yf_timeframe)
 
             if data is None or data.empty:
                 return DataResponse(
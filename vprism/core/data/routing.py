@@ -1,12 +1,28 @@
 """智能数据路由器，实现基于性能和能力的提供商选择."""
 
+import math
+import time
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
 from typing import Any, TypedDict
 
-from vprism.core.data.providers.base import DataProvider
+from vprism.core.data.providers.base import DataProvider, ProviderCapability
 from vprism.core.data.providers.registry import ProviderRegistry
 from vprism.core.exceptions import NoCapableProviderError
-from vprism.core.models import DataQuery
+from vprism.core.models import DataQuery, DataResponse
+from vprism.core.monitoring.latency import ProviderLatencyStats
+from vprism.core.patterns.deadline import with_deadline
+from vprism.core.patterns.hedging import HedgedExecutor
+
+# 评分向目标值做指数平滑的系数
+_SCORE_ALPHA = 0.2
+# 成功请求的目标评分随延迟下降: 0ms -> 2.0, 1000ms -> 1.0
+_LATENCY_REF_MS = 1000.0
+_FAILURE_TARGET = 0.1
+# 评分在无新请求时向 1.0 恢复的时间常数(秒)
+_SCORE_RECOVERY_SECONDS = 300.0
+# p95 尾延迟惩罚上限
+_MAX_TAIL_PENALTY = 0.3
 
 
 class DecisionLog(TypedDict):
@@ -22,15 +38,20 @@ class DecisionLog(TypedDict):
 class DataRouter:
     """智能数据路由器，根据提供商能力和性能进行路由选择."""
 
-    def __init__(self, registry: ProviderRegistry):
+    def __init__(self, registry: ProviderRegistry, time_source: Callable[[], float] | None = None):
         """初始化数据路由器.
 
         Args:
             registry: 提供商注册表
+            time_source: 单调时钟 (秒), 默认 time.monotonic
         """
         self.registry = registry
         self.provider_scores: dict[str, float] = {}
         self.provider_stats: dict[str, dict[str, Any]] = {}
+        self.latency_stats: dict[str, ProviderLatencyStats] = {}
+        self._time_source = time_source or time.monotonic
+        # (提供商, asset, market, timeframe) -> (能力对象, 静态评分); 能力对象被替换时失效
+        self._static_scores: dict[tuple[str, Any, Any, Any], tuple[ProviderCapability, float]] = {}
 
     def refresh_scores(self) -> None:
         """Reset provider scores to defaults for all registered providers."""
@@ -62,6 +83,71 @@ class DataRouter:
         # 使用评分系统选择最佳提供商
         return self._select_best_provider(capable_providers, query)
 
+    async def route_candidates(self, query: DataQuery) -> list[DataProvider]:
+        """返回按评分从高到低排列的候选提供商.
+
+        Args:
+            query: 数据查询对象
+
+        Returns:
+            有序的候选提供商列表 (至少一个)
+
+        Raises:
+            NoCapableProviderError: 没有可用的提供商
+        """
+        capable_providers = self.registry.find_capable_providers(query)
+
+        if not capable_providers:
+            raise NoCapableProviderError(f"No provider can handle query: {query}")
+
+        return self.rank_providers(capable_providers, query)
+
+    def rank_providers(self, providers: list[DataProvider], query: DataQuery) -> list[DataProvider]:
+        """按评分从高到低排序提供商."""
+        if len(providers) <= 1:
+            return list(providers)
+        scored = [(provider, self._calculate_provider_score(provider, query)) for provider in providers]
+        scored.sort(key=lambda x: x[1], reverse=True)
+        return [provider for provider, _ in scored]
+
+    async def execute_hedged(self, query: DataQuery, hedger: HedgedExecutor) -> DataResponse:
+        """向最佳提供商发出请求, 超过其 p95 延迟未返回时对冲到次优提供商.
+
+        Args:
+            query: 数据查询对象
+            hedger: 对冲执行器 (持有策略、预算与统计)
+
+        Returns:
+            先成功返回的响应
+        """
+        candidates = (await self.route_candidates(query))[:2]
+        delay = self.hedge_delay(candidates[0].name, hedger)
+
+        _, response = await hedger.execute([self._timed_call(provider, query) for provider in candidates], delay)
+        return response
+
+    def hedge_delay(self, provider_name: str, hedger: HedgedExecutor) -> float:
+        """以提供商的 p95 延迟为基准计算对冲等待时间 (秒)."""
+        stats = self.latency_stats.get(provider_name)
+        p95_ms = stats.p95.value if stats else None
+        return hedger.hedge_delay(p95_ms / 1000.0 if p95_ms is not None else None)
+
+    def _timed_call(self, provider: DataProvider, query: DataQuery) -> Callable[[], Awaitable[DataResponse]]:
+        """包装一次提供商调用 (经过提供商隔舱), 记录结果与延迟 (被取消的调用不计入)."""
+
+        async def _call() -> DataResponse:
+            async with provider.bulkhead:
+                started = time.perf_counter()
+                try:
+                    response = await with_deadline(provider.get_data(query))
+                except Exception:
+                    self.update_provider_score(provider.name, False, (time.perf_counter() - started) * 1000)
+                    raise
+                self.update_provider_score(provider.name, True, (time.perf_counter() - started) * 1000)
+                return response
+
+        return _call
+
     def _select_best_provider(self, providers: list[DataProvider], query: DataQuery) -> DataProvider:
         """根据评分系统选择最佳提供商.
 
@@ -72,18 +158,7 @@ class DataRouter:
         Returns:
             评分最高的提供商
         """
-        # 计算每个提供商的评分
-        provider_ratings = []
-
-        for provider in providers:
-            score = self._calculate_provider_score(provider, query)
-            provider_ratings.append((provider, score))
-
-        # 按评分排序，选择最高分的提供商
-        provider_ratings.sort(key=lambda x: x[1], reverse=True)
-        best_provider = provider_ratings[0][0]
-
-        return best_provider
+        return self.rank_providers(providers, query)[0]
 
     def _calculate_provider_score(self, provider: DataProvider, query: DataQuery) -> float:
         """计算提供商对特定查询的评分.
@@ -95,8 +170,27 @@ class DataRouter:
         Returns:
             综合评分 (0-2.0)
         """
-        base_score = 1.0
+        base_score = self._static_score(provider, query)
+
+        # 批量查询支持
+        if query.symbols and len(query.symbols) <= provider.capability.max_symbols_per_request:
+            base_score += 0.1
+
+        # 历史评分权重 (随时间向 1.0 恢复) 与尾延迟惩罚
+        historical_score = self.get_provider_score(provider.name)
+        final_score = (base_score + historical_score) / 2.0 - self._tail_penalty(provider.name)
+
+        return max(0.1, min(2.0, final_score))
+
+    def _static_score(self, provider: DataProvider, query: DataQuery) -> float:
+        """能力相关的静态评分, 按 (提供商, asset, market, timeframe) 缓存."""
         capability = provider.capability
+        key = (provider.name, query.asset, query.market, query.timeframe)
+        cached = self._static_scores.get(key)
+        if cached is not None and cached[0] is capability:
+            return cached[1]
+
+        base_score = 1.0
 
         # 基础能力评分
         if query.asset in capability.supported_assets:
@@ -118,37 +212,39 @@ class DataRouter:
         if capability.supports_historical:
             base_score += 0.1
 
-        # 批量查询支持
-        if query.symbols and len(query.symbols) <= capability.max_symbols_per_request:
-            base_score += 0.1
+        self._static_scores[key] = (capability, base_score)
+        return base_score
 
-        # 历史评分权重
-        historical_score = self.provider_scores.get(provider.name, 1.0)
-        final_score = (base_score + historical_score) / 2.0
+    def _tail_penalty(self, provider_name: str) -> float:
+        """按 p95 延迟计算惩罚, 同样随时间衰减."""
+        stats = self.latency_stats.get(provider_name)
+        p95 = stats.p95.value if stats else None
+        if stats is None or p95 is None or stats.last_update is None:
+            return 0.0
+        decay = math.exp(-(self._time_source() - stats.last_update) / _SCORE_RECOVERY_SECONDS)
+        return min(_MAX_TAIL_PENALTY, 0.1 * p95 / _LATENCY_REF_MS) * decay
 
-        return max(0.1, min(2.0, final_score))
+    def update_provider_score(self, provider_name: str, success: bool, latency_ms: float) -> None:
+        """记录一次调用结果并更新提供商性能评分.
 
-    def update_provider_score(self, provider_name: str, success: bool, latency_ms: int) -> None:
-        """更新提供商性能评分.
+        评分以 EWMA 方式向目标值收敛: 失败目标为 0.1, 成功目标随延迟降低
+        (0ms 为 2.0, 1000ms 为 1.0), 因此当前变慢的提供商评分会持续下降。
 
         Args:
             provider_name: 提供商名称
             success: 请求是否成功
             latency_ms: 请求延迟(毫秒)
         """
-        current_score = self.provider_scores.get(provider_name, 1.0)
-
-        if success:
-            # 成功奖励，延迟越低奖励越高
-            score_delta = 0.1 - (latency_ms / 10000.0)
-            score_delta = max(0.05, score_delta)  # 确保最小奖励
-        else:
-            # 失败惩罚
-            score_delta = -0.2
-
-        new_score = current_score + score_delta
+        now = self._time_source()
+        current_score = self.get_provider_score(provider_name)
+        target = 2.0 / (1.0 + max(latency_ms, 0.0) / _LATENCY_REF_MS) if success else _FAILURE_TARGET
+        new_score = current_score + _SCORE_ALPHA * (target - current_score)
         self.provider_scores[provider_name] = max(0.1, min(2.0, new_score))
 
+        latency = self.latency_stats.setdefault(provider_name, ProviderLatencyStats(alpha=_SCORE_ALPHA))
+        latency.record(success, latency_ms, now)
+        self.registry.record_call(provider_name, success)
+
         # 更新统计信息
         if provider_name not in self.provider_stats:
             self.provider_stats[provider_name] = {
@@ -164,6 +260,7 @@ class DataRouter:
             stats["successful_requests"] += 1
             stats["total_latency"] += latency_ms
         stats["last_request_time"] = datetime.now(UTC)
+        stats.update(latency.snapshot())
 
     def get_provider_stats(self, provider_name: str) -> dict[str, Any] | None:
         """获取提供商统计信息.
@@ -183,9 +280,14 @@ class DataRouter:
             provider_name: 提供商名称
 
         Returns:
-            提供商评分 (0.1-2.0)
+            提供商评分 (0.1-2.0), 长时间无请求时向 1.0 恢复
         """
-        return self.provider_scores.get(provider_name, 1.0)
+        score = self.provider_scores.get(provider_name, 1.0)
+        stats = self.latency_stats.get(provider_name)
+        if stats is None or stats.last_update is None:
+            return score
+        decay = math.exp(-(self._time_source() - stats.last_update) / _SCORE_RECOVERY_SECONDS)
+        return 1.0 + (score - 1.0) * decay
 
     def get_all_provider_scores(self) -> dict[str, float]:
         """获取所有提供商的评分.
@@ -202,6 +304,7 @@ class DataRouter:
             provider_name: 提供商名称
         """
         self.provider_scores[provider_name] = 1.0
+        self.latency_stats.pop(provider_name, None)
         if provider_name in self.provider_stats:
             self.provider_stats[provider_name] = {
                 "total_requests": 0,
@@ -32,6 +32,7 @@ class TableSchema:
     name: str
     columns: Sequence[ColumnDef]
     primary_key: Sequence[str] = ()
+    indexes: Sequence[Sequence[str]] = ()
 
     def create_ddl(self) -> str:
         column_defs: list[str] = [column.render() for column in self.columns]
@@ -45,10 +46,17 @@ class TableSchema:
             )
             """.strip()
 
+    def index_ddl(self) -> list[str]:
+        """Secondary index statements, one per entry in ``indexes``."""
+
+        return [f"CREATE INDEX IF NOT EXISTS idx_{self.name}_{'_'.join(columns)} ON {self.name} ({', '.join(columns)})" for columns in self.indexes]
+
     def ensure(self, conn: DuckDBPyConnection) -> None:
-        """Create the table on the provided connection if it does not exist."""
+        """Create the table (and its secondary indexes) on the provided connection if it does not exist."""
 
         conn.execute(self.create_ddl())
+        for ddl in self.index_ddl():
+            conn.execute(ddl)
 
 
 RAW_BASE_TABLE = TableSchema(
@@ -113,6 +121,34 @@ RAW_OHLCV_TABLE = TableSchema(
         ColumnDef("ingest_time", "TIMESTAMP", ("NOT NULL",)),
     ),
     primary_key=("supplier_symbol", "market", "ts", "batch_id"),
+    # No secondary index on the natural key: incremental ingestion bounds its key join by the batch's
+    # ts range, so zone maps already prune row groups, and an extra ART index only slows every insert.
+)
+
+
+PROMOTION_WATERMARKS_TABLE = TableSchema(
+    name="promotion_watermarks",
+    columns=(
+        ColumnDef("job", "VARCHAR", ("NOT NULL",)),
+        ColumnDef("ingest_time", "TIMESTAMP", ("NOT NULL",)),
+        ColumnDef("batch_id", "VARCHAR", ("NOT NULL",)),
+        ColumnDef("rows_promoted", "BIGINT", ("NOT NULL",)),
+        ColumnDef("updated_at", "TIMESTAMP", ("NOT NULL",)),
+    ),
+    primary_key=("job",),
+)
+
+
+PROMOTION_QUARANTINE_TABLE = TableSchema(
+    name="promotion_quarantine",
+    columns=(
+        ColumnDef("job", "VARCHAR", ("NOT NULL",)),
+        ColumnDef("batch_id", "VARCHAR", ("NOT NULL",)),
+        ColumnDef("supplier_symbol", "VARCHAR", ("NOT NULL",)),
+        ColumnDef("row_count", "BIGINT", ("NOT NULL",)),
+        ColumnDef("quarantined_at", "TIMESTAMP", ("NOT NULL",)),
+    ),
+    primary_key=("job", "batch_id", "supplier_symbol"),
 )
 
 
@@ -131,6 +167,7 @@ CORPORATE_ACTIONS_TABLE = TableSchema(
         ColumnDef("ingest_time", "TIMESTAMP", ("NOT NULL",)),
     ),
     primary_key=("market", "supplier_symbol", "event_type", "effective_date", "batch_id"),
+    indexes=(("market", "supplier_symbol", "effective_date"),),
 )
 
 
@@ -4,6 +4,7 @@ from vprism.core.exceptions.base import (
     AuthenticationError,
     CacheError,
     DataValidationError,
+    DeadlineExceededError,
     NetworkError,
     NoAvailableProviderError,
     NoCapableProviderError,
@@ -22,6 +23,7 @@ __all__ = [
     "DataValidationError",
     "NetworkError",
     "CacheError",
+    "DeadlineExceededError",
     "AuthenticationError",
     "NoCapableProviderError",
     "NoAvailableProviderError",
@@ -127,6 +127,21 @@ class NoAvailableProviderError(VPrismError):
         super().__init__(message, "ALL_PROVIDERS_FAILED", super_details)
 
 
+class DeadlineExceededError(VPrismError):
+    """Request deadline exceeded exception."""
+
+    def __init__(
+        self,
+        message: str,
+        timeout: float | None = None,
+        details: dict[str, Any] | None = None,
+    ):
+        super_details = details or {}
+        if timeout is not None:
+            super_details["timeout"] = timeout
+        super().__init__(message, "PROVIDER_TIMEOUT", super_details)
+
+
 class CacheError(VPrismError):
     """Cache exception."""
 
@@ -187,34 +187,34 @@ def _decimal_ratio(value: Decimal, denominator: Decimal) -> Decimal | None:
     return value / denominator
 
 
-def compute_corporate_action_factors(
-    symbol: str,
-    market: MarketType,
-    prices: Sequence[DataPoint],
+def accumulate_hfq_factors(
+    points: Sequence[DataPoint],
     dividends: Sequence[DividendEvent],
     splits: Sequence[SplitEvent],
-) -> FactorComputation:
-    if not prices:
-        return FactorComputation(factors=[], gap_dates=())
+    *,
+    hfq_factor: Decimal = Decimal("1"),
+    previous_close: Decimal | None = None,
+) -> tuple[list[date], list[Decimal], set[date]]:
+    """Accumulate hfq factors over time-sorted ``points``.
+
+    ``hfq_factor`` and ``previous_close`` seed the running state, so a series can
+    be resumed from any bar. Returns the bar dates, their hfq factors and the
+    dates whose events could not be applied.
+    """
 
-    sorted_points = sorted(prices, key=lambda point: point.timestamp)
-    merged_dividends = merge_same_day_dividends(dividends)
-    merged_splits = merge_same_day_splits(splits)
     dividend_map: dict[date, list[DividendEvent]] = defaultdict(list)
-    for event in merged_dividends:
-        dividend_map[event.ex_date].append(event)
+    for dividend in dividends:
+        dividend_map[dividend.ex_date].append(dividend)
 
     split_map: dict[date, list[SplitEvent]] = defaultdict(list)
-    for event in merged_splits:
-        split_map[event.ex_date].append(event)
+    for split in splits:
+        split_map[split.ex_date].append(split)
 
-    hfq_factor = Decimal("1")
     hfq_series: list[Decimal] = []
     dates: list[date] = []
     gap_dates: set[date] = set()
-    previous_close: Decimal | None = None
 
-    for point in sorted_points:
+    for point in points:
         current_date = point.timestamp.date()
         for event in dividend_map.get(current_date, []):
             if previous_close is None:
@@ -230,9 +230,9 @@ def compute_corporate_action_factors(
                 continue
             hfq_factor = hfq_factor / adjustment
 
-        for event in split_map.get(current_date, []):
-            denominator = Decimal(event.denominator)
-            ratio = _decimal_ratio(Decimal(event.numerator), denominator)
+        for split_event in split_map.get(current_date, []):
+            denominator = Decimal(split_event.denominator)
+            ratio = _decimal_ratio(Decimal(split_event.numerator), denominator)
             if ratio is None or ratio <= 0:
                 gap_dates.add(current_date)
                 continue
@@ -243,6 +243,24 @@ def compute_corporate_action_factors(
         if point.close_price is not None:
             previous_close = point.close_price
 
+    return dates, hfq_series, gap_dates
+
+
+def compute_corporate_action_factors(
+    symbol: str,
+    market: MarketType,
+    prices: Sequence[DataPoint],
+    dividends: Sequence[DividendEvent],
+    splits: Sequence[SplitEvent],
+) -> FactorComputation:
+    if not prices:
+        return FactorComputation(factors=[], gap_dates=())
+
+    sorted_points = sorted(prices, key=lambda point: point.timestamp)
+    merged_dividends = merge_same_day_dividends(dividends)
+    merged_splits = merge_same_day_splits(splits)
+    dates, hfq_series, gap_dates = accumulate_hfq_factors(sorted_points, merged_dividends, merged_splits)
+
     event_dates = {event.ex_date for event in merged_dividends} | {event.ex_date for event in merged_splits}
     missing_dates = event_dates.difference(dates)
     gap_dates.update(missing_dates)
@@ -282,5 +300,6 @@ __all__ = [
     "merge_same_day_dividends",
     "merge_same_day_splits",
     "merge_corporate_action_set",
+    "accumulate_hfq_factors",
     "compute_corporate_action_factors",
 ]
@@ -5,6 +5,7 @@ from vprism.core.health import (
     HealthStatus,
     get_health_checker,
 )
+from vprism.core.monitoring.latency import EWMA, P2Quantile, ProviderLatencyStats
 from vprism.core.monitoring.logging import PerformanceLogger, bind
 from vprism.core.monitoring.performance import (
     SlowQueryLogger,
@@ -21,4 +22,7 @@ __all__ = [
     "SlowQueryLogger",
     "SlowQueryObservation",
     "SlowQueryThresholds",
+    "EWMA",
+    "P2Quantile",
+    "ProviderLatencyStats",
 ]
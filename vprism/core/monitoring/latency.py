@@ -0,0 +1,137 @@
+"""Streaming latency estimators (EWMA and P² quantiles) for provider calls."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+
+class EWMA:
+    """Exponentially weighted moving average."""
+
+    def __init__(self, alpha: float = 0.2) -> None:
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError("alpha must be in (0, 1]")
+        self.alpha = alpha
+        self.value: float | None = None
+
+    def update(self, sample: float) -> float:
+        """Fold ``sample`` into the average and return the new value."""
+
+        self.value = sample if self.value is None else self.value + self.alpha * (sample - self.value)
+        return self.value
+
+
+class P2Quantile:
+    """Streaming quantile estimate in O(1) memory (Jain & Chlamtac P² algorithm)."""
+
+    def __init__(self, p: float) -> None:
+        if not 0.0 < p < 1.0:
+            raise ValueError("p must be in (0, 1)")
+        self.p = p
+        self.count = 0
+        self._heights: list[float] = []
+        self._positions = [0, 1, 2, 3, 4]
+        self._desired = [0.0, 2 * p, 4 * p, 2 + 2 * p, 4.0]
+        self._increments = [0.0, p / 2, p, (1 + p) / 2, 1.0]
+
+    @property
+    def value(self) -> float | None:
+        """Current quantile estimate, ``None`` before the first sample."""
+
+        if self.count == 0:
+            return None
+        if self.count <= 5:
+            ordered = sorted(self._heights)
+            return ordered[round(self.p * (len(ordered) - 1))]
+        return self._heights[2]
+
+    def update(self, sample: float) -> None:
+        """Add a sample to the estimate."""
+
+        self.count += 1
+        q = self._heights
+        if self.count <= 5:
+            q.append(sample)
+            if self.count == 5:
+                q.sort()
+            return
+
+        n = self._positions
+        if sample < q[0]:
+            q[0] = sample
+            k = 0
+        elif sample >= q[4]:
+            q[4] = sample
+            k = 3
+        else:
+            k = next(i for i in range(4) if q[i] <= sample < q[i + 1])
+
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        for i in range(1, 4):
+            d = self._desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                step = 1 if d > 0 else -1
+                candidate = self._parabolic(i, step)
+                q[i] = candidate if q[i - 1] < candidate < q[i + 1] else self._linear(i, step)
+                n[i] += step
+
+    def _parabolic(self, i: int, d: int) -> float:
+        q, n = self._heights, self._positions
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i]) + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def _linear(self, i: int, d: int) -> float:
+        q, n = self._heights, self._positions
+        return q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+
+
+@dataclass
+class ProviderLatencyStats:
+    """Per-provider call outcome and latency estimators."""
+
+    alpha: float = 0.2
+    latency: EWMA = field(init=False)
+    success_rate: EWMA = field(init=False)
+    p50: P2Quantile = field(init=False)
+    p95: P2Quantile = field(init=False)
+    total_requests: int = 0
+    successful_requests: int = 0
+    last_update: float | None = None
+
+    def __post_init__(self) -> None:
+        self.latency = EWMA(self.alpha)
+        self.success_rate = EWMA(self.alpha)
+        self.p50 = P2Quantile(0.5)
+        self.p95 = P2Quantile(0.95)
+
+    def record(self, success: bool, latency_ms: float, now: float) -> None:
+        """Record one provider call.
+
+        Latency quantiles only track successful calls; failures feed the
+        success-rate average so fast errors do not look like good latency.
+        """
+
+        self.total_requests += 1
+        self.success_rate.update(1.0 if success else 0.0)
+        if success:
+            self.successful_requests += 1
+            self.latency.update(latency_ms)
+            self.p50.update(latency_ms)
+            self.p95.update(latency_ms)
+        self.last_update = now
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the current estimates."""
+
+        return {
+            "ewma_latency_ms": self.latency.value,
+            "p50_latency_ms": self.p50.value,
+            "p95_latency_ms": self.p95.value,
+            "success_rate": self.success_rate.value,
+        }
@@ -1,21 +1,34 @@
 """Resilience patterns module."""
 
+from vprism.core.patterns.bulkhead import Bulkhead, BulkheadConfig, BulkheadRegistry
 from vprism.core.patterns.circuitbreaker import (
     CircuitBreaker,
     CircuitBreakerConfig,
     CircuitBreakerRegistry,
 )
+from vprism.core.patterns.hedging import HedgedExecutor, HedgingPolicy
+from vprism.core.patterns.ratelimit import SlidingWindowRateLimiter
 from vprism.core.patterns.resilient import ResilientExecutor
 from vprism.core.patterns.retry import (
     ExponentialBackoffRetry,
+    RetryBudget,
+    RetryBudgetRegistry,
     RetryConfig,
 )
 
 __all__ = [
+    "Bulkhead",
+    "BulkheadConfig",
+    "BulkheadRegistry",
     "CircuitBreaker",
     "CircuitBreakerRegistry",
     "CircuitBreakerConfig",
     "ExponentialBackoffRetry",
     "RetryConfig",
+    "RetryBudget",
+    "RetryBudgetRegistry",
     "ResilientExecutor",
+    "SlidingWindowRateLimiter",
+    "HedgedExecutor",
+    "HedgingPolicy",
 ]
@@ -0,0 +1,200 @@
+"""Bulkhead pattern: bounded concurrency and queueing per provider."""
+
+import asyncio
+import contextlib
+from collections import deque
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any, TypeVar
+
+from vprism.core.exceptions import RateLimitError
+from vprism.core.patterns.deadline import budget
+
+T = TypeVar("T")
+
+
+@dataclass
+class BulkheadConfig:
+    """Bulkhead configuration."""
+
+    max_concurrent: int = 10
+    max_queue: int = 100
+    max_wait: float = 5.0
+    name: str = "default"
+
+
+@dataclass
+class _Lease:
+    """Slot taken by one ``async with bulkhead`` block."""
+
+    held: bool = True
+    token: Token["_Lease | None"] | None = None
+
+
+class Bulkhead:
+    """Bulkhead implementation.
+
+    At most ``max_concurrent`` calls run at once; up to ``max_queue`` more wait
+    in FIFO order for at most ``max_wait`` seconds. Anything beyond that is
+    rejected immediately with ``RateLimitError`` so callers can reroute.
+    Waiters are plain futures on the running loop, so the bulkhead can be
+    shared across event loops as long as none are waiting.
+
+    A block that fans out into nested calls through the same bulkhead can hand
+    its slot back with :meth:`hand_back`, so the nested calls are bounded by the
+    bulkhead instead of deadlocking on the slot their parent holds.
+    """
+
+    def __init__(self, config: BulkheadConfig) -> None:
+        self.config = config
+        self.active = 0
+        self._lease: ContextVar[_Lease | None] = ContextVar(f"vprism_bulkhead_{config.name}", default=None)
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self.accepted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.max_queue_depth = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of calls waiting for a slot."""
+        return len(self._waiters)
+
+    async def acquire(self, timeout: float | None = None) -> None:
+        """Acquire a slot, waiting at most ``timeout`` (default ``max_wait``) seconds.
+
+        The wait is also capped by the time left on the current request deadline.
+
+        Raises:
+            RateLimitError: Queue full or wait timed out
+        """
+        if self.active < self.config.max_concurrent and not self._waiters:
+            self.active += 1
+            self.accepted += 1
+            return
+
+        if len(self._waiters) >= self.config.max_queue:
+            self.rejected += 1
+            raise RateLimitError(
+                f"Bulkhead full for {self.config.name}",
+                self.config.name,
+                details={"reason": "queue_full", **self._snapshot()},
+            )
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.max_queue_depth = max(self.max_queue_depth, len(self._waiters))
+        wait = budget(self.config.max_wait if timeout is None else min(timeout, self.config.max_wait)) or 0.0
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), wait)
+        except BaseException as e:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was handed over just as we gave up; pass it on.
+                self.release()
+            else:
+                waiter.cancel()
+                self._remove(waiter)
+            if isinstance(e, TimeoutError):
+                self.timed_out += 1
+                self.rejected += 1
+                raise RateLimitError(
+                    f"Bulkhead wait exceeded {wait}s for {self.config.name}",
+                    self.config.name,
+                    details={"reason": "queue_timeout", **self._snapshot()},
+                ) from None
+            raise
+        self.accepted += 1
+
+    def release(self) -> None:
+        """Release a slot, handing it to the oldest live waiter if any."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active = max(0, self.active - 1)
+
+    def hand_back(self) -> bool:
+        """Release the slot held by the current ``async with`` block early.
+
+        Returns False when the current context holds no slot (or already handed it back).
+        """
+        lease = self._lease.get()
+        if lease is None or not lease.held:
+            return False
+        lease.held = False
+        self.release()
+        return True
+
+    def _remove(self, waiter: asyncio.Future[None]) -> None:
+        with contextlib.suppress(ValueError):
+            self._waiters.remove(waiter)
+
+    async def call(self, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        """Call function inside the bulkhead."""
+        async with self:
+            return await func(*args, **kwargs)
+
+    async def __aenter__(self) -> "Bulkhead":
+        await self.acquire()
+        lease = _Lease()
+        lease.token = self._lease.set(lease)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        lease = self._lease.get()
+        if lease is None:
+            self.release()
+            return
+        if lease.token is not None:
+            self._lease.reset(lease.token)
+        if lease.held:
+            self.release()
+
+    def _snapshot(self) -> dict[str, Any]:
+        return {"active": self.active, "queue_depth": len(self._waiters)}
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get bulkhead statistics."""
+        return {
+            "name": self.config.name,
+            "max_concurrent": self.config.max_concurrent,
+            "max_queue": self.config.max_queue,
+            "active": self.active,
+            "queue_depth": len(self._waiters),
+            "max_queue_depth": self.max_queue_depth,
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+        }
+
+
+class BulkheadRegistry:
+    """Registry for named bulkheads."""
+
+    def __init__(self) -> None:
+        self._bulkheads: dict[str, Bulkhead] = {}
+
+    def get_or_create(self, name: str, config: BulkheadConfig | None = None) -> Bulkhead:
+        """Get or create a named bulkhead."""
+        if name not in self._bulkheads:
+            self._bulkheads[name] = Bulkhead(config or BulkheadConfig(name=name))
+        return self._bulkheads[name]
+
+    def get_bulkhead(self, name: str) -> Bulkhead | None:
+        """Get bulkhead by name."""
+        return self._bulkheads.get(name)
+
+    def get_all_stats(self) -> dict[str, dict[str, Any]]:
+        """Get all bulkhead statistics."""
+        return {name: b.get_stats() for name, b in self._bulkheads.items()}
+
+
+bulkhead_registry = BulkheadRegistry()
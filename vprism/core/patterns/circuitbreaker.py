@@ -2,6 +2,7 @@
 
 import asyncio
 import time
+from collections import deque
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from enum import Enum
@@ -22,13 +23,35 @@ class CircuitState(Enum):
 
 @dataclass
 class CircuitBreakerConfig:
-    """Circuit breaker configuration."""
+    """Circuit breaker configuration.
+
+    The breaker opens on ``failure_threshold`` consecutive failures, or once the
+    sliding window (last ``window_size`` calls within ``window_duration`` seconds)
+    holds at least ``minimum_calls`` calls and the failure rate or slow-call rate
+    reaches its threshold. Both rate thresholds default to ``None`` (disabled),
+    so rate-based tripping is opt-in per breaker.
+    """
 
     failure_threshold: int = 5
     recovery_timeout: float = 60.0
     half_open_max_calls: int = 3
     expected_exception: type = ProviderError
     name: str = "default"
+    window_size: int = 100
+    window_duration: float | None = 60.0
+    minimum_calls: int = 10
+    failure_rate_threshold: float | None = None
+    slow_call_duration: float = 10.0
+    slow_call_rate_threshold: float | None = None
+
+
+@dataclass
+class _CallRecord:
+    """One call outcome in the sliding window."""
+
+    at: float
+    failed: bool
+    slow: bool
 
 
 class CircuitBreaker:
@@ -41,6 +64,10 @@ class CircuitBreaker:
         self.last_failure_time: float | None = None
         self.success_count = 0
         self._lock = asyncio.Lock()
+        self._window: deque[_CallRecord] = deque(maxlen=max(config.window_size, 1))
+        self.last_trip_reason: str | None = None
+        self.transitions: dict[str, int] = {}
+        self.metrics: dict[str, dict[str, int]] = {state.value: {"successful": 0, "failed": 0, "slow": 0, "rejected": 0} for state in CircuitState}
 
     async def call(self, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
         """Call function with circuit breaker protection.
@@ -51,9 +78,10 @@ class CircuitBreaker:
         async with self._lock:
             if self.state == CircuitState.OPEN:
                 if self._should_attempt_reset():
-                    self.state = CircuitState.HALF_OPEN
+                    self._transition(CircuitState.HALF_OPEN)
                     self.success_count = 0
                 else:
+                    self.metrics[CircuitState.OPEN.value]["rejected"] += 1
                     raise ProviderError(
                         f"Circuit breaker OPEN for {self.config.name}",
                         provider_name=self.config.name,
@@ -62,6 +90,7 @@ class CircuitBreaker:
                     )
 
         # Execute outside lock to allow concurrent calls
+        started = time.monotonic()
         try:
             result = await func(*args, **kwargs)
         except Exception:
@@ -70,26 +99,84 @@ class CircuitBreaker:
             raise
         else:
             async with self._lock:
-                self._on_success()
+                self._on_success(time.monotonic() - started)
             return result
 
-    def _on_success(self) -> None:
+    def _on_success(self, duration: float = 0.0) -> None:
         """Handle successful call (must be called under lock)."""
+        slow = duration >= self.config.slow_call_duration
+        self._record(failed=False, slow=slow)
         if self.state == CircuitState.HALF_OPEN:
+            if slow:
+                self._trip("slow call while half-open")
+                return
             self.success_count += 1
             if self.success_count >= self.config.half_open_max_calls:
-                self.state = CircuitState.CLOSED
+                self._transition(CircuitState.CLOSED)
                 self.failure_count = 0
                 self.success_count = 0
+                self._window.clear()
         elif self.state == CircuitState.CLOSED:
             self.failure_count = 0
+            self._check_rates()
 
     def _on_failure(self) -> None:
         """Handle failed call (must be called under lock)."""
         self.failure_count += 1
         self.last_failure_time = time.time()
-        if self.failure_count >= self.config.failure_threshold:
-            self.state = CircuitState.OPEN
+        self._record(failed=True, slow=False)
+        if self.state == CircuitState.HALF_OPEN:
+            self._trip("failure while half-open")
+        elif self.failure_count >= self.config.failure_threshold:
+            self._trip(f"{self.failure_count} consecutive failures")
+        else:
+            self._check_rates()
+
+    def _record(self, failed: bool, slow: bool) -> None:
+        state = self.metrics[self.state.value]
+        state["failed" if failed else "successful"] += 1
+        if slow:
+            state["slow"] += 1
+        self._window.append(_CallRecord(time.monotonic(), failed, slow))
+
+    def _prune(self) -> None:
+        if self.config.window_duration is None:
+            return
+        horizon = time.monotonic() - self.config.window_duration
+        while self._window and self._window[0].at < horizon:
+            self._window.popleft()
+
+    def _rates(self) -> tuple[int, float, float]:
+        """Calls in window, failure rate and slow-call rate."""
+        self._prune()
+        calls = len(self._window)
+        if calls == 0:
+            return 0, 0.0, 0.0
+        failed = sum(1 for r in self._window if r.failed)
+        slow = sum(1 for r in self._window if r.slow)
+        return calls, failed / calls, slow / calls
+
+    def _check_rates(self) -> None:
+        calls, failure_rate, slow_rate = self._rates()
+        if calls < self.config.minimum_calls:
+            return
+        if self.config.failure_rate_threshold is not None and failure_rate >= self.config.failure_rate_threshold:
+            self._trip(f"failure rate {failure_rate:.0%} over {calls} calls")
+        elif self.config.slow_call_rate_threshold is not None and slow_rate >= self.config.slow_call_rate_threshold:
+            self._trip(f"slow-call rate {slow_rate:.0%} over {calls} calls")
+
+    def _trip(self, reason: str) -> None:
+        self.last_failure_time = time.time()  # recovery_timeout is measured from the trip
+        self.last_trip_reason = reason
+        self._transition(CircuitState.OPEN)
+        self._window.clear()
+
+    def _transition(self, state: CircuitState) -> None:
+        if state == self.state:
+            return
+        key = f"{self.state.value}->{state.value}"
+        self.transitions[key] = self.transitions.get(key, 0) + 1
+        self.state = state
 
     def _should_attempt_reset(self) -> bool:
         if self.last_failure_time is None:
@@ -104,6 +191,7 @@ class CircuitBreaker:
 
     def get_state(self) -> dict[str, Any]:
         """Get circuit breaker state info."""
+        calls, failure_rate, slow_rate = self._rates()
         return {
             "name": self.config.name,
             "state": self.state.value,
@@ -111,6 +199,12 @@ class CircuitBreaker:
             "success_count": self.success_count,
             "last_failure_time": self.last_failure_time,
             "remaining_time": self._get_remaining_time() if self.state == CircuitState.OPEN else 0.0,
+            "window_calls": calls,
+            "failure_rate": failure_rate,
+            "slow_call_rate": slow_rate,
+            "last_trip_reason": self.last_trip_reason,
+            "transitions": dict(self.transitions),
+            "metrics": {state: dict(counts) for state, counts in self.metrics.items()},
         }
 
     def reset(self) -> None:
@@ -119,6 +213,8 @@ class CircuitBreaker:
         self.failure_count = 0
         self.success_count = 0
         self.last_failure_time = None
+        self.last_trip_reason = None
+        self._window.clear()
 
 
 # Global registry for named circuit breakers
@@ -0,0 +1,103 @@
+"""Per-request deadlines propagated through the call path via a context variable."""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from vprism.core.exceptions import DeadlineExceededError
+
+
+@dataclass(frozen=True)
+class Deadline:
+    """Absolute deadline on the monotonic clock."""
+
+    expires_at: float
+    timeout: float
+
+    @classmethod
+    def after(cls, seconds: float) -> "Deadline":
+        """Deadline ``seconds`` from now."""
+        return cls(time.monotonic() + seconds, seconds)
+
+    def remaining(self) -> float:
+        """Seconds left, never negative."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return time.monotonic() >= self.expires_at
+
+    def check(self) -> None:
+        """Raise if the deadline has passed.
+
+        Raises:
+            DeadlineExceededError: Deadline has passed
+        """
+        if self.expired:
+            raise DeadlineExceededError(f"Deadline of {self.timeout}s exceeded", timeout=self.timeout)
+
+
+_current_deadline: ContextVar[Deadline | None] = ContextVar("vprism_deadline", default=None)
+
+
+def current_deadline() -> Deadline | None:
+    """Deadline of the current request, if any."""
+    return _current_deadline.get()
+
+
+def remaining_time(default: float | None = None) -> float | None:
+    """Seconds left on the current deadline, or ``default`` outside any deadline."""
+    deadline = _current_deadline.get()
+    return default if deadline is None else deadline.remaining()
+
+
+def budget(timeout: float | None) -> float | None:
+    """Clamp a per-call timeout to the time left on the current deadline."""
+    left = remaining_time()
+    if left is None:
+        return timeout
+    return left if timeout is None else min(timeout, left)
+
+
+@contextmanager
+def deadline_scope(seconds: float | None) -> Iterator[Deadline | None]:
+    """Run the block under a deadline ``seconds`` from now.
+
+    A scope can only tighten an enclosing deadline, never extend it.
+    ``None`` keeps the enclosing deadline unchanged.
+    """
+    outer = _current_deadline.get()
+    if seconds is None:
+        yield outer
+        return
+    deadline = Deadline.after(seconds)
+    if outer is not None and outer.expires_at <= deadline.expires_at:
+        deadline = outer
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+async def with_deadline[T](awaitable: Awaitable[T], timeout: float | None = None) -> T:
+    """Await ``awaitable`` within ``timeout`` and the current deadline.
+
+    Raises:
+        DeadlineExceededError: The current deadline ran out first
+        TimeoutError: ``timeout`` ran out first
+    """
+    limit = budget(timeout)
+    if limit is None:
+        return await awaitable
+    deadline = current_deadline()
+    try:
+        return await asyncio.wait_for(awaitable, limit)
+    except TimeoutError:
+        if deadline is not None and deadline.expired:
+            raise DeadlineExceededError(f"Deadline of {deadline.timeout}s exceeded", timeout=deadline.timeout) from None
+        raise
@@ -0,0 +1,103 @@
+"""对冲请求: 主请求超过延迟阈值仍未返回时向备选方发出第二个请求."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class HedgingPolicy:
+    """对冲策略配置."""
+
+    default_delay: float = 1.0
+    min_delay: float = 0.05
+    max_hedge_ratio: float = 0.1
+    burst: float = 2.0
+
+
+class HedgedExecutor:
+    """执行带预算上限的对冲请求.
+
+    预算为令牌桶: 每个请求补充 ``max_hedge_ratio`` 个令牌 (上限 ``burst``),
+    每次对冲消耗一个令牌, 因此长期对冲率不超过 ``max_hedge_ratio``。
+    """
+
+    def __init__(self, policy: HedgingPolicy | None = None) -> None:
+        self.policy = policy or HedgingPolicy()
+        self._tokens = self.policy.burst
+        self.requests = 0
+        self.hedges_sent = 0
+        self.hedge_wins = 0
+        self.primary_wins = 0
+        self.budget_denied = 0
+
+    def hedge_delay(self, p95_seconds: float | None) -> float:
+        """根据主请求的 p95 延迟计算对冲等待时间."""
+        if p95_seconds is None:
+            return self.policy.default_delay
+        return max(self.policy.min_delay, p95_seconds)
+
+    def _take_budget(self) -> bool:
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        self.budget_denied += 1
+        return False
+
+    async def execute(self, attempts: Sequence[Callable[[], Awaitable[T]]], delay: float) -> tuple[int, T]:
+        """执行主请求, 超过 ``delay`` 秒未返回时发出对冲请求, 先成功者胜出.
+
+        Args:
+            attempts: 按优先级排列的请求工厂, 只使用前两个
+            delay: 对冲等待时间(秒)
+
+        Returns:
+            (胜出请求的序号, 结果)
+        """
+        self.requests += 1
+        self._tokens = min(self.policy.burst, self._tokens + self.policy.max_hedge_ratio)
+
+        tasks: list[asyncio.Future[T]] = [asyncio.ensure_future(attempts[0]())]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done and len(attempts) > 1 and self._take_budget():
+                tasks.append(asyncio.ensure_future(attempts[1]()))
+                self.hedges_sent += 1
+
+            pending: set[asyncio.Future[T]] = set(tasks)
+            last_error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=tasks.index):
+                    error = task.exception()
+                    if error is None:
+                        index = tasks.index(task)
+                        if index == 0:
+                            self.primary_wins += 1
+                        else:
+                            self.hedge_wins += 1
+                        return index, task.result()
+                    last_error = error
+            if last_error is None:
+                raise RuntimeError("Hedged execution completed without result or exception.")
+            raise last_error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()  # 标记失败的落选请求已处理
+
+    def get_stats(self) -> dict[str, Any]:
+        """获取对冲统计."""
+        return {
+            "requests": self.requests,
+            "hedges_sent": self.hedges_sent,
+            "hedge_rate": self.hedges_sent / self.requests if self.requests else 0.0,
+            "hedge_wins": self.hedge_wins,
+            "primary_wins": self.primary_wins,
+            "budget_denied": self.budget_denied,
+        }
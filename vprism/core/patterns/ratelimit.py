@@ -0,0 +1,44 @@
+"""Sliding-window request rate limiter."""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any
+
+
+class SlidingWindowRateLimiter:
+    """Allow at most ``max_calls`` acquisitions within any ``period`` seconds."""
+
+    def __init__(self, max_calls: int, period: float = 60.0) -> None:
+        if max_calls < 1:
+            raise ValueError("max_calls must be >= 1")
+        self.max_calls = max_calls
+        self.period = period
+        self._calls: deque[float] = deque()
+        self.total_wait = 0.0
+
+    async def acquire(self) -> None:
+        """Wait until a call slot is available and take it.
+
+        The check and the append run without an intervening await, so no lock
+        is needed and the limiter is not bound to a particular event loop.
+        """
+        while True:
+            now = time.monotonic()
+            while self._calls and now - self._calls[0] >= self.period:
+                self._calls.popleft()
+            if len(self._calls) < self.max_calls:
+                self._calls.append(now)
+                return
+            wait = self.period - (now - self._calls[0])
+            self.total_wait += wait
+            await asyncio.sleep(wait)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get limiter statistics."""
+        return {
+            "max_calls": self.max_calls,
+            "period": self.period,
+            "in_window": len(self._calls),
+            "total_wait": self.total_wait,
+        }
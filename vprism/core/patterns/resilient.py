@@ -7,7 +7,8 @@ from vprism.core.patterns.circuitbreaker import (
     CircuitBreakerConfig,
     circuit_breaker_registry,
 )
-from vprism.core.patterns.retry import ExponentialBackoffRetry, RetryConfig
+from vprism.core.patterns.deadline import current_deadline
+from vprism.core.patterns.retry import ExponentialBackoffRetry, RetryConfig, retry_budget_registry
 
 T = TypeVar("T")
 
@@ -37,13 +38,20 @@ class ResilientExecutor:
 
         Returns:
             函数返回结果
+
+        Raises:
+            DeadlineExceededError: 当前请求的截止时间已过
         """
+        deadline = current_deadline()
+        if deadline is not None:
+            deadline.check()
+
         # 获取或创建熔断器
         circuit_config = CircuitBreakerConfig(name=self.circuit_breaker_name, **self.circuit_config)
         breaker = await circuit_breaker_registry.get_or_create(self.circuit_breaker_name, circuit_config)
 
-        # 获取或创建重试器
-        retry_config = RetryConfig(**self.retry_config)
+        # 获取或创建重试器 (同名重试器共享重试预算)
+        retry_config = RetryConfig(**{"budget": retry_budget_registry.get_or_create(self.retry_name), **self.retry_config})
         retry_instance = ExponentialBackoffRetry(retry_config)
 
         # 定义重试函数
@@ -8,6 +8,7 @@ from enum import Enum
 from typing import Any, TypeVar
 
 from vprism.core.exceptions import ProviderError, RateLimitError
+from vprism.core.patterns.deadline import remaining_time
 
 T = TypeVar("T")
 
@@ -21,9 +22,88 @@ class RetryState(Enum):
     FAILED = "failed"
 
 
+class RetryBudget:
+    """Shared retry budget (token pool) for one provider.
+
+    Every request deposits ``ratio`` tokens (capped at ``max_tokens``) and every
+    retry spends one, so over time retries stay within ``ratio`` of requests
+    no matter how many callers share the pool.
+    """
+
+    def __init__(self, ratio: float = 0.1, max_tokens: float = 10.0, name: str = "default") -> None:
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.name = name
+        self._tokens = max_tokens
+        self.requests = 0
+        self.retries = 0
+        self.denied = 0
+
+    def record_request(self) -> None:
+        """Record a first attempt and top up the pool."""
+        self.requests += 1
+        self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_acquire(self) -> bool:
+        """Spend one token for a retry, if available."""
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            self.retries += 1
+            return True
+        self.denied += 1
+        return False
+
+    @property
+    def amplification(self) -> float:
+        """Attempts sent per request (1.0 means no retries)."""
+        return (self.requests + self.retries) / self.requests if self.requests else 1.0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get retry budget statistics."""
+        return {
+            "name": self.name,
+            "ratio": self.ratio,
+            "tokens": self._tokens,
+            "requests": self.requests,
+            "retries": self.retries,
+            "denied": self.denied,
+            "amplification": self.amplification,
+        }
+
+
+class RetryBudgetRegistry:
+    """Registry for named retry budgets."""
+
+    def __init__(self) -> None:
+        self._budgets: dict[str, RetryBudget] = {}
+
+    def get_or_create(self, name: str, ratio: float = 0.1, max_tokens: float = 10.0) -> RetryBudget:
+        """Get or create a named retry budget."""
+        if name not in self._budgets:
+            self._budgets[name] = RetryBudget(ratio=ratio, max_tokens=max_tokens, name=name)
+        return self._budgets[name]
+
+    def get_budget(self, name: str) -> RetryBudget | None:
+        """Get retry budget by name."""
+        return self._budgets.get(name)
+
+    def get_all_stats(self) -> dict[str, dict[str, Any]]:
+        """Get all retry budget statistics."""
+        return {name: b.get_stats() for name, b in self._budgets.items()}
+
+
+retry_budget_registry = RetryBudgetRegistry()
+
+
 @dataclass
 class RetryConfig:
-    """Retry configuration."""
+    """Retry configuration.
+
+    ``RateLimitError`` is skipped by default, unless it carries a ``retry_after``
+    within ``max_delay`` and ``respect_retry_after`` is set; then the retry waits
+    exactly that long. With a ``budget``, retries are only made while the shared
+    pool has tokens.
+    """
 
     max_attempts: int = 3
     base_delay: float = 1.0
@@ -32,6 +112,8 @@ class RetryConfig:
     jitter: bool = True
     retry_on_exceptions: list[type] = field(default_factory=lambda: [ProviderError])
     skip_on_exceptions: list[type] = field(default_factory=lambda: [RateLimitError])
+    respect_retry_after: bool = True
+    budget: RetryBudget | None = None
 
 
 class ExponentialBackoffRetry:
@@ -49,6 +131,9 @@ class ExponentialBackoffRetry:
         self.state = RetryState.RUNNING
         self.attempt_count = 0
         self.total_delay = 0.0
+        budget = self.config.budget
+        if budget is not None:
+            budget.record_request()
 
         while self.attempt_count < self.config.max_attempts:
             try:
@@ -59,16 +144,26 @@ class ExponentialBackoffRetry:
             except Exception as e:
                 self.last_exception = e
 
-                if any(isinstance(e, t) for t in self.config.skip_on_exceptions):
+                retry_after = self._retry_after(e)
+                if retry_after is None and any(isinstance(e, t) for t in self.config.skip_on_exceptions):
                     self.state = RetryState.FAILED
                     raise
 
-                should_retry = any(isinstance(e, t) for t in self.config.retry_on_exceptions)
+                should_retry = retry_after is not None or any(isinstance(e, t) for t in self.config.retry_on_exceptions)
                 if not should_retry or self.attempt_count >= self.config.max_attempts:
                     self.state = RetryState.FAILED
                     raise
 
-                delay = self._calculate_delay(self.attempt_count - 1)
+                delay = retry_after if retry_after is not None else self._calculate_delay(self.attempt_count - 1)
+                left = remaining_time()
+                if left is not None and left <= delay:
+                    # 截止时间内已无法完成下一次重试
+                    self.state = RetryState.FAILED
+                    raise
+                if budget is not None and not budget.try_acquire():
+                    # 重试预算耗尽: 放弃重试, 避免放大故障提供商的负载
+                    self.state = RetryState.FAILED
+                    raise
                 await asyncio.sleep(delay)
                 self.total_delay += delay
 
@@ -76,6 +171,13 @@ class ExponentialBackoffRetry:
             raise self.last_exception
         raise RuntimeError("Retry loop completed without success or exception.")
 
+    def _retry_after(self, error: Exception) -> float | None:
+        """Server-provided wait for a rate-limit error, if it should be honoured."""
+        if not self.config.respect_retry_after or not isinstance(error, RateLimitError) or error.retry_after is None:
+            return None
+        retry_after = float(error.retry_after)
+        return retry_after if 0 <= retry_after <= self.config.max_delay else None
+
     def _calculate_delay(self, attempt: int) -> float:
         """Calculate delay with exponential backoff and jitter."""
         delay = self.config.base_delay * (self.config.exponential_base**attempt)
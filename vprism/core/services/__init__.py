@@ -1,12 +1,22 @@
 """Services module - business logic layer."""
 
-from vprism.core.services.adjustment import PriceAdjuster, adjust_prices
+from vprism.core.services.adjustment import PriceAdjuster, adjust_frame, adjust_prices
+from vprism.core.services.corporate_actions import CorporateActionBatch, CorporateActionService
 from vprism.core.services.data import DataService
+from vprism.core.services.factor_store import AdjustmentFactorStore, FactorBuild
+from vprism.core.services.factors import FactorFrame, compute_factor_frame
 from vprism.core.services.symbols import SymbolService
 
 __all__ = [
+    "AdjustmentFactorStore",
+    "CorporateActionBatch",
+    "CorporateActionService",
     "DataService",
+    "FactorBuild",
+    "FactorFrame",
     "PriceAdjuster",
     "SymbolService",
+    "adjust_frame",
     "adjust_prices",
+    "compute_factor_frame",
 ]
@@ -1,16 +1,30 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from datetime import date
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd  # type: ignore[import-untyped]
 
 from vprism.core.models.corporate_actions import CorporateActionFactor  # noqa: TCH001
 from vprism.core.models.query import Adjustment
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Sequence
+    from decimal import Decimal
+
+    import numpy.typing as npt
 
     from vprism.core.models.base import DataPoint  # noqa: TCH001
 
+# DataPoint 与列式 (ohlcv 表) 两种表示下需要按因子缩放的价格字段
+_POINT_PRICES = ("open_price", "high_price", "low_price", "close_price")
+_FRAME_PRICES = ("open", "high", "low", "close")
+_FACTOR_COLUMNS = {Adjustment.FORWARD: "forward_factor", Adjustment.BACKWARD: "backward_factor"}
+# 复合键: 高 32 位为 symbol 编码, 低 32 位为偏移后的日序号, 一次 searchsorted 即可完成分组 asof
+DAY_OFFSET = 1 << 31
+
 
 @dataclass(slots=True)
 class AdjustmentContext:
@@ -18,30 +32,155 @@ class AdjustmentContext:
     factors: dict[str, CorporateActionFactor] | None = None
 
 
+def epoch_days(values: Any) -> npt.NDArray[np.int64]:
+    """时间戳按其本地日期折算为 epoch 天数 (与 ``timestamp.date()`` 一致)."""
+
+    index = pd.DatetimeIndex(values)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return np.asarray(index.values.astype("datetime64[D]").astype(np.int64), dtype=np.int64)
+
+
+def day_keys(days: npt.NDArray[np.int64], codes: npt.NDArray[np.int64] | None = None) -> npt.NDArray[np.int64]:
+    """按 (symbol 编码, 日) 排序的 int64 复合键; ``codes`` 为 None 时仅按日."""
+
+    keys = days + DAY_OFFSET
+    return keys if codes is None else keys | (codes << 32)
+
+
+def _align(
+    bar_days: npt.NDArray[np.int64],
+    factor_days: npt.NDArray[np.int64],
+    *,
+    bar_codes: npt.NDArray[np.int64] | None = None,
+    factor_codes: npt.NDArray[np.int64] | None = None,
+    tolerance: int | None = 0,
+) -> npt.NDArray[np.int64]:
+    """Backward merge-asof of bars onto a factor series.
+
+    Returns, for each bar, the index of the latest factor row of the same symbol
+    dated no later than the bar and at most ``tolerance`` days earlier
+    (``None`` = unlimited), or -1 when there is none. Bars need not be sorted.
+    """
+
+    if not len(factor_days) or not len(bar_days):
+        return np.full(len(bar_days), -1, dtype=np.int64)
+    grouped = bar_codes is not None and factor_codes is not None
+    bar_keys = day_keys(bar_days, bar_codes if grouped else None)
+    factor_keys = day_keys(factor_days, factor_codes if grouped else None)
+    order = np.argsort(factor_keys, kind="stable")
+    sorted_keys = factor_keys[order]
+    # side="right" 使同键重复时取最后一条, 与 dict 覆盖语义一致
+    pos = np.searchsorted(sorted_keys, bar_keys, side="right") - 1
+    hit = pos >= 0
+    safe = np.where(hit, pos, 0)
+    matched = sorted_keys[safe]
+    hit &= (matched >> 32) == (bar_keys >> 32)
+    if tolerance is not None:
+        hit &= (bar_keys - matched) <= tolerance
+    return np.where(hit, order[safe], -1).astype(np.int64)
+
+
+def _scale(
+    prices: dict[str, npt.NDArray[np.float64]],
+    volume: npt.NDArray[np.float64] | None,
+    factor: npt.NDArray[np.float64],
+) -> None:
+    """价格列乘以因子, 成交量除以因子 (因子为 0 时保持不变); 原地修改."""
+
+    for column in prices.values():
+        np.multiply(column, factor, out=column)
+    if volume is not None:
+        np.divide(volume, factor, out=volume, where=factor != 0)
+
+
+def _factor_frame(factors: pd.DataFrame | Sequence[CorporateActionFactor]) -> pd.DataFrame:
+    if isinstance(factors, pd.DataFrame):
+        return factors
+    return pd.DataFrame(
+        {
+            "symbol": [f.symbol for f in factors],
+            "date": [f.date for f in factors],
+            "forward_factor": np.array([float(f.forward_factor) for f in factors], dtype=np.float64),
+            "backward_factor": np.array([float(f.backward_factor) for f in factors], dtype=np.float64),
+        }
+    )
+
+
+def adjust_frame(
+    frame: pd.DataFrame,
+    factors: pd.DataFrame | Sequence[CorporateActionFactor],
+    mode: Adjustment | None,
+    *,
+    time_column: str = "ts",
+    tolerance: int | None = 0,
+) -> pd.DataFrame:
+    """列式复权: 对 ohlcv 形态的 DataFrame 一次向量化完成对齐与缩放.
+
+    ``factors`` 为 ``symbol/date/forward_factor/backward_factor`` 列的 DataFrame
+    或 ``CorporateActionFactor`` 序列. 两侧均有 ``symbol`` 列时按 symbol 分组对齐,
+    否则仅按日期. ``tolerance`` 为 asof 回看天数, 默认 0 即精确日期匹配
+    (与 ``adjust_prices`` 一致), ``None`` 表示沿用最近一次因子. 返回新的 DataFrame,
+    未匹配到因子的行保持原值.
+    """
+
+    if mode is None or mode == Adjustment.NONE or frame.empty:
+        return frame
+    table = _factor_frame(factors)
+    if table.empty:
+        return frame.copy()
+
+    bar_codes = factor_codes = None
+    if "symbol" in frame.columns and "symbol" in table.columns:
+        # 只对 bar 侧做一次 factorize, 因子侧按唯一值映射 (不在 bar 中的 symbol 编码为 -1, 不会命中)
+        codes, uniques = pd.factorize(frame["symbol"])
+        bar_codes = codes.astype(np.int64)
+        factor_codes = pd.Index(uniques).get_indexer(table["symbol"]).astype(np.int64)
+    index = _align(
+        epoch_days(frame[time_column]),
+        epoch_days(table["date"]),
+        bar_codes=bar_codes,
+        factor_codes=factor_codes,
+        tolerance=tolerance,
+    )
+    values = table[_FACTOR_COLUMNS[mode]].to_numpy(dtype=np.float64)
+    factor = np.where(index >= 0, values[np.maximum(index, 0)], 1.0)
+
+    prices = {name: frame[name].to_numpy(dtype=np.float64, copy=True) for name in _FRAME_PRICES if name in frame.columns}
+    volume = frame["volume"].to_numpy(dtype=np.float64, copy=True) if "volume" in frame.columns else None
+    _scale(prices, volume, factor)
+    if volume is not None:
+        prices["volume"] = volume
+    return frame.assign(**prices)
+
+
 class PriceAdjuster:
     def apply(self, points: Iterable[DataPoint], context: AdjustmentContext) -> list[DataPoint]:
-        if context.mode == Adjustment.NONE:
-            return list(points)
+        points = list(points)
+        if context.mode == Adjustment.NONE or not points or not context.factors:
+            return points
+        series = list(context.factors.values())
+        index = _align(
+            np.array([p.timestamp.date().toordinal() for p in points], dtype=np.int64),
+            np.array([date.fromisoformat(key).toordinal() for key in context.factors], dtype=np.int64),
+        )
+        forward = context.mode == Adjustment.FORWARD
         out: list[DataPoint] = []
-        factors = context.factors or {}
-        for p in points:
-            key = p.timestamp.date().isoformat()
-            f = factors.get(key)
-            if not f:
+        # Decimal 精度下逐 bar 计算, 但每个 bar 只做一次 model_copy
+        for p, i in zip(points, index.tolist(), strict=True):
+            if i < 0:
                 out.append(p)
                 continue
-            factor = f.forward_factor if context.mode == Adjustment.FORWARD else f.backward_factor
-            if p.close_price is not None:
-                p = p.model_copy(update={"close_price": p.close_price * factor})
-            if p.open_price is not None:
-                p = p.model_copy(update={"open_price": p.open_price * factor})
-            if p.high_price is not None:
-                p = p.model_copy(update={"high_price": p.high_price * factor})
-            if p.low_price is not None:
-                p = p.model_copy(update={"low_price": p.low_price * factor})
+            f = series[i]
+            factor: Decimal = f.forward_factor if forward else f.backward_factor
+            update: dict[str, Decimal] = {}
+            for name in _POINT_PRICES:
+                value = getattr(p, name)
+                if value is not None:
+                    update[name] = value * factor
             if p.volume is not None and factor != 0:
-                p = p.model_copy(update={"volume": p.volume / factor})
-            out.append(p)
+                update["volume"] = p.volume / factor
+            out.append(p.model_copy(update=update) if update else p)
         return out
 
 
@@ -0,0 +1,312 @@
+"""Corporate action storage and lookup backed by the ``corporate_actions`` table."""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from fractions import Fraction
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
+
+import pandas as pd  # type: ignore[import-untyped]
+from pydantic import ValidationError
+
+try:  # pragma: no cover - optional at runtime for typing.
+    from duckdb import DuckDBPyConnection
+except Exception:  # pragma: no cover
+    DuckDBPyConnection = "DuckDBPyConnection"  # type: ignore[misc,assignment]
+
+from vprism.core.data.schema import CORPORATE_ACTIONS_TABLE
+from vprism.core.models.corporate_actions import (
+    CorporateActionSet,
+    DividendEvent,
+    SplitEvent,
+    merge_same_day_dividends,
+    merge_same_day_splits,
+)
+from vprism.core.models.market import MarketType  # noqa: TC001
+from vprism.core.models.query import Adjustment
+from vprism.core.services.adjustment import adjust_prices
+from vprism.core.services.factor_store import AdjustmentFactorStore, FactorBuild
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from vprism.core.models.base import DataPoint
+
+DIVIDEND = "dividend"
+SPLIT = "split"
+
+_STAGE_VIEW = "vprism_corporate_actions_stage"
+_EMPTY = CorporateActionSet(dividends=(), splits=())
+
+
+@dataclass(slots=True, frozen=True)
+class CorporateActionBatch:
+    """Outcome of one :meth:`CorporateActionService.ingest` call."""
+
+    batch_id: str
+    dividends: int
+    splits: int
+    symbols: tuple[str, ...]
+
+
+def _slice(action_set: CorporateActionSet, start: date | None, end: date | None) -> CorporateActionSet:
+    if start is None and end is None:
+        return action_set
+
+    def _window[E: (DividendEvent, SplitEvent)](events: Sequence[E]) -> tuple[E, ...]:
+        dates = [event.ex_date for event in events]
+        lo = bisect_left(dates, start) if start is not None else 0
+        hi = bisect_right(dates, end) if end is not None else len(dates)
+        return tuple(events[lo:hi])
+
+    return CorporateActionSet(dividends=_window(action_set.dividends), splits=_window(action_set.splits))
+
+
+def _dividend_type(currency: str | None) -> str:
+    """``event_type`` of a dividend; the currency is part of it, so same-day dividends in several currencies keep distinct keys."""
+
+    return f"{DIVIDEND}:{currency}" if currency else DIVIDEND
+
+
+def _row_event(
+    symbol: str, market: MarketType, event_type: str, effective: date, cash: float | None, ratio: float | None, payload: str | None
+) -> DividendEvent | SplitEvent:
+    """Rebuild an event from its stored payload, or from the typed columns when the payload is foreign."""
+
+    kind, _, currency = event_type.partition(":")
+    model = DividendEvent if kind == DIVIDEND else SplitEvent
+    if payload:
+        try:
+            return model.model_validate_json(payload)
+        except ValidationError:
+            pass
+    if kind == DIVIDEND:
+        return DividendEvent(symbol=symbol, market=market, ex_date=effective, cash_amount=Decimal(repr(cash)), currency=currency or None)
+    fraction = Fraction(repr(ratio)).limit_denominator(10_000)
+    return SplitEvent(symbol=symbol, market=market, ex_date=effective, numerator=fraction.numerator, denominator=fraction.denominator)
+
+
+class CorporateActionService:
+    """Persist dividend/split events and serve them to the adjustment path.
+
+    Events are written in bulk per batch; when the same event appears in several
+    batches the most recently ingested one wins. Full per-symbol event sets are
+    kept in a bounded LRU cache that is invalidated for every symbol a batch
+    touches, so adjusted queries are served without a provider round-trip. Each
+    invalidation bumps the key's generation, and a load that raced with one is
+    returned but not cached.
+
+    Adjustment factors are materialized in ``factor_store`` from each symbol's
+    full bar history; they are stale when the stored event hash no longer
+    matches the symbol's events, so staleness survives a restart.
+    """
+
+    def __init__(self, conn: DuckDBPyConnection, *, cache_size: int = 4096, factor_store: AdjustmentFactorStore | None = None) -> None:
+        self.conn = conn
+        self.cache_size = cache_size
+        self.factor_store = factor_store or AdjustmentFactorStore(conn)
+        # Shared with the factor store: every statement on the connection runs under it.
+        self._conn_lock = self.factor_store.lock
+        self._cache: OrderedDict[tuple[MarketType, str], CorporateActionSet] = OrderedDict()
+        self._generations: dict[tuple[MarketType, str], int] = {}
+        self._epoch = 0
+        self._lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        CORPORATE_ACTIONS_TABLE.ensure(conn)
+
+    def ingest(
+        self,
+        dividends: Sequence[DividendEvent] = (),
+        splits: Sequence[SplitEvent] = (),
+        *,
+        batch_id: str | None = None,
+    ) -> CorporateActionBatch:
+        """Write one batch of events; re-ingesting a ``batch_id`` replaces its rows.
+
+        Same-day events are merged first, as :func:`compute_corporate_action_factors` would.
+        """
+
+        batch_id = batch_id or uuid4().hex
+        merged_dividends = merge_same_day_dividends(dividends)
+        merged_splits = merge_same_day_splits(splits)
+        rows: list[tuple[Any, ...]] = [
+            (
+                event.market.value,
+                event.symbol,
+                _dividend_type(event.currency),
+                event.ex_date,
+                float(event.cash_amount),
+                None,
+                event.model_dump_json(),
+                event.source,
+            )
+            for event in merged_dividends
+        ]
+        rows += [
+            (event.market.value, event.symbol, SPLIT, event.ex_date, None, float(event.ratio), event.model_dump_json(), event.source) for event in merged_splits
+        ]
+        stage = pd.DataFrame(
+            rows,
+            columns=["market", "supplier_symbol", "event_type", "effective_date", "dividend_cash", "split_ratio", "raw_payload", "source"],
+        ).astype({"market": object, "supplier_symbol": object, "event_type": object, "raw_payload": object, "source": object})
+        stage["dividend_cash"] = stage["dividend_cash"].astype("float64")
+        stage["split_ratio"] = stage["split_ratio"].astype("float64")
+
+        with self._conn_lock:
+            self.conn.execute("BEGIN TRANSACTION")
+            try:
+                self.conn.execute("DELETE FROM corporate_actions WHERE batch_id = ?", [batch_id])
+                if rows:
+                    self.conn.register(_STAGE_VIEW, stage)
+                    try:
+                        self.conn.execute(
+                            f"""
+                            INSERT OR REPLACE INTO corporate_actions
+                            SELECT market, supplier_symbol, event_type, CAST(effective_date AS DATE), dividend_cash, split_ratio,
+                                   CAST(raw_payload AS JSON), source, ?, ?
+                            FROM {_STAGE_VIEW}
+                            """,
+                            [batch_id, datetime.now(UTC).replace(tzinfo=None)],
+                        )
+                    finally:
+                        self.conn.unregister(_STAGE_VIEW)
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+
+        touched = {(event.market, event.symbol) for event in merged_dividends} | {(event.market, event.symbol) for event in merged_splits}
+        self.invalidate(touched)
+        return CorporateActionBatch(
+            batch_id=batch_id,
+            dividends=len(merged_dividends),
+            splits=len(merged_splits),
+            symbols=tuple(sorted({symbol for _, symbol in touched})),
+        )
+
+    def lookup(
+        self,
+        market: MarketType,
+        symbols: Sequence[str],
+        *,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> dict[str, CorporateActionSet]:
+        """Events of ``symbols`` with ``start <= effective_date <= end``, read from the table."""
+
+        query = """
+            SELECT supplier_symbol, event_type, effective_date, dividend_cash, split_ratio, CAST(raw_payload AS VARCHAR)
+            FROM corporate_actions
+            WHERE market = ? AND list_contains(?, supplier_symbol)
+        """
+        params: list[object] = [market.value, list(symbols)]
+        if start is not None:
+            query += " AND effective_date >= ?"
+            params.append(start)
+        if end is not None:
+            query += " AND effective_date <= ?"
+            params.append(end)
+        query += """
+            QUALIFY row_number() OVER (PARTITION BY supplier_symbol, event_type, effective_date ORDER BY ingest_time DESC, batch_id DESC) = 1
+            ORDER BY supplier_symbol, effective_date
+        """
+        dividends: dict[str, list[DividendEvent]] = defaultdict(list)
+        splits: dict[str, list[SplitEvent]] = defaultdict(list)
+        with self._conn_lock:
+            stored = self.conn.execute(query, params).fetchall()
+        for symbol, event_type, effective, cash, ratio, payload in stored:
+            event = _row_event(symbol, market, event_type, effective, cash, ratio, payload)
+            if isinstance(event, DividendEvent):
+                dividends[symbol].append(event)
+            else:
+                splits[symbol].append(event)
+        return {symbol: CorporateActionSet(dividends=tuple(dividends[symbol]), splits=tuple(splits[symbol])) for symbol in symbols}
+
+    def events(self, symbol: str, market: MarketType, *, start: date | None = None, end: date | None = None) -> CorporateActionSet:
+        """Cached event set of one symbol, optionally narrowed to ``[start, end]``."""
+
+        key = (market, symbol)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+            generation = (self._epoch, self._generations.get(key, 0))
+        if cached is None:
+            cached = self.lookup(market, [symbol]).get(symbol, _EMPTY)
+            with self._lock:
+                self.cache_misses += 1
+                # An ingest committed while we were reading; our copy may predate it.
+                if generation == (self._epoch, self._generations.get(key, 0)):
+                    self._cache[key] = cached
+                    self._cache.move_to_end(key)
+                    while len(self._cache) > self.cache_size:
+                        self._cache.popitem(last=False)
+        return _slice(cached, start, end)
+
+    def has_events(self, symbol: str, market: MarketType) -> bool:
+        """True when any dividend or split is stored for the symbol."""
+
+        action_set = self.events(symbol, market)
+        return bool(action_set.dividends or action_set.splits)
+
+    def needs_factors(self, symbol: str, market: MarketType, through: date) -> bool:
+        """True when stored factors do not reach ``through`` or were built from other events."""
+
+        action_set = self.events(symbol, market)
+        return not self.factor_store.is_current(symbol, market, action_set.dividends, action_set.splits, through)
+
+    def build_factors(self, symbol: str, market: MarketType, history: Sequence[DataPoint]) -> FactorBuild:
+        """Rebuild the stored factors of ``symbol`` from its full raw bar history and current events."""
+
+        action_set = self.events(symbol, market)
+        return self.factor_store.build(symbol, market, history, action_set.dividends, action_set.splits)
+
+    def invalidate(self, keys: Iterable[tuple[MarketType, str]] | None = None) -> None:
+        """Drop cached event sets for ``keys``, or all of them."""
+
+        with self._lock:
+            if keys is None:
+                self._cache.clear()
+                self._epoch += 1
+                return
+            for key in keys:
+                self._cache.pop(key, None)
+                self._generations[key] = self._generations.get(key, 0) + 1
+
+    def adjust(self, points: Sequence[DataPoint], mode: Adjustment | None) -> list[DataPoint]:
+        """Adjust raw bars with the stored factors of their symbols.
+
+        Factors come from ``factor_store``, so qfq/hfq match a full-history
+        adjustment whatever window ``points`` covers; call :meth:`build_factors`
+        first when :meth:`needs_factors` says so. Symbols without events and
+        bars without a stored factor are returned unchanged.
+        """
+
+        if mode is None or mode == Adjustment.NONE or not points:
+            return list(points)
+        groups: dict[tuple[MarketType, str], list[DataPoint]] = defaultdict(list)
+        for point in points:
+            groups[(point.market, point.symbol)].append(point)
+        adjusted: dict[int, DataPoint] = {}
+        for (market, symbol), bars in groups.items():
+            if not self.has_events(symbol, market):
+                continue
+            days = [bar.timestamp.date() for bar in bars]
+            factors = self.factor_store.factors(symbol, market, start=min(days), end=max(days))
+            for before, after in zip(bars, adjust_prices(bars, mode, factors), strict=True):
+                adjusted[id(before)] = after
+        return [adjusted.get(id(point), point) for point in points]
+
+    def get_stats(self) -> dict[str, int]:
+        """Cache statistics."""
+
+        with self._lock:
+            return {"cached_symbols": len(self._cache), "cache_hits": self.cache_hits, "cache_misses": self.cache_misses}
@@ -1,21 +1,30 @@
 """Core data service — unified access layer over router, cache, and storage."""
 
 import asyncio
+import time
+from collections.abc import AsyncIterator
 from datetime import date, datetime, timedelta
+from functools import partial
 from typing import Any, cast
 
 from loguru import logger
 
+from vprism.core.config.settings import ProviderConfig
 from vprism.core.data.cache.multilevel import MultiLevelCache
+from vprism.core.data.providers.base import DataChunk, DataProvider
 from vprism.core.data.providers.registry import ProviderRegistry
 from vprism.core.data.repositories.data import DataRepository
 from vprism.core.data.routing import DataRouter
 from vprism.core.data.storage.database import DatabaseManager
+from vprism.core.exceptions import DeadlineExceededError, ProviderError
 from vprism.core.models.base import DataPoint
 from vprism.core.models.market import AssetType, MarketType, TimeFrame
 from vprism.core.models.query import DataQuery
 from vprism.core.models.response import DataResponse, ProviderInfo, ResponseMetadata
 from vprism.core.monitoring import PerformanceLogger
+from vprism.core.patterns.circuitbreaker import CircuitBreakerConfig, CircuitBreakerRegistry, circuit_breaker_registry
+from vprism.core.patterns.deadline import deadline_scope, with_deadline
+from vprism.core.patterns.hedging import HedgedExecutor
 
 # Shared period-to-timedelta mapping (used by get_historical and QueryBuilder)
 PERIOD_MAPPING: dict[str, timedelta] = {
@@ -47,10 +56,18 @@ class DataService:
         router: DataRouter | None = None,
         cache: MultiLevelCache | None = None,
         repository: DataRepository | None = None,
+        hedger: HedgedExecutor | None = None,
+        failover_timeout: float = 30.0,
+        breakers: CircuitBreakerRegistry | None = None,
+        provider_config: ProviderConfig | None = None,
     ):
         self.router = router or DataRouter(ProviderRegistry())
         self.cache = cache or MultiLevelCache()
         self.repository = repository or DataRepository(DatabaseManager())
+        self.hedger = hedger
+        self.failover_timeout = failover_timeout
+        self.breakers = breakers or circuit_breaker_registry
+        self.provider_config = provider_config or ProviderConfig()
 
     # ------------------------------------------------------------------ #
     # Simple API
@@ -117,10 +134,9 @@ class DataService:
                 cached=True,
             )
 
-        # 2. Provider fetch
+        # 2. Provider fetch (ranked failover, hedging each provider with the next when a hedger is set)
         try:
-            provider = await self.router.route_query(query)
-            response: DataResponse = await provider.get_data(query)
+            response = await self._fetch_with_failover(query)
 
             if response.data:
                 await self.cache.set_data(query, response.data)
@@ -139,6 +155,111 @@ class DataService:
                 return fallback
             raise
 
+    async def _fetch_with_failover(self, query: DataQuery) -> DataResponse:
+        """Try ranked candidate providers in order within ``failover_timeout`` seconds.
+
+        The timeout is applied as a request deadline (tightening any deadline set
+        by the caller), so retries and waits further down share the same budget.
+        Each attempt runs through the provider's bulkhead and circuit breaker, so a
+        saturated or known-down provider costs one fast rejection rather than a timeout.
+        With a hedger, a provider still pending after its p95 latency is hedged with
+        the next candidate; failover resumes after whichever of the pair was tried.
+        """
+        candidates = await self.router.route_candidates(query)
+        errors: dict[str, str] = {}
+        last_error: Exception | None = None
+
+        with deadline_scope(self.failover_timeout) as deadline:
+            remaining = list(candidates)
+            while remaining:
+                if deadline is not None and deadline.expired:
+                    break
+                provider = remaining.pop(0)
+                try:
+                    if self.hedger is None or not remaining:
+                        return await self._attempt(provider, query, errors)
+                    backup = remaining[0]
+                    delay = self.router.hedge_delay(provider.name, self.hedger)
+                    _, response = await self.hedger.execute([partial(self._attempt, p, query, errors) for p in (provider, backup)], delay)
+                    return response
+                except Exception as e:
+                    last_error = e
+                    # the hedge was sent and failed too; do not try the backup again
+                    if remaining and remaining[0].name in errors:
+                        remaining.pop(0)
+
+            if deadline is not None and deadline.expired and len(errors) < len(candidates):
+                raise DeadlineExceededError(
+                    f"Deadline of {deadline.timeout}s exceeded after trying {len(errors)} of {len(candidates)} providers",
+                    timeout=deadline.timeout,
+                    details={"errors": errors},
+                ) from last_error
+
+        if last_error is not None and len(candidates) == 1:
+            raise last_error
+        raise ProviderError(
+            "All candidate providers failed",
+            "failover",
+            error_code="ALL_PROVIDERS_FAILED",
+            details={"errors": errors, "candidates": [p.name for p in candidates]},
+        ) from last_error
+
+    async def _attempt(self, provider: DataProvider, query: DataQuery, errors: dict[str, str]) -> DataResponse:
+        """One provider attempt through its bulkhead and circuit breaker; failures are recorded in ``errors``."""
+        breaker = await self.breakers.get_or_create(f"provider:{provider.name}", self._breaker_config(provider.name))
+        try:
+            # bulkhead rejections (RateLimitError) do not count against the breaker
+            async with provider.bulkhead:
+                response: DataResponse = await breaker.call(self._timed_fetch, provider, query)
+                return response
+        except Exception as e:
+            errors[provider.name] = str(e) or type(e).__name__
+            logger.warning("Provider attempt failed", extra={"provider": provider.name, "error": errors[provider.name]})
+            raise
+
+    def _breaker_config(self, provider_name: str) -> CircuitBreakerConfig:
+        """Provider breakers trip on failure and slow-call rates as well as consecutive failures."""
+        config = self.provider_config
+        return CircuitBreakerConfig(
+            name=f"provider:{provider_name}",
+            minimum_calls=config.breaker_minimum_calls,
+            failure_rate_threshold=config.breaker_failure_rate,
+            slow_call_duration=config.breaker_slow_call_duration,
+            slow_call_rate_threshold=config.breaker_slow_call_rate,
+        )
+
+    async def _timed_fetch(self, provider: DataProvider, query: DataQuery) -> DataResponse:
+        """Fetch from one provider within the current deadline and record the outcome on the router."""
+        started = time.perf_counter()
+        try:
+            response: DataResponse = await with_deadline(provider.get_data(query))
+        except Exception:
+            self.router.update_provider_score(provider.name, False, (time.perf_counter() - started) * 1000)
+            raise
+        self.router.update_provider_score(provider.name, True, (time.perf_counter() - started) * 1000)
+        return response
+
+    async def stream(self, query: DataQuery) -> AsyncIterator[DataChunk]:
+        """Stream a query chunk by chunk (per symbol / date window).
+
+        Each chunk is served from cache when possible, otherwise fetched and
+        written to cache and storage before it is yielded, so memory stays
+        bounded by a single chunk.
+        """
+        provider = await self.router.route_query(query)
+        for part in provider.split_query(query):
+            cached_data = await self.cache.get_data(part)
+            if cached_data is not None:
+                yield DataChunk(query=part, data=[DataPoint(**item) if isinstance(item, dict) else item for item in cached_data])
+                continue
+
+            async for chunk in provider.stream_chunks(part):
+                if chunk.data:
+                    await self.cache.set_data(chunk.query, chunk.data)
+                    await self.repository.save_batch([self.repository.from_data_point(dp, provider.name, part.timeframe.value) for dp in chunk.data])
+                logger.debug("Chunk fetched", extra={"symbols": chunk.query.symbols, "records": len(chunk.data), "source": provider.name})
+                yield chunk
+
     # ------------------------------------------------------------------ #
     # Convenience methods
     # ------------------------------------------------------------------ #
@@ -0,0 +1,309 @@
+"""Materialized qfq/hfq adjustment factors backed by the ``adjustments`` table."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+import pandas as pd  # type: ignore[import-untyped]
+
+try:  # pragma: no cover - optional at runtime for typing.
+    from duckdb import DuckDBPyConnection
+except Exception:  # pragma: no cover
+    DuckDBPyConnection = "DuckDBPyConnection"  # type: ignore[misc,assignment]
+
+from vprism.core.data.schema import ADJUSTMENTS_TABLE
+from vprism.core.models.corporate_actions import (
+    CorporateActionFactor,
+    accumulate_hfq_factors,
+    merge_same_day_dividends,
+    merge_same_day_splits,
+)
+from vprism.core.models.market import MarketType  # noqa: TC001
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from vprism.core.models.base import DataPoint
+    from vprism.core.models.corporate_actions import DividendEvent, SplitEvent
+
+# Bump when the factor algorithm changes; rows of other versions are left alone.
+FACTOR_VERSION = "1"
+
+_STAGE_VIEW = "vprism_adjustments_stage"
+
+
+@dataclass(slots=True, frozen=True)
+class FactorBuild:
+    """Outcome of one :meth:`AdjustmentFactorStore.build` call."""
+
+    symbol: str
+    market: MarketType
+    version: str
+    source_events_hash: str
+    rebuilt_from: date | None
+    rows_written: int
+    gap_dates: tuple[date, ...]
+
+    @property
+    def skipped(self) -> bool:
+        """True when the stored factors were already current."""
+
+        return self.rebuilt_from is None
+
+
+def _previous_closes(points: Sequence[DataPoint]) -> dict[date, Decimal | None]:
+    """Last non-missing close strictly before each bar date, as the dividend adjustment sees it."""
+
+    closes: dict[date, Decimal | None] = {}
+    previous: Decimal | None = None
+    for point in points:
+        closes.setdefault(point.timestamp.date(), previous)
+        if point.close_price is not None:
+            previous = point.close_price
+    return closes
+
+
+def _event_tokens(
+    dividends: Sequence[DividendEvent],
+    splits: Sequence[SplitEvent],
+    previous_closes: Mapping[date, Decimal | None] | None = None,
+) -> list[tuple[date, str, str]]:
+    """One ``(date, event, base)`` token per event; a dividend's base is the previous close its adjustment divides by."""
+
+    closes = previous_closes or {}
+    tokens = []
+    for event in dividends:
+        close = closes.get(event.ex_date)
+        base = "" if close is None else f"{close.normalize():f}"
+        tokens.append((event.ex_date, f"D|{event.ex_date}|{event.cash_amount.normalize():f}|{event.currency or ''}", base))
+    tokens += [(event.ex_date, f"S|{event.ex_date}|{event.numerator}/{event.denominator}", "") for event in splits]
+    return sorted(tokens)
+
+
+def _prefix_hashes(tokens: Sequence[tuple[date, str, str]], *, with_bases: bool = True) -> list[str]:
+    """Chained digests; entry ``k`` covers the first ``k`` events as ``<events sha256>:<bases sha256>``.
+
+    The events half depends on the events alone, so staleness can be checked
+    without the bars; ``with_bases=False`` returns just that half.
+    """
+
+    events = hashlib.sha256()
+    bases = hashlib.sha256()
+    hashes = [f"{events.hexdigest()}:{bases.hexdigest()}"]
+    for _, event, base in tokens:
+        events.update(event.encode() + b"\n")
+        bases.update(base.encode() + b"\n")
+        hashes.append(f"{events.hexdigest()}:{bases.hexdigest()}")
+    return hashes if with_bases else [value.partition(":")[0] for value in hashes]
+
+
+class AdjustmentFactorStore:
+    """Persist qfq/hfq factors per symbol and rebuild them incrementally.
+
+    Every stored row carries the hash of the events dated on or before it (each
+    dividend together with the close it is measured against), so a build can
+    find the first bar whose inputs changed, and :meth:`is_current` can tell
+    from the stored rows alone whether the events moved on. Rows before that bar are
+    kept, hfq accumulation resumes from the last kept row, and qfq is
+    renormalized for the whole symbol with one set-based update. A build whose
+    events and bars match the stored rows writes nothing.
+
+    Statements run under ``lock``; pass the lock of any other component that
+    shares the connection.
+    """
+
+    def __init__(self, conn: DuckDBPyConnection, *, version: str = FACTOR_VERSION, lock: threading.Lock | None = None) -> None:
+        self.conn = conn
+        self.version = version
+        # The DuckDB connection is not thread-safe; transactions and the named staging view must not interleave.
+        self.lock = lock or threading.Lock()
+        ADJUSTMENTS_TABLE.ensure(conn)
+
+    def build(
+        self,
+        symbol: str,
+        market: MarketType,
+        prices: Sequence[DataPoint],
+        dividends: Sequence[DividendEvent],
+        splits: Sequence[SplitEvent],
+    ) -> FactorBuild:
+        """Bring the stored factors of ``symbol`` in line with ``prices`` and events.
+
+        ``prices`` must be the symbol's full bar history. ``gap_dates`` covers the
+        rebuilt range plus events that fall on no bar.
+        """
+
+        points = sorted(prices, key=lambda point: point.timestamp)
+        merged_dividends = merge_same_day_dividends(dividends)
+        merged_splits = merge_same_day_splits(splits)
+        tokens = _event_tokens(merged_dividends, merged_splits, _previous_closes(points))
+        hashes = _prefix_hashes(tokens)
+        event_dates = [token[0] for token in tokens]
+        bar_dates = [point.timestamp.date() for point in points]
+        bar_hashes = [hashes[bisect_right(event_dates, bar_date)] for bar_date in bar_dates]
+
+        with self.lock:
+            stored = self.conn.execute(
+                "SELECT date, adj_factor_hfq, source_events_hash FROM adjustments WHERE market = ? AND supplier_symbol = ? AND version = ? ORDER BY date",
+                [market.value, symbol, self.version],
+            ).fetchall()
+            start = 0
+            for row, bar_date, bar_hash in zip(stored, bar_dates, bar_hashes, strict=False):
+                if row[0] != bar_date or row[2] != bar_hash:
+                    break
+                start += 1
+
+            missing = set(event_dates).difference(bar_dates)
+            if start == len(points) and len(stored) == len(points):
+                return FactorBuild(symbol, market, self.version, hashes[-1], None, 0, tuple(sorted(missing)))
+
+            hfq_seed = Decimal("1")
+            previous_close: Decimal | None = None
+            if start:
+                hfq_seed = Decimal(repr(stored[start - 1][1]))
+                previous_close = next((p.close_price for p in reversed(points[:start]) if p.close_price is not None), None)
+            dates, hfq_series, gaps = accumulate_hfq_factors(
+                points[start:],
+                merged_dividends,
+                merged_splits,
+                hfq_factor=hfq_seed,
+                previous_close=previous_close,
+            )
+            rebuilt_from = dates[0] if dates else stored[start][0]
+            self._write(symbol, market, rebuilt_from, dates, hfq_series, bar_hashes[start:])
+            return FactorBuild(symbol, market, self.version, hashes[-1], rebuilt_from, len(dates), tuple(sorted(gaps | missing)))
+
+    def is_current(
+        self,
+        symbol: str,
+        market: MarketType,
+        dividends: Sequence[DividendEvent],
+        splits: Sequence[SplitEvent],
+        through: date,
+    ) -> bool:
+        """True when stored factors reach ``through`` and were built from these events.
+
+        Compares the events half of the newest row's ``source_events_hash``, so a
+        fresh process does not need to rebuild factors that are already current.
+        """
+
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT date, source_events_hash FROM adjustments WHERE market = ? AND supplier_symbol = ? AND version = ? ORDER BY date DESC LIMIT 1",
+                [market.value, symbol, self.version],
+            ).fetchone()
+        if row is None or row[0] < through:
+            return False
+        tokens = [token for token in _event_tokens(merge_same_day_dividends(dividends), merge_same_day_splits(splits)) if token[0] <= row[0]]
+        return bool(row[1].partition(":")[0] == _prefix_hashes(tokens, with_bases=False)[-1])
+
+    def _write(
+        self,
+        symbol: str,
+        market: MarketType,
+        rebuilt_from: date,
+        dates: Sequence[date],
+        hfq_series: Sequence[Decimal],
+        hashes: Sequence[str],
+    ) -> None:
+        """Replace the rows from ``rebuilt_from`` on; the caller holds ``lock``."""
+
+        stage = pd.DataFrame(
+            {
+                "date": pd.Series(dates, dtype="object"),
+                "hfq": [float(value) for value in hfq_series],
+                "source_events_hash": pd.Series(hashes, dtype="object"),
+            }
+        )
+        key = [market.value, symbol, self.version]
+        self.conn.execute("BEGIN TRANSACTION")
+        try:
+            self.conn.execute("DELETE FROM adjustments WHERE market = ? AND supplier_symbol = ? AND version = ? AND date >= ?", [*key, rebuilt_from])
+            if not stage.empty:
+                self.conn.register(_STAGE_VIEW, stage)
+                try:
+                    self.conn.execute(
+                        f"""
+                        INSERT INTO adjustments
+                            (market, supplier_symbol, date, adj_factor_qfq, adj_factor_hfq, version, build_time, source_events_hash)
+                        SELECT ?, ?, CAST(date AS DATE), hfq, hfq, ?, ?, source_events_hash FROM {_STAGE_VIEW}
+                        """,
+                        [*key, datetime.now(UTC).replace(tzinfo=None)],
+                    )
+                finally:
+                    self.conn.unregister(_STAGE_VIEW)
+            # qfq is hfq normalized by the latest hfq, which moves whenever the tail changes.
+            self.conn.execute(
+                """
+                UPDATE adjustments SET adj_factor_qfq = adj_factor_hfq / latest.hfq
+                FROM (
+                    SELECT CASE WHEN arg_max(adj_factor_hfq, date) = 0 THEN 1 ELSE arg_max(adj_factor_hfq, date) END AS hfq
+                    FROM adjustments WHERE market = ? AND supplier_symbol = ? AND version = ?
+                ) latest
+                WHERE market = ? AND supplier_symbol = ? AND version = ?
+                """,
+                [*key, *key],
+            )
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    def load(
+        self,
+        market: MarketType,
+        symbols: Sequence[str] | None = None,
+        *,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> pd.DataFrame:
+        """Stored factors in the column layout :func:`adjust_frame` consumes."""
+
+        query = """
+            SELECT supplier_symbol AS symbol, date, adj_factor_qfq AS forward_factor, adj_factor_hfq AS backward_factor
+            FROM adjustments WHERE market = ? AND version = ?
+        """
+        params: list[object] = [market.value, self.version]
+        if symbols is not None:
+            query += " AND list_contains(?, supplier_symbol)"
+            params.append(list(symbols))
+        if start is not None:
+            query += " AND date >= ?"
+            params.append(start)
+        if end is not None:
+            query += " AND date <= ?"
+            params.append(end)
+        with self.lock:
+            return self.conn.execute(query + " ORDER BY supplier_symbol, date", params).df()
+
+    def last_date(self, symbol: str, market: MarketType) -> date | None:
+        """Date of the newest stored factor of ``symbol``, ``None`` if it was never built."""
+
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT max(date) FROM adjustments WHERE market = ? AND supplier_symbol = ? AND version = ?",
+                [market.value, symbol, self.version],
+            ).fetchone()
+        last: date | None = row[0] if row else None
+        return last
+
+    def factors(self, symbol: str, market: MarketType, *, start: date | None = None, end: date | None = None) -> list[CorporateActionFactor]:
+        """Stored factors of one symbol, ready for :func:`adjust_prices`."""
+
+        frame = self.load(market, [symbol], start=start, end=end)
+        return [
+            CorporateActionFactor(
+                symbol=symbol,
+                market=market,
+                date=pd.Timestamp(row_date).date(),
+                forward_factor=Decimal(repr(forward)),
+                backward_factor=Decimal(repr(backward)),
+            )
+            for row_date, forward, backward in zip(frame["date"], frame["forward_factor"], frame["backward_factor"], strict=True)
+        ]
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import re
-from collections import OrderedDict, defaultdict
+import threading
+from collections import Counter, OrderedDict
 from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
+import pandas as pd  # type: ignore[import-untyped]
+
 from vprism.core.data.schema import SYMBOL_MAP_TABLE
 from vprism.core.exceptions.base import UnresolvedSymbolError
 from vprism.core.models.market import AssetType, MarketType
@@ -24,6 +28,20 @@ if TYPE_CHECKING:
     from duckdb import DuckDBPyConnection
 
 CacheKey = tuple[str, MarketType, AssetType]
+PendingMapping = tuple[CanonicalSymbol, str | None]
+
+_SYMBOL_MAP_VIEW = "vprism_symbol_map_pending"
+# Caches smaller than this keep one stripe, i.e. exact LRU order.
+_MIN_ROWS_PER_STRIPE = 256
+_MAX_STRIPES = 16
+# Per-call status names and the get_metrics() counters they feed.
+_STATUS_METRICS: Mapping[str, str] = {
+    "total": "total_requests",
+    "cache_hit": "cache_hits",
+    "cache_miss": "cache_misses",
+    "unresolved": "unresolved_count",
+    "store_hit": "store_hits",
+}
 
 
 _CN_SUFFIX_EXCHANGE_MAP: Mapping[str, str] = {"SS": "SH", "SH": "SH", "SZ": "SZ"}
@@ -183,8 +201,202 @@ def default_rules() -> tuple[SymbolRule, ...]:
     return tuple(sorted(rules, key=lambda rule: (rule.priority, rule.id)))
 
 
+# Flags that can be scoped to one alternative with (?flags:...); re.UNICODE is implied for str patterns.
+_FUSIBLE_FLAGS = re.IGNORECASE | re.MULTILINE | re.DOTALL
+_FLAG_LETTERS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"))
+# Group references depend on group names and numbers, which fusion rewrites.
+_UNFUSIBLE_SOURCE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+_NAMED_GROUP = re.compile(r"(?<!\\)\(\?P<\w+>")
+
+
+@dataclass(frozen=True, slots=True)
+class _RuleBucket:
+    """Rules applicable to one (market, asset_type) pair, in priority order.
+
+    ``fused`` alternates every rule pattern inside a ``_r<index>`` group, so one
+    ``match`` call finds the highest-priority matching rule. Buckets whose
+    patterns cannot be fused keep ``fused=None`` and are matched one by one.
+    """
+
+    rules: tuple[SymbolRule, ...]
+    fused: re.Pattern[str] | None
+
+    def match(self, raw_symbol: str) -> tuple[SymbolRule, re.Match[str]] | None:
+        if self.fused is not None:
+            hit = self.fused.match(raw_symbol)
+            if hit is None or hit.lastgroup is None:
+                return None
+            rule = self.rules[int(hit.lastgroup[2:])]
+            # Re-run the winning pattern so transforms see its own group names.
+            match = rule.pattern.match(raw_symbol)
+            if match is not None:
+                return rule, match
+        for rule in self.rules:
+            match = rule.pattern.match(raw_symbol)
+            if match is not None:
+                return rule, match
+        return None
+
+
+def _fuse_patterns(rules: Sequence[SymbolRule]) -> re.Pattern[str] | None:
+    parts: list[str] = []
+    for index, rule in enumerate(rules):
+        source = rule.pattern.pattern
+        flags = rule.pattern.flags & ~re.UNICODE
+        if not isinstance(source, str) or flags & ~_FUSIBLE_FLAGS or _UNFUSIBLE_SOURCE.search(source):
+            return None
+        body = _NAMED_GROUP.sub("(?:", source)
+        scoped = "".join(letter for flag, letter in _FLAG_LETTERS if flags & flag)
+        if scoped:
+            body = f"(?{scoped}:{body})"
+        parts.append(f"(?P<_r{index}>{body})")
+    try:
+        return re.compile("|".join(parts))
+    except re.error:
+        return None
+
+
+@lru_cache(maxsize=16)
+def _bucket_rules(rules: tuple[SymbolRule, ...]) -> dict[tuple[MarketType, AssetType], _RuleBucket]:
+    """Pre-bucket rules by every (market, asset_type); identical buckets share one compiled pattern."""
+
+    shared: dict[tuple[SymbolRule, ...], _RuleBucket] = {}
+    buckets: dict[tuple[MarketType, AssetType], _RuleBucket] = {}
+    for market in MarketType:
+        for asset_type in AssetType:
+            applicable = tuple(rule for rule in rules if rule.applies_to(market, asset_type))
+            if applicable not in shared:
+                shared[applicable] = _RuleBucket(applicable, _fuse_patterns(applicable) if applicable else None)
+            buckets[(market, asset_type)] = shared[applicable]
+    return buckets
+
+
+class _StripedLRU:
+    """LRU cache split into independently locked stripes.
+
+    Keys hash to a stripe and each stripe evicts its own least recently used
+    entry, so threads touching different stripes never contend on reads.
+    Recency is exact within a stripe and approximate across stripes. A shared
+    counter holds the total at ``capacity`` however unevenly keys hash (a stripe
+    may take up to twice its share); only an insert into an empty stripe of a
+    full cache goes over, by at most one entry per stripe.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        count = max(1, min(_MAX_STRIPES, capacity // _MIN_ROWS_PER_STRIPE))
+        count = 1 << (count.bit_length() - 1)
+        self._mask = count - 1
+        self._capacity = capacity
+        self._stripe_capacity = 2 * -(-capacity // count)
+        self._size = 0
+        self._size_lock = threading.Lock()
+        self._stripes = tuple((threading.Lock(), OrderedDict[CacheKey, CanonicalSymbol]()) for _ in range(count))
+
+    def get(self, key: CacheKey) -> CanonicalSymbol | None:
+        lock, entries = self._stripes[hash(key) & self._mask]
+        with lock:
+            value = entries.get(key)
+            if value is not None:
+                entries.move_to_end(key)
+            return value
+
+    def set(self, key: CacheKey, value: CanonicalSymbol) -> None:
+        if self._capacity == 0:
+            return
+        lock, entries = self._stripes[hash(key) & self._mask]
+        with lock:
+            added = key not in entries
+            entries[key] = value
+            entries.move_to_end(key)
+            if not added:
+                return
+            with self._size_lock:
+                if len(entries) > 1 and (self._size >= self._capacity or len(entries) > self._stripe_capacity):
+                    entries.popitem(last=False)
+                else:
+                    self._size += 1
+
+    def clear(self) -> None:
+        for lock, entries in self._stripes:
+            with lock, self._size_lock:
+                self._size -= len(entries)
+                entries.clear()
+
+    def __contains__(self, key: object) -> bool:
+        lock, entries = self._stripes[hash(key) & self._mask]
+        with lock:
+            return key in entries
+
+    def __getitem__(self, key: CacheKey) -> CanonicalSymbol:
+        lock, entries = self._stripes[hash(key) & self._mask]
+        with lock:
+            return entries[key]
+
+    def __len__(self) -> int:
+        return sum(len(entries) for _, entries in self._stripes)
+
+
+class _MetricShard:
+    __slots__ = ("counts", "lock", "rule_usage")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.counts: Counter[str] = Counter()
+        self.rule_usage: Counter[str] = Counter()
+
+
+class _ShardedMetrics:
+    """Per-thread metric counters, merged on read.
+
+    Each thread only writes its own shard; the shard lock is uncontended except
+    while :meth:`totals` copies it.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._shards: list[_MetricShard] = []
+        self._lock = threading.Lock()
+
+    def shard(self) -> _MetricShard:
+        shard: _MetricShard | None = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _MetricShard()
+            with self._lock:
+                self._shards.append(shard)
+        return shard
+
+    def add(self, counts: Mapping[str, int], rule_usage: Mapping[str, int] | None = None) -> None:
+        shard = self.shard()
+        with shard.lock:
+            shard.counts.update(counts)
+            if rule_usage:
+                shard.rule_usage.update(rule_usage)
+
+    def totals(self) -> tuple[Counter[str], Counter[str]]:
+        counts: Counter[str] = Counter()
+        rule_usage: Counter[str] = Counter()
+        with self._lock:
+            shards = list(self._shards)
+        for shard in shards:
+            with shard.lock:
+                counts.update(shard.counts)
+                rule_usage.update(shard.rule_usage)
+        return counts, rule_usage
+
+    def reset_rule_usage(self) -> None:
+        with self._lock:
+            shards = list(self._shards)
+        for shard in shards:
+            with shard.lock:
+                shard.rule_usage.clear()
+
+
 class SymbolService:
-    """Provides canonical symbol normalization using priority-ordered rules."""
+    """Provides canonical symbol normalization using priority-ordered rules.
+
+    Safe to share between threads: the cache is lock-striped and metrics are
+    kept in per-thread shards.
+    """
 
     def __init__(
         self,
@@ -192,7 +404,18 @@ class SymbolService:
         cache_size: int = 10_000,
         persistence_conn: DuckDBPyConnection | None = None,
         metrics_collector: Any | None = None,
+        warm_start: bool = False,
+        lookup_through: bool = False,
     ) -> None:
+        """Create the service.
+
+        With a ``persistence_conn``, ``warm_start`` preloads the most recently
+        persisted mappings (up to ``cache_size``) into the cache, and
+        ``lookup_through`` consults ``symbol_map`` for cache misses before
+        evaluating rules. Stored mappings whose rule is no longer registered are
+        ignored by both.
+        """
+
         self._cache_size = max(cache_size, 0)
         resolved_rules = rules if rules is not None else default_rules()
         # default_rules() returns pre-sorted tuple; only re-sort when custom rules provided
@@ -200,17 +423,17 @@ class SymbolService:
             self._rules: tuple[SymbolRule, ...] = tuple(sorted(resolved_rules, key=lambda rule: (rule.priority, rule.id)))
         else:
             self._rules = tuple(resolved_rules)
-        self._cache: OrderedDict[CacheKey, CanonicalSymbol] = OrderedDict()
-        self._metrics: dict[str, object] = {
-            "total_requests": 0,
-            "cache_hits": 0,
-            "cache_misses": 0,
-            "unresolved_count": 0,
-            "rule_usage": defaultdict(int),
-        }
+        self._index_rules()
+        self._cache = _StripedLRU(self._cache_size)
+        self._metrics = _ShardedMetrics()
         self._persistence_conn = persistence_conn
+        # One DuckDB connection is shared by every thread; its statements (and the named staging view) are serialized.
+        self._persistence_lock = threading.Lock()
+        self._lookup_through = lookup_through and persistence_conn is not None
         if self._persistence_conn is not None:
             SYMBOL_MAP_TABLE.ensure(self._persistence_conn)
+            if warm_start:
+                self._warm_cache()
         self._metrics_collector = metrics_collector
 
     @property
@@ -228,25 +451,15 @@ class SymbolService:
     ) -> CanonicalSymbol:
         """Normalize a raw symbol into its canonical representation."""
 
+        statuses: Counter[str] = Counter()
+        pending: list[PendingMapping] = []
         normalized_raw = raw_symbol.strip()
-        cache_key: CacheKey = (normalized_raw, market, asset_type)
-        self._metrics["total_requests"] = int(self._metrics["total_requests"]) + 1
-        self._record_normalization_status("total")
-
-        cached = self._cache_get(cache_key)
-        if cached is not None:
-            self._metrics["cache_hits"] = int(self._metrics["cache_hits"]) + 1
-            self._record_normalization_status("cache_hit")
-            self._record_normalization_status("resolved")
-            return cached
-
-        self._metrics["cache_misses"] = int(self._metrics["cache_misses"]) + 1
-        self._record_normalization_status("cache_miss")
-        canonical = self._evaluate_rules(normalized_raw, market, asset_type)
-        self._record_normalization_status("resolved")
-        self._persist_normalization(canonical, provider_hint)
-        self._cache_set(cache_key, canonical)
-        return canonical
+        stored = {} if (normalized_raw, market, asset_type) in self._cache else self._lookup_stored([normalized_raw], market, asset_type)
+        try:
+            return self._normalize(normalized_raw, market, asset_type, provider_hint, statuses, pending, stored)
+        finally:
+            self._persist_normalizations(pending)
+            self._flush_statuses(statuses)
 
     def normalize_batch(
         self,
@@ -255,12 +468,48 @@ class SymbolService:
         asset_type: AssetType,
         provider_hint: str | Mapping[str, str] | None = None,
     ) -> BatchNormalizationResult:
-        """Normalize a sequence of raw symbols with partial success reporting."""
+        """Normalize a sequence of raw symbols with partial success reporting.
+
+        New mappings are persisted with one bulk insert and status metrics are
+        flushed once, after the whole batch.
+        """
 
         items: list[BatchNormalizationItem] = []
         successes: list[CanonicalSymbol] = []
         failures: list[UnresolvedSymbolError] = []
+        statuses: Counter[str] = Counter()
+        pending: list[PendingMapping] = []
+        stored: Mapping[str, CanonicalSymbol] = {}
+        if self._lookup_through:
+            misses = {raw for raw in (symbol.strip() for symbol in raw_symbols) if (raw, market, asset_type) not in self._cache}
+            stored = self._lookup_stored(sorted(misses), market, asset_type)
+        try:
+            self._normalize_each(raw_symbols, market, asset_type, provider_hint, items, successes, failures, statuses, pending, stored)
+        finally:
+            self._persist_normalizations(pending)
+            self._flush_statuses(statuses)
+
+        return BatchNormalizationResult(
+            market=market,
+            asset_type=asset_type,
+            items=tuple(items),
+            successes=tuple(successes),
+            failures=tuple(failures),
+        )
 
+    def _normalize_each(
+        self,
+        raw_symbols: Sequence[str],
+        market: MarketType,
+        asset_type: AssetType,
+        provider_hint: str | Mapping[str, str] | None,
+        items: list[BatchNormalizationItem],
+        successes: list[CanonicalSymbol],
+        failures: list[UnresolvedSymbolError],
+        statuses: Counter[str],
+        pending: list[PendingMapping],
+        stored: Mapping[str, CanonicalSymbol],
+    ) -> None:
         for raw_symbol in raw_symbols:
             normalized_input = raw_symbol.strip()
             hint_value: str | None
@@ -272,7 +521,7 @@ class SymbolService:
                 hint_value = provider_hint
 
             try:
-                canonical = self.normalize(normalized_input, market, asset_type, provider_hint=hint_value)
+                canonical = self._normalize(normalized_input, market, asset_type, hint_value, statuses, pending, stored)
             except UnresolvedSymbolError as error:
                 items.append(
                     BatchNormalizationItem(
@@ -292,30 +541,21 @@ class SymbolService:
                 )
                 successes.append(canonical)
 
-        return BatchNormalizationResult(
-            market=market,
-            asset_type=asset_type,
-            items=tuple(items),
-            successes=tuple(successes),
-            failures=tuple(failures),
-        )
-
     def get_metrics(self) -> Mapping[str, object]:
         """Return a snapshot of cache and normalization metrics."""
 
-        total_requests = int(self._metrics["total_requests"])
-        cache_hits = int(self._metrics["cache_hits"])
-        cache_misses = int(self._metrics["cache_misses"])
-        unresolved_count = int(self._metrics["unresolved_count"])
-        hit_rate = cache_hits / total_requests if total_requests else 0.0
-        rule_usage = dict(self._metrics["rule_usage"])
+        counts, rule_usage = self._metrics.totals()
+        total_requests = counts["total_requests"]
+        hit_rate = counts["cache_hits"] / total_requests if total_requests else 0.0
         return {
             "total_requests": total_requests,
-            "cache_hits": cache_hits,
-            "cache_misses": cache_misses,
-            "unresolved_count": unresolved_count,
+            "cache_hits": counts["cache_hits"],
+            "cache_misses": counts["cache_misses"],
+            "unresolved_count": counts["unresolved_count"],
+            "store_hits": counts["store_hits"],
+            "preloaded": counts["preloaded"],
             "hit_rate": hit_rate,
-            "rule_usage": rule_usage,
+            "rule_usage": dict(rule_usage),
         }
 
     def reload(self, new_rules: Sequence[SymbolRule]) -> None:
@@ -327,8 +567,119 @@ class SymbolService:
             raise TypeError("All rules supplied to reload() must be SymbolRule instances.")
 
         self._rules = tuple(sorted(new_rules, key=lambda rule: (rule.priority, rule.id)))
+        self._index_rules()
         self._cache.clear()
-        self._metrics["rule_usage"] = defaultdict(int)
+        self._metrics.reset_rule_usage()
+
+    def _normalize(
+        self,
+        raw_symbol: str,
+        market: MarketType,
+        asset_type: AssetType,
+        provider_hint: str | None,
+        statuses: Counter[str],
+        pending: list[PendingMapping],
+        stored: Mapping[str, CanonicalSymbol],
+    ) -> CanonicalSymbol:
+        """Resolve one symbol, deferring persistence to ``pending`` and metrics to ``statuses``.
+
+        ``stored`` holds mappings already fetched from ``symbol_map`` for this call.
+        """
+
+        normalized_raw = raw_symbol.strip()
+        cache_key: CacheKey = (normalized_raw, market, asset_type)
+        statuses["total"] += 1
+
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            statuses["cache_hit"] += 1
+            statuses["resolved"] += 1
+            return cached
+
+        statuses["cache_miss"] += 1
+        persisted = stored.get(normalized_raw)
+        if persisted is not None:
+            statuses["store_hit"] += 1
+            statuses["resolved"] += 1
+            self._cache_set(cache_key, persisted)
+            return persisted
+        try:
+            canonical = self._evaluate_rules(normalized_raw, market, asset_type)
+        except UnresolvedSymbolError:
+            statuses["unresolved"] += 1
+            raise
+        statuses["resolved"] += 1
+        if self._persistence_conn is not None:
+            pending.append((canonical, provider_hint))
+        self._cache_set(cache_key, canonical)
+        return canonical
+
+    def _warm_cache(self) -> None:
+        """Preload the most recently persisted mappings with one columnar fetch."""
+
+        if self._persistence_conn is None or self._cache_size == 0:
+            return
+        columns = self._persistence_conn.execute(
+            """
+            SELECT raw_symbol, market, asset_type, c_symbol, rule_id
+            FROM symbol_map
+            ORDER BY created_at DESC
+            LIMIT ?
+            """,
+            [self._cache_size],
+        ).fetchnumpy()
+        rows = zip(*(columns[name].tolist() for name in ("raw_symbol", "market", "asset_type", "c_symbol", "rule_id")), strict=True)
+        keys: set[CacheKey] = set()
+        # Oldest first, so the newest mappings end up most recently used.
+        for raw_symbol, market, asset_type, c_symbol, rule_id in reversed(list(rows)):
+            canonical = self._stored_symbol(raw_symbol, market, asset_type, c_symbol, rule_id)
+            if canonical is not None:
+                key = (raw_symbol, canonical.market, canonical.asset_type)
+                self._cache_set(key, canonical)
+                keys.add(key)
+        # Count what is resident, not what was offered.
+        self._metrics.add({"preloaded": sum(key in self._cache for key in keys)})
+
+    def _lookup_stored(self, raw_symbols: Sequence[str], market: MarketType, asset_type: AssetType) -> dict[str, CanonicalSymbol]:
+        """Fetch persisted mappings for ``raw_symbols`` in one query when lookup-through is enabled."""
+
+        if not self._lookup_through or self._persistence_conn is None or not raw_symbols:
+            return {}
+        with self._persistence_lock:
+            rows = self._persistence_conn.execute(
+                """
+                SELECT raw_symbol, c_symbol, rule_id
+                FROM symbol_map
+                WHERE market = ? AND asset_type = ? AND list_contains(?, raw_symbol)
+                ORDER BY created_at
+                """,
+                [market.value, asset_type.value, list(raw_symbols)],
+            ).fetchall()
+        stored: dict[str, CanonicalSymbol] = {}
+        for raw_symbol, c_symbol, rule_id in rows:
+            canonical = self._stored_symbol(raw_symbol, market.value, asset_type.value, c_symbol, rule_id)
+            if canonical is not None:
+                stored[raw_symbol] = canonical
+        return stored
+
+    def _stored_symbol(self, raw_symbol: str, market: str, asset_type: str, c_symbol: str, rule_id: str) -> CanonicalSymbol | None:
+        if rule_id not in self._rule_id_set:
+            return None
+        try:
+            return CanonicalSymbol(
+                raw_symbol=raw_symbol,
+                canonical=c_symbol,
+                market=MarketType(market),
+                asset_type=AssetType(asset_type),
+                rule_id=rule_id,
+            )
+        except ValueError:
+            return None
+
+    def _index_rules(self) -> None:
+        self._buckets = _bucket_rules(self._rules)
+        self._rule_ids = tuple(rule.id for rule in self._rules)
+        self._rule_id_set = frozenset(self._rule_ids)
 
     def _evaluate_rules(
         self,
@@ -336,12 +687,9 @@ class SymbolService:
         market: MarketType,
         asset_type: AssetType,
     ) -> CanonicalSymbol:
-        for rule in self._rules:
-            if not rule.applies_to(market, asset_type):
-                continue
-            match = rule.pattern.match(raw_symbol)
-            if not match:
-                continue
+        hit = self._buckets[(market, asset_type)].match(raw_symbol)
+        if hit is not None:
+            rule, match = hit
             core_value = rule.transform(raw_symbol, match)
             if rule.prefix:
                 core_value = f"{rule.prefix}{core_value}"
@@ -355,23 +703,36 @@ class SymbolService:
                 asset_type=asset_type,
                 rule_id=rule.id,
             )
-            self._metrics["rule_usage"][rule.id] += 1
+            self._metrics.add({}, {rule.id: 1})
             return canonical
 
-        self._metrics["unresolved_count"] = int(self._metrics["unresolved_count"]) + 1
-        self._record_normalization_status("unresolved")
         raise UnresolvedSymbolError(
             message=(f"Unable to normalize symbol '{raw_symbol}' for market '{market.value}' and asset '{asset_type.value}'."),
             raw_symbol=raw_symbol,
             market=market.value,
             asset_type=asset_type.value,
-            details={"rules_evaluated": [rule.id for rule in self._rules]},
+            details={"rules_evaluated": self._rule_ids},
         )
 
-    def _record_normalization_status(self, status: str) -> None:
+    def _flush_statuses(self, statuses: Counter[str]) -> None:
+        """Merge a call's statuses into the metric shard and report them to the collector.
+
+        Collectors exposing ``record_symbol_normalizations(counts)`` receive one
+        call; otherwise ``record_symbol_normalization(status)`` is called per event.
+        """
+
+        if not statuses:
+            return
+        self._metrics.add({_STATUS_METRICS[status]: count for status, count in statuses.items() if status in _STATUS_METRICS})
         if self._metrics_collector is None:
             return
-        self._metrics_collector.record_symbol_normalization(status)
+        record_many = getattr(self._metrics_collector, "record_symbol_normalizations", None)
+        if record_many is not None:
+            record_many(dict(statuses))
+            return
+        for status, count in statuses.items():
+            for _ in range(count):
+                self._metrics_collector.record_symbol_normalization(status)
 
     def _compose_canonical(self, market: MarketType, asset_type: AssetType, core_value: str) -> str:
         market_prefix = market.value.upper()
@@ -379,48 +740,51 @@ class SymbolService:
         return f"{market_prefix}:{asset_segment}:{core_value}"
 
     def _cache_get(self, key: CacheKey) -> CanonicalSymbol | None:
-        try:
-            cached = self._cache[key]
-        except KeyError:
-            return None
-        self._cache.move_to_end(key)
-        return cached
+        return self._cache.get(key)
 
     def _cache_set(self, key: CacheKey, value: CanonicalSymbol) -> None:
-        if self._cache_size == 0:
-            return
-        self._cache[key] = value
-        self._cache.move_to_end(key)
-        if len(self._cache) > self._cache_size:
-            self._cache.popitem(last=False)
+        self._cache.set(key, value)
+
+    def _persist_normalizations(self, pending: Sequence[PendingMapping]) -> None:
+        """Bulk insert new mappings; the first hint seen for a mapping wins, as with row-by-row inserts."""
 
-    def _persist_normalization(self, canonical: CanonicalSymbol, provider_hint: str | None) -> None:
-        if self._persistence_conn is None:
+        if self._persistence_conn is None or not pending:
             return
 
-        self._persistence_conn.execute(
-            """
-            INSERT OR IGNORE INTO symbol_map (
-                c_symbol,
-                raw_symbol,
-                market,
-                asset_type,
-                provider_hint,
-                rule_id,
-                created_at
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            [
-                canonical.canonical,
-                canonical.raw_symbol,
-                canonical.market.value,
-                canonical.asset_type.value,
-                provider_hint,
-                canonical.rule_id,
-                datetime.now(UTC),
-            ],
+        rows: dict[tuple[str, str], PendingMapping] = {}
+        for canonical, provider_hint in pending:
+            rows.setdefault((canonical.canonical, canonical.raw_symbol), (canonical, provider_hint))
+        frame = pd.DataFrame(
+            {
+                "c_symbol": [canonical.canonical for canonical, _ in rows.values()],
+                "raw_symbol": [canonical.raw_symbol for canonical, _ in rows.values()],
+                "market": [canonical.market.value for canonical, _ in rows.values()],
+                "asset_type": [canonical.asset_type.value for canonical, _ in rows.values()],
+                "provider_hint": pd.Series([hint for _, hint in rows.values()], dtype=object),
+                "rule_id": [canonical.rule_id for canonical, _ in rows.values()],
+            }
         )
+        with self._persistence_lock:
+            self._persistence_conn.register(_SYMBOL_MAP_VIEW, frame)
+            try:
+                self._persistence_conn.execute(
+                    f"""
+                    INSERT OR IGNORE INTO symbol_map (
+                        c_symbol,
+                        raw_symbol,
+                        market,
+                        asset_type,
+                        provider_hint,
+                        rule_id,
+                        created_at
+                    )
+                    SELECT c_symbol, raw_symbol, market, asset_type, provider_hint::VARCHAR, rule_id, ?
+                    FROM {_SYMBOL_MAP_VIEW}
+                    """,
+                    [datetime.now(UTC)],
+                )
+            finally:
+                self._persistence_conn.unregister(_SYMBOL_MAP_VIEW)
 
 
 __all__ = ["SymbolService", "default_rules"]
@@ -4,8 +4,11 @@ Provides stock data, market data, and batch query endpoints.
 """
 
 import asyncio
+import json
+from collections.abc import AsyncIterator
 
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from loguru import logger
 
 from vprism.core.client.client import VPrismClient
@@ -16,7 +19,7 @@ from vprism.web.models import (
     MarketDataRequest,
     StockDataRequest,
 )
-from vprism.web.utils import get_request_id
+from vprism.web.utils import cancel_on_disconnect, get_request_id
 
 router = APIRouter()
 
@@ -53,7 +56,7 @@ async def get_stock_data(
             query_builder = query_builder.end(end_date)
 
         # 执行查询
-        result = await client.execute(query_builder.build())
+        result = await cancel_on_disconnect(request, client.execute(query_builder.build()))
 
         return APIResponse(
             success=True,
@@ -62,10 +65,54 @@ async def get_stock_data(
             request_id=get_request_id(request),
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
 
 
+@router.get("/stock/{symbol}/stream")
+async def stream_stock_data(
+    request: Request,
+    symbol: str,
+    market: str = Query("us", description="市场类型 (us, cn, hk)"),
+    timeframe: str = Query("daily", description="时间周期 (1m, 5m, 1h, daily, weekly)"),
+    start_date: str | None = Query(None, description="开始日期 YYYY-MM-DD"),
+    end_date: str | None = Query(None, description="结束日期 YYYY-MM-DD"),
+) -> StreamingResponse:
+    """
+    流式获取单只股票的历史数据 (NDJSON, 每行一个数据点)
+
+    按日期窗口逐块拉取并输出，适合长区间或分钟级数据
+    """
+    client: VPrismClient = request.app.state.vprism_client
+
+    try:
+        query_builder = client.query().symbols([symbol]).market(market).timeframe(timeframe)
+        if start_date:
+            query_builder = query_builder.start(start_date)
+        if end_date:
+            query_builder = query_builder.end(end_date)
+        query = query_builder.build()
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    async def _ndjson() -> AsyncIterator[str]:
+        try:
+            async for chunk in client.stream(query):
+                if await request.is_disconnected():
+                    break
+                for point in chunk.data:
+                    yield point.model_dump_json() + "\n"
+        except Exception as e:
+            logger.error(f"Streaming {symbol} failed: {e}")
+            yield json.dumps({"success": False, "error": str(e)}, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(_ndjson(), media_type="application/x-ndjson")
+
+
 @router.post("/stock", response_model=APIResponse)
 async def get_stock_data_post(
     request_data: StockDataRequest,
@@ -86,7 +133,7 @@ async def get_stock_data_post(
         if request_data.end_date:
             query_builder = query_builder.end(request_data.end_date)
 
-        result = await client.execute(query_builder.build())
+        result = await cancel_on_disconnect(request, client.execute(query_builder.build()))
 
         return APIResponse(
             success=True,
@@ -95,6 +142,8 @@ async def get_stock_data_post(
             request_id=get_request_id(request),
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
 
@@ -125,7 +174,7 @@ async def get_market_data(
             results = []
             for symbol in request_data.symbols:
                 symbol_query = query_builder.symbols([symbol]).build()
-                result = await client.execute(symbol_query)
+                result = await cancel_on_disconnect(request, client.execute(symbol_query))
                 results.append(
                     {
                         "symbol": symbol,
@@ -141,7 +190,7 @@ async def get_market_data(
             )
         else:
             # 获取整个市场数据（简化实现）
-            result = await client.execute(query_builder.build())
+            result = await cancel_on_disconnect(request, client.execute(query_builder.build()))
             return APIResponse(
                 success=True,
                 data=result.model_dump() if hasattr(result, "model_dump") else result,
@@ -149,6 +198,8 @@ async def get_market_data(
                 request_id=get_request_id(request),
             )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
 
@@ -193,7 +244,7 @@ async def get_batch_data(
             )
         else:
             # 同步处理
-            results = await asyncio.gather(*[client.execute(q) for q in queries])
+            results = await cancel_on_disconnect(request, asyncio.gather(*[client.execute(q) for q in queries]))
 
             response_data = []
             for i, result in enumerate(results):
@@ -211,6 +262,8 @@ async def get_batch_data(
                 request_id=get_request_id(request),
             )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
 
@@ -239,6 +292,8 @@ async def list_symbols(
             request_id=get_request_id(request),
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
 
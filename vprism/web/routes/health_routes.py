@@ -10,6 +10,9 @@ from fastapi.encoders import jsonable_encoder
 from loguru import logger
 
 from vprism.core.health import get_health_checker
+from vprism.core.patterns.bulkhead import bulkhead_registry
+from vprism.core.patterns.hedging import HedgedExecutor
+from vprism.core.patterns.retry import retry_budget_registry
 from vprism.web.models import APIResponse, CacheStats, ProviderStatus
 from vprism.web.utils import get_request_id
 
@@ -194,12 +197,17 @@ async def get_metrics(request: Request) -> APIResponse:
     """
     try:
         # 简化实现，实际应该集成 Prometheus 等监控系统
+        hedger = getattr(getattr(request.app.state, "vprism_client", None), "hedger", None)
         metrics = {
             "uptime": time.time() - getattr(request.app.state, "start_time", time.time()),
             "requests_count": 1000,  # 应该从实际计数器获取
             "error_rate": 0.02,
             "average_response_time": 150.5,
             "data_sources": {"total": 2, "healthy": 2, "degraded": 0, "unavailable": 0},
+            "bulkheads": bulkhead_registry.get_all_stats(),
+            "retry_budgets": retry_budget_registry.get_all_stats(),
+            # 对冲未启用时为 None; hedge_rate 受 hedge_budget_ratio 约束
+            "hedging": hedger.get_stats() if isinstance(hedger, HedgedExecutor) else None,
         }
 
         return APIResponse(
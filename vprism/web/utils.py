@@ -1,8 +1,30 @@
 """Web相关的工具函数"""
 
-from fastapi import Request
+import asyncio
+from collections.abc import Awaitable
+
+from fastapi import HTTPException, Request
+
+# 检查客户端是否断开连接的间隔(秒)
+DISCONNECT_POLL_INTERVAL = 0.5
 
 
 def get_request_id(request: Request) -> str | None:
     """从请求头中获取 X-Request-ID"""
     return request.headers.get("X-Request-ID")
+
+
+async def cancel_on_disconnect[T](request: Request, awaitable: Awaitable[T], poll_interval: float = DISCONNECT_POLL_INTERVAL) -> T:
+    """执行 ``awaitable``, 客户端断开连接时取消它 (包括其中的提供商调用与重试等待)"""
+    task = asyncio.ensure_future(awaitable)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=poll_interval)
+            if done:
+                return task.result()
+            if await request.is_disconnected():
+                task.cancel()
+                raise HTTPException(status_code=499, detail="Client closed request")
+    finally:
+        if not task.done():
+            task.cancel()